@@ -8,11 +8,54 @@ implementations.
 
 import argparse
 import os
+from dataclasses import dataclass
+from typing import Any
 from . import getpapers, nexus, ablesci, wosonhj, facebook, scinet, proxy_config
 import asyncio
 
 SERVICE_LIST = ["nexus", "ablesci", "wosonhj", "facebook", "scinet"]
 ACTIVE_PROXY = proxy_config.ProxySettings()
+NOT_FOUND_ERROR = "No response or not found"
+
+@dataclass(slots=True, frozen=True)
+class Outcome:
+    """Result of posting a single DOI to a single service."""
+
+    doi: str
+    svc: str
+    ok: bool
+    detail: Any = None
+
+    def as_dict(self):
+        """Return the legacy ``{"error": ...}``/payload form of this outcome."""
+        if not self.ok:
+            return {"error": self.detail}
+        return {"success": True} if self.detail is None else self.detail
+
+
+def _outcomes_from_mapping(dois, svc, response):
+    """Build outcomes from a service response keyed by DOI."""
+    outcomes = []
+    for doi in dois:
+        payload = response.get(doi, {"error": NOT_FOUND_ERROR})
+        if isinstance(payload, dict) and "error" in payload:
+            outcomes.append(Outcome(doi, svc, False, payload["error"]))
+        else:
+            outcomes.append(Outcome(doi, svc, True, payload))
+    return outcomes
+
+
+def _outcomes_from_items(dois, svc, response_list):
+    """Build outcomes from a list of ``{"doi", "success", "error"}`` items."""
+    by_doi = {}
+    for item in response_list:
+        doi = item.get('doi')
+        if item.get('success'):
+            by_doi[doi] = Outcome(doi, svc, True)
+        else:
+            by_doi[doi] = Outcome(doi, svc, False, item.get('error', 'Unknown error'))
+    return [by_doi.get(doi) or Outcome(doi, svc, False, NOT_FOUND_ERROR) for doi in dois]
+
 
 def extract_dois_from_text_input(text):
     """
@@ -20,130 +63,177 @@ def extract_dois_from_text_input(text):
     """
     return getpapers.extract_dois_from_text(text)
 
+async def _do_nexus(dois, verbose, facebook_headless=True):
+    svc = "nexus"
+    try:
+        response = await nexus.request_papers_by_doi_list(dois)
+        if verbose:
+            print("📨 Posted DOIs to Nexus bot for help.")
+        return _outcomes_from_mapping(dois, svc, response)
+    except Exception as e:
+        if verbose:
+            print(f"❌ Failed to post DOIs to Nexus: {e}")
+        return [Outcome(doi, svc, False, str(e)) for doi in dois]
+
+
+async def _do_ablesci(dois, verbose, facebook_headless=True):
+    svc = "ablesci"
+    try:
+        response_list = await asyncio.to_thread(ablesci.request_multiple_dois, dois)
+        if verbose:
+            print("📨 Posted DOIs to AbleSci for help.")
+        return _outcomes_from_items(dois, svc, response_list)
+    except Exception as e:
+        if verbose:
+            print(f"❌ Failed to post DOIs to AbleSci: {e}")
+        return [Outcome(doi, svc, False, str(e)) for doi in dois]
+
+
+async def _do_wosonhj(dois, verbose, facebook_headless=True):
+    svc = "wosonhj"
+    try:
+        response = await asyncio.to_thread(wosonhj.request_multiple_dois, dois)
+        if verbose:
+            print("📨 Posted DOIs to Wosonhj for help.")
+        return _outcomes_from_mapping(dois, svc, response)
+    except Exception as e:
+        if verbose:
+            print(f"❌ Failed to post DOIs to Wosonhj: {e}")
+        return [Outcome(doi, svc, False, str(e)) for doi in dois]
+
+
+async def _do_facebook(dois, verbose, facebook_headless=True):
+    svc = "facebook"
+    try:
+        response_list = await asyncio.to_thread(
+            facebook.request_multiple_dois,
+            dois,
+            verbose=verbose,
+            headless=facebook_headless,
+        )
+        if verbose:
+            print("📨 Posted DOIs to Facebook for help.")
+        return _outcomes_from_items(dois, svc, response_list)
+    except Exception as e:
+        if verbose:
+            print(f"❌ Failed to post DOIs to Facebook: {e}")
+        return [Outcome(doi, svc, False, str(e)) for doi in dois]
+
+
+async def _do_scinet(dois, verbose, facebook_headless=True):
+    svc = "scinet"
+    try:
+        response = await asyncio.to_thread(scinet.login_and_request_multiple_dois_simple, dois)
+        if verbose:
+            print("📨 Posted DOIs to SciNet for help.")
+        return _outcomes_from_mapping(dois, svc, response)
+    except Exception as e:
+        if verbose:
+            print(f"❌ Failed to post DOIs to SciNet: {e}")
+        return [Outcome(doi, svc, False, str(e)) for doi in dois]
+
+
+_DISPATCH = {
+    "nexus": _do_nexus,
+    "ablesci": _do_ablesci,
+    "wosonhj": _do_wosonhj,
+    "facebook": _do_facebook,
+    "scinet": _do_scinet,
+}
+
+
 async def _request_single_service(dois, svc, verbose, facebook_headless=True):
-    if svc == "nexus":
-        try:
-            response = await nexus.request_papers_by_doi_list(dois)
-            if verbose:
-                print("📨 Posted DOIs to Nexus bot for help.")
-            return {doi: response.get(doi, {"error": "No response or not found"}) for doi in dois}
-        except Exception as e:
-            if verbose:
-                print(f"❌ Failed to post DOIs to Nexus: {e}")
-            return {doi: {"error": str(e)} for doi in dois}
-    if svc == "ablesci":
-        try:
-            response_list = await asyncio.to_thread(ablesci.request_multiple_dois, dois)
-            if verbose:
-                print("📨 Posted DOIs to AbleSci for help.")
-            svc_results = {}
-            for item in response_list:
-                doi = item.get('doi')
-                if item.get('success'):
-                    svc_results[doi] = {"success": True}
-                else:
-                    svc_results[doi] = {"error": item.get('error', 'Unknown error')}
-            for doi in dois:
-                if doi not in svc_results:
-                    svc_results[doi] = {"error": "No response or not found"}
-            return svc_results
-        except Exception as e:
-            if verbose:
-                print(f"❌ Failed to post DOIs to AbleSci: {e}")
-            return {doi: {"error": str(e)} for doi in dois}
-    if svc == "wosonhj":
-        try:
-            response = await asyncio.to_thread(wosonhj.request_multiple_dois, dois)
-            if verbose:
-                print("📨 Posted DOIs to Wosonhj for help.")
-            return {doi: response.get(doi, {"error": "No response or not found"}) for doi in dois}
-        except Exception as e:
-            if verbose:
-                print(f"❌ Failed to post DOIs to Wosonhj: {e}")
-            return {doi: {"error": str(e)} for doi in dois}
-    if svc == "facebook":
-        try:
-            response_list = await asyncio.to_thread(
-                facebook.request_multiple_dois,
-                dois,
-                verbose=verbose,
-                headless=facebook_headless,
-            )
-            if verbose:
-                print("📨 Posted DOIs to Facebook for help.")
-            response_dict = {}
-            for item in response_list:
-                doi = item.get('doi')
-                if item.get('success'):
-                    response_dict[doi] = {"success": True}
-                else:
-                    response_dict[doi] = {"error": item.get('error', 'Unknown error')}
-            return {doi: response_dict.get(doi, {"error": "No response or not found"}) for doi in dois}
-        except Exception as e:
-            if verbose:
-                print(f"❌ Failed to post DOIs to Facebook: {e}")
-            return {doi: {"error": str(e)} for doi in dois}
-    if svc == "scinet":
-        try:
-            response = await asyncio.to_thread(scinet.login_and_request_multiple_dois_simple, dois)
-            if verbose:
-                print("📨 Posted DOIs to SciNet for help.")
-            return {doi: response.get(doi, {"error": "No response or not found"}) for doi in dois}
-        except Exception as e:
-            if verbose:
-                print(f"❌ Failed to post DOIs to SciNet: {e}")
-            return {doi: {"error": str(e)} for doi in dois}
-    raise ValueError(f"Service '{svc}' is not supported.")
+    handler = _DISPATCH.get(svc)
+    if handler is None:
+        raise ValueError(f"Service '{svc}' is not supported.")
+    return await handler(dois, verbose, facebook_headless=facebook_headless)
 
 
-async def async_request_dois(dois, verbose=False, service=None, facebook_headless=True):
+def _resolve_service_list(service):
+    if service is None:
+        return ["nexus"]
+    if isinstance(service, str):
+        return SERVICE_LIST if service.lower() == "all" else [service]
+    return SERVICE_LIST if any(s.lower() == "all" for s in service) else list(service)
+
+
+async def async_request_outcomes(dois, verbose=False, service=None, facebook_headless=True):
+    """
+    Post DOIs to the selected services and return a flat list of
+    :class:`Outcome` records, ordered by service and then by DOI.
+    """
     if isinstance(dois, str):
         dois = [dois]
 
-    if service is None:
-        service_list = ["nexus"]
-    elif isinstance(service, str):
-        service_list = SERVICE_LIST if service.lower() == "all" else [service]
-    else:
-        service_list = SERVICE_LIST if any(s.lower() == "all" for s in service) else list(service)
-
+    service_list = _resolve_service_list(service)
     tasks = [
         asyncio.create_task(_request_single_service(dois, svc, verbose, facebook_headless=facebook_headless))
         for svc in service_list
     ]
     service_results = await asyncio.gather(*tasks)
+    return [outcome for svc_outcomes in service_results for outcome in svc_outcomes]
+
 
+def outcomes_to_results(outcomes, multi_service):
+    """
+    Convert a list of :class:`Outcome` records into the DOI-keyed result
+    dictionary returned by :func:`async_request_dois`.
+    """
     results = {}
-    for svc, svc_results in zip(service_list, service_results):
-        for doi in dois:
-            if len(service_list) == 1:
-                results[doi] = svc_results.get(doi, {"error": "No response or not found"})
-            else:
-                if doi not in results:
-                    results[doi] = {}
-                results[doi][svc] = svc_results.get(doi, {"error": "No response or not found"})
+    for outcome in outcomes:
+        if multi_service:
+            results.setdefault(outcome.doi, {})[outcome.svc] = outcome.as_dict()
+        else:
+            results[outcome.doi] = outcome.as_dict()
     return results
 
 
+async def async_request_dois(dois, verbose=False, service=None, facebook_headless=True):
+    outcomes = await async_request_outcomes(
+        dois, verbose=verbose, service=service, facebook_headless=facebook_headless
+    )
+    return outcomes_to_results(outcomes, len(_resolve_service_list(service)) > 1)
+
+
+def _run_sync(coro_factory, name):
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro_factory())
+
+    raise RuntimeError(f"{name} cannot run inside an existing event loop; use async_{name} instead.")
+
+
+def request_outcomes(dois, verbose=False, service=None, facebook_headless=True):
+    """
+    Synchronous wrapper for :func:`async_request_outcomes`.
+    """
+    return _run_sync(
+        lambda: async_request_outcomes(
+            dois,
+            verbose=verbose,
+            service=service,
+            facebook_headless=facebook_headless,
+        ),
+        "request_outcomes",
+    )
+
+
 def request_dois(dois, verbose=False, service=None, facebook_headless=True):
     """
     Synchronous wrapper for :func:`async_request_dois`.
     Raises an informative error if called from an active event loop to avoid
     nested loop failures.
     """
-    try:
-        asyncio.get_running_loop()
-    except RuntimeError:
-        return asyncio.run(
-            async_request_dois(
-                dois,
-                verbose=verbose,
-                service=service,
-                facebook_headless=facebook_headless,
-            )
-        )
-
-    raise RuntimeError("request_dois cannot run inside an existing event loop; use async_request_dois instead.")
+    return _run_sync(
+        lambda: async_request_dois(
+            dois,
+            verbose=verbose,
+            service=service,
+            facebook_headless=facebook_headless,
+        ),
+        "request_dois",
+    )
 
 def parse_doi_argument(doi_arg):
     """
@@ -206,6 +296,12 @@ def print_result_with_icons(doi, data):
     else:
         print(f"✅ DOI: {doi}\n   Result: {data}\n")
 
+def print_outcome_with_icons(outcome):
+    if not outcome.ok:
+        print(f"❌ DOI: {outcome.doi} [{outcome.svc}]\n   Error: {outcome.detail}\n")
+    else:
+        print(f"✅ DOI: {outcome.doi} [{outcome.svc}]\n   Result: {outcome.as_dict()}\n")
+
 def main():
     """
     Main function for testing request_dois functionality.
@@ -285,14 +381,14 @@ def main():
 
     # Parse the service argument using the updated function
     services = parse_service_argument(args.service)
-    result = request_dois(
+    outcomes = request_outcomes(
         dois,
         verbose=args.verbose,
         service=services,
         facebook_headless=not args.no_headless,
     )
-    for doi, data in result.items():
-        print_result_with_icons(doi, data)
+    for outcome in outcomes:
+        print_outcome_with_icons(outcome)
 
 if __name__ == "__main__":
     main()
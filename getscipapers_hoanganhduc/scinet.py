@@ -14,11 +14,12 @@ from selenium.common.exceptions import TimeoutException
 import time
 import os
 import argparse
-import pickle
 import json
 from datetime import datetime, timedelta
 import re
 import requests
+from urllib3.util.retry import Retry
+from urllib.parse import quote
 from . import proxy_config
 from selenium.webdriver.common.keys import Keys
 import readline
@@ -32,16 +33,52 @@ from .selenium_utils import build_chrome_driver
 import sys
 import random
 import tempfile
+import shutil
+from functools import lru_cache
+from dataclasses import dataclass
+from itertools import islice
+import concurrent.futures
+import contextlib
+import queue
+import threading
+import atexit
+import selectors
+
+if platform.system() == 'Windows':
+    import msvcrt
 
 # Allow slow responses when downloading requested files.
 DOWNLOAD_TIMEOUT = 120
 
+# Host serving the PDFs of solved requests
+PDF_BASE_URL = "https://pdf.sci-net.xyz"
+
+# Largest PDF accepted from a download (500 MiB)
+MAX_PDF_BYTES = 500 * 1024 * 1024
+
+# Number of PDFs downloaded at the same time once their URLs are known
+DOWNLOAD_WORKERS = 8
+
+# Shared HTTP session so downloads reuse pooled keep-alive connections;
+# throttled or briefly failing responses are retried with backoff
+_SESSION = requests.Session()
+_HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    raise_on_status=False,
+)
+_HTTP_ADAPTER = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=_HTTP_RETRY)
+_SESSION.mount("https://", _HTTP_ADAPTER)
+_SESSION.mount("http://", _HTTP_ADAPTER)
+
 # Global variables for credentials
 USERNAME = ""  # Replace with your actual username/email
 PASSWORD = ""  # Replace with your actual password
 ACTIVE_PROXY = proxy_config.ProxySettings()
 
 # Cache and download configuration
+@lru_cache(maxsize=1)
 def get_cache_directory():
     """Get the appropriate cache directory for the current platform, using getscipapers/scinet subfolder"""
     system = platform.system()
@@ -62,9 +99,11 @@ def get_cache_directory():
         # Use ~/.config on Linux
         cache_dir = os.path.join(os.path.expanduser('~'), '.config', subfolder)
     # Create cache directory if it doesn't exist
-    os.makedirs(cache_dir, exist_ok=True)
+    if not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir, exist_ok=True)
     return cache_dir
 
+@lru_cache(maxsize=1)
 def get_download_directory():
     """Get the default download directory for the current platform, using getscipapers/scinet_downloads subfolder"""
     system = platform.system()
@@ -84,20 +123,340 @@ def get_download_directory():
         # Use ~/Downloads on Linux
         download_dir = os.path.join(os.path.expanduser('~'), 'Downloads', subfolder)
     # Ensure all parent directories exist
-    os.makedirs(download_dir, exist_ok=True)
+    if not os.path.isdir(download_dir):
+        os.makedirs(download_dir, exist_ok=True)
     return download_dir
 
-CACHE_FILE = os.path.join(get_cache_directory(), "scinet_cache.pkl")
+CACHE_FILE = os.path.join(get_cache_directory(), "scinet_cache.json")
 CACHE_DURATION_HOURS = 24  # Cache validity in hours
+_CACHE_TTL = timedelta(hours=CACHE_DURATION_HOURS)
 DEFAULT_DOWNLOAD_DIR = get_download_directory()
 CREDENTIAL_FILE = os.path.join(get_cache_directory(), "credentials.json")
 
 # Log configuration
 LOG_FILE = "scinet.log"
 
+# Endpoint that the site's upload script posts files to. When set, uploads are
+# sent with requests using the browser's cookies and only fall back to driving
+# the upload page if the server does not accept them. Left unset until the
+# endpoint has been confirmed against the live site.
+DIRECT_UPLOAD_URL = os.environ.get("SCINET_UPLOAD_URL") or None
+
+# Upper bound on waiting for the site to report an upload result
+UPLOAD_WAIT_TIMEOUT = 180
+
+# True once a notice/error is shown or every tracked upload has settled
+UPLOAD_FINISHED_JS = """
+    var shown = function(selector) {
+        return Array.prototype.some.call(document.querySelectorAll(selector), function(el) {
+            return el.offsetParent !== null && el.textContent.trim() !== '';
+        });
+    };
+    if (shown('.found') || shown('.error')) {
+        return true;
+    }
+    if (typeof uploads !== 'undefined' && uploads) {
+        var entries = Object.values(uploads);
+        return entries.length > 0 && entries.every(function(u) {
+            return u && (u.done || u.error || u.finished || u.status === 'done' || u.status === 'error');
+        });
+    }
+    return false;
+"""
+
+# Collects everything request_paper_by_doi reads from the search result page
+# in one round trip; returns null when the .found container is missing
+SEARCH_RESULT_JS = """
+    var found = document.querySelector('.found');
+    if (!found) {
+        return null;
+    }
+    var shown = function(el) {
+        return !!el && !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    };
+    var text = function(el) {
+        return el ? (el.innerText || el.textContent || '').trim() : null;
+    };
+    var source = function(selector) {
+        var el = found.querySelector(selector);
+        if (!shown(el)) {
+            return null;
+        }
+        var link = el.tagName === 'A' ? el : el.querySelector('a');
+        return {'link': link ? link.href : el.getAttribute('href'), 'message': text(el)};
+    };
+    var result = {
+        'availability': {
+            'sci_hub': source('.sci-hub'),
+            'open_access': source('.openaccess'),
+            'arxiv': source('.arxiv'),
+            'preprint': source('.preprint'),
+            'sci_net': source('.sci-net')
+        },
+        'paper_info': null,
+        'error': null,
+        'can_request': false,
+        'reward': null
+    };
+    var preview = document.querySelector('.preview');
+    if (preview) {
+        var info = {};
+        var year = preview.querySelector('.yejo .year');
+        var journal = preview.querySelector('.yejo .journal');
+        if (year && journal) {
+            info.year = text(year);
+            info.journal = text(journal);
+        }
+        var title = preview.querySelector('.title a');
+        if (title) {
+            info.title = text(title);
+            info.title_link = title.href;
+        }
+        var authors = preview.querySelector('.authors');
+        if (authors) {
+            info.authors = text(authors);
+        }
+        var abstract = preview.querySelector('.abstract');
+        if (abstract) {
+            info.abstract = text(abstract);
+        }
+        var publisher = preview.querySelector('.publisher img');
+        if (publisher) {
+            info.publisher = {'name': publisher.getAttribute('title'), 'logo': publisher.src};
+        }
+        result.paper_info = info;
+    }
+    var error = document.querySelector('.error');
+    if (shown(error)) {
+        result.error = text(error);
+    }
+    var post = document.querySelector('.post');
+    if (shown(post)) {
+        result.can_request = true;
+        var reward = post.querySelector('#reward');
+        if (reward) {
+            result.reward = {'default': reward.getAttribute('value'), 'max': reward.getAttribute('max')};
+        }
+    }
+    return result;
+"""
+
+# Texts of the visible .found/.error elements on the upload page
+UPLOAD_NOTICES_JS = """
+    var visibleTexts = function(selector) {
+        return Array.prototype.filter.call(document.querySelectorAll(selector), function(el) {
+            return el.offsetParent !== null;
+        }).map(function(el) {
+            return (el.innerText || el.textContent || '').trim();
+        });
+    };
+    return {'found': visibleTexts('.found'), 'error': visibleTexts('.error')};
+"""
+
+# Number of .request elements in the active requests list
+REQUEST_COUNT_JS = """
+    var container = document.querySelector('.requests');
+    return container ? container.querySelectorAll('.request').length : 0;
+"""
+
+# Counts the page's XHR/fetch requests in window.__scinetPending: count is
+# the number in flight, started the number ever sent; the hooks are
+# installed once per page and only see later requests
+PENDING_REQUESTS_JS = """
+    if (!window.__scinetPending) {
+        window.__scinetPending = {count: 0, started: 0};
+        var pending = window.__scinetPending;
+        var done = function() { pending.count = Math.max(0, pending.count - 1); };
+        var send = XMLHttpRequest.prototype.send;
+        XMLHttpRequest.prototype.send = function() {
+            pending.count++;
+            pending.started++;
+            this.addEventListener('loadend', done);
+            return send.apply(this, arguments);
+        };
+        if (window.fetch) {
+            var fetch = window.fetch;
+            window.fetch = function() {
+                pending.count++;
+                pending.started++;
+                return fetch.apply(this, arguments).finally(done);
+            };
+        }
+    }
+"""
+
+# Request count, page height and requests in flight after a scroll
+LIST_GROWTH_JS = """
+    var container = document.querySelector('.requests');
+    return {
+        'count': container ? container.querySelectorAll('.request').length : 0,
+        'height': document.body.scrollHeight,
+        'pending': window.__scinetPending ? window.__scinetPending.count : 0,
+        'started': window.__scinetPending ? window.__scinetPending.started : 0
+    };
+"""
+
+# Seconds without network activity, after the scroll has fired at least one
+# request, after which a scrolled list is complete
+NETWORK_QUIET_SECONDS = 0.5
+
+# Fields of the .request elements in the active requests list, from index
+# arguments[0] up to (not including) arguments[1]
+ACTIVE_REQUESTS_JS = """
+    var start = arguments[0] || 0;
+    var end = arguments[1];
+    var container = document.querySelector('.requests');
+    if (!container) {
+        return [];
+    }
+    var text = function(el) {
+        return el ? (el.innerText || el.textContent || '').trim() : '';
+    };
+    var nodes = Array.prototype.slice.call(container.querySelectorAll('.request'), start, end);
+    return nodes.map(function(r) {
+        var titleLink = r.querySelector('.title a');
+        var avatarLink = r.querySelector('.block.user .avatar a');
+        var avatarImg = avatarLink ? avatarLink.querySelector('img') : null;
+        return {
+            'title': text(titleLink || r.querySelector('.title')),
+            'link': titleLink ? titleLink.href : '',
+            'authors': text(r.querySelector('.authors')),
+            'journal': text(r.querySelector('.journal')),
+            'year': text(r.querySelector('.year')),
+            'doi': text(r.querySelector('.doi')),
+            'reward': text(r.querySelector('.reward')),
+            'time_left': text(r.querySelector('.time')),
+            'requester_href': avatarLink ? avatarLink.getAttribute('href') : '',
+            'requester_title': avatarImg ? avatarImg.getAttribute('title') : ''
+        };
+    });
+"""
+
+# Elements inside a paper page's div.pdf that carry the PDF URL
+PDF_SOURCE_SELECTOR = "div.pdf iframe, div.pdf embed, div.pdf object, div.pdf a"
+# Embedded PDF viewers, present once a paper page shows the PDF inline
+INLINE_PDF_SELECTOR = "div.pdf iframe, div.pdf embed, div.pdf object"
+# Tags inside div.pdf to take the PDF URL from, in order of preference,
+# with the attribute holding the URL
+PDF_SOURCE_ATTRIBUTES = (("iframe", "src"), ("embed", "src"), ("object", "data"), ("a", "href"))
+# Poll interval for fast_wait(), in seconds
+FAST_POLL_SECONDS = 0.1
+# View links in a paper page's preview section, in order of preference
+VIEW_LINK_SELECTORS = ("div.preview a.button.green", "div.preview a.button")
+# Link that opens the report form on a solved paper page
+REPORT_LINK_SELECTOR = "a.problem[onclick='problem()']"
+# Inputs the report form may ask for the rejection message in
+REPORT_INPUT_SELECTOR = "textarea, input[type='text']"
+# Same inputs with looser fallbacks, in order of preference
+REPORT_MESSAGE_INPUT_SELECTORS = (
+    "textarea",
+    "input[type='text']",
+    "input[placeholder*='message']",
+    "input[placeholder*='reason']",
+    "input",
+)
+
+# Finds the report form's submit button: a submit-type button or input
+# first, then a button labelled Submit or Send, then any button
+SUBMIT_BUTTON_JS = """
+const buttons = Array.from(document.querySelectorAll('button'));
+const labelled = (label) => buttons.find(button => button.textContent.includes(label));
+return document.querySelector("button[type='submit']")
+    || document.querySelector("input[type='submit']")
+    || labelled('Submit')
+    || labelled('Send')
+    || buttons[0]
+    || null;
+"""
+
+# Scrolls arguments[0] to the middle of the viewport and clicks it
+SCROLL_AND_CLICK_JS = "arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();"
+
+# Class, text and href of every link in a paper page's div.buttons, or
+# null when the page has no buttons div
+BUTTON_LINKS_JS = """
+const buttons = document.querySelector('div.buttons');
+if (!buttons) return null;
+return Array.from(buttons.querySelectorAll('a'), link => ({
+    'class': link.getAttribute('class') || '',
+    'text': (link.innerText || '').trim(),
+    'href': link.href || ''
+}));
+"""
+
+# Onclick and text of every a.problem link, and the text of every span
+# mentioning "report", for _log_debug_info()
+REPORT_DEBUG_JS = """
+const text = (el) => (el.innerText || '').trim();
+return {
+    'problem_links': Array.from(document.querySelectorAll('a.problem'), link => ({
+        'onclick': link.getAttribute('onclick'),
+        'text': text(link)
+    })),
+    'report_spans': Array.from(document.querySelectorAll('span'), text)
+        .filter(spanText => spanText.toLowerCase().includes('report'))
+};
+"""
+
+# What solve_request_by_doi() needs from a DOI page: the current URL,
+# whether a solution is already posted, and the respond block's upload
+# button with its onclick (null until the block has rendered)
+SOLVE_PAGE_STATE_JS = """
+const upload = document.querySelector("div.respond.block a.button[onclick*='upload']");
+return {
+    'url': location.href,
+    'has_solution': !!document.querySelector('.solved, .solution'),
+    'upload_button': upload,
+    'upload_onclick': upload ? upload.getAttribute('onclick') : null
+};
+"""
+
+# Poll interval while waiting for the DOI page's respond block, in seconds
+SOLVE_PAGE_POLL_SECONDS = 0.2
+
+# URL patterns block_heavy_resources() stops the browser from fetching
+BLOCKED_URL_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*google-analytics.com*", "*googletagmanager.com*",
+)
+
+# Every PDF file starts with this header
+PDF_MAGIC = b'%PDF-'
+
+# Seconds to wait for manually entered credentials after a failed login
+MANUAL_LOGIN_TIMEOUT = 30
+# Seconds to wait for each answer when selecting fulfilled requests
+SELECTION_INPUT_TIMEOUT = 30
+
+# Concurrency configuration for multi-file jobs
+DEFAULT_BROWSER_POOL_SIZE = 3
+MAX_BROWSER_POOL_SIZE = 6  # More concurrent sessions invite server pushback
+UPLOAD_RETRIES = 1
+UPLOAD_BACKOFF_SECONDS = 5
+# Bounds of the pause added after accept/reject actions that hit a rate limit
+RATE_LIMIT_BACKOFF_MIN = 0.2
+RATE_LIMIT_BACKOFF_MAX = 5
+DEFAULT_JOB_RATE = 1 / 3  # Uploads/DOI requests started per second
+# Seconds the interpreter waits at exit for each browser still shutting down
+DRIVER_QUIT_JOIN_TIMEOUT = 5
+
 # Global verbose flag
 VERBOSE = False
 
+# DOI regex pattern that matches:
+# - Standard DOI: 10.xxxx/yyyy
+# - DOI URL: https://doi.org/10.xxxx/yyyy or http://dx.doi.org/10.xxxx/yyyy
+_DOI_RE = re.compile(r'^(https?://(dx\.)?doi\.org/)?10\.\d{4,}/[^\s]+$', re.IGNORECASE)
+# Characters that are not allowed in file names
+_UNSAFE_FN_RE = re.compile(r'[<>:"/\\|?*]')
+# Count in a notice such as "Your requests (3) have been solved!"
+_COUNT_RE = re.compile(r'\((\d+)\)')
+# Error text that means the server is rate limiting us
+_RATE_LIMIT_RE = re.compile(r'\b429\b|rate.?limit|too many requests', re.IGNORECASE)
+# One entry of a comma-separated selection such as "1, 3,5"
+_SELECTION_RE = re.compile(r'\s*(\d+)\s*')
+
 def debug_print(message):
     """Print debug message only if verbose mode is enabled"""
     if VERBOSE:
@@ -113,12 +472,53 @@ def is_valid_doi(doi):
     Returns:
         bool: True if DOI format is valid, False otherwise
     """
-    # DOI regex pattern that matches:
-    # - Standard DOI: 10.xxxx/yyyy
-    # - DOI URL: https://doi.org/10.xxxx/yyyy or http://dx.doi.org/10.xxxx/yyyy
-    doi_pattern = r'^(https?://(dx\.)?doi\.org/)?10\.\d{4,}/[^\s]+$'
+    return _DOI_RE.match(doi.strip()) is not None
+
+def clean_doi_list(dois):
+    """
+    Strip, validate and deduplicate a list of DOIs in one pass
+    
+    Args:
+        dois: Iterable of DOI strings
+    
+    Returns:
+        list: Valid DOIs in their original order, without duplicates
+    """
+    cleaned = []
+    seen = set()
+    for doi in dois:
+        clean_doi = doi.strip()
+        # DOIs are case-insensitive, so duplicates are compared lowercased
+        key = clean_doi.lower()
+        if not clean_doi or key in seen or not _DOI_RE.match(clean_doi):
+            continue
+        seen.add(key)
+        cleaned.append(clean_doi)
+    return cleaned
+
+def doi_from_href(href):
+    """
+    Extract the DOI from a sci-net.xyz link such as https://sci-net.xyz/10.xxxx/yyyy
     
-    return bool(re.match(doi_pattern, doi.strip(), re.IGNORECASE))
+    Returns:
+        str: The DOI, or an empty string if the link holds none
+    """
+    # A single partition scan finds the first "/10." and splits on it
+    _, sep, rest = (href or '').partition('/10.')
+    return '10.' + rest if sep else ''
+
+def _read_text_lines(file_path):
+    """
+    Read a UTF-8 text file into a list of lines
+
+    Args:
+        file_path: Path to the text file
+
+    Returns:
+        list: Lines of the file without line endings
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return [line.rstrip('\n') for line in f]
 
 def read_dois_with_rewards_from_file(file_path):
     """
@@ -138,43 +538,45 @@ def read_dois_with_rewards_from_file(file_path):
             print(f"DOI file not found: {file_path}")
             return doi_reward_pairs
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if line and not line.startswith('#'):  # Skip empty lines and comments
-                    # Parse DOI and optional reward tokens
-                    if ',' in line:
-                        # DOI,reward_tokens format
-                        parts = line.split(',', 1)
-                        doi = parts[0].strip()
-                        try:
-                            reward_tokens = int(parts[1].strip())
-                            if reward_tokens < 1:
-                                print(f"Error: Reward tokens must be at least 1 at line {line_num}: '{line}'")
-                                exit(1)
-                        except ValueError:
-                            print(f"Error: Invalid reward tokens '{parts[1].strip()}' at line {line_num}: '{line}'")
-                            exit(1)
-                    else:
-                        # Just DOI, use default reward tokens
-                        doi = line
-                        reward_tokens = 1
-                    
-                    # Validate DOI format
-                    if not is_valid_doi(doi):
-                        print(f"Error: Invalid DOI format at line {line_num}: '{doi}'")
-                        print("DOI format should be like: 10.1000/182 or https://doi.org/10.1000/182")
-                        print("Exiting due to invalid DOI format.")
+        lines = _read_text_lines(file_path)
+
+        for line_num, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):  # Skip empty lines and comments
+                continue
+
+            # Parse DOI and optional reward tokens (DOI or DOI,reward_tokens)
+            doi, sep, reward_text = line.partition(',')
+            if sep:
+                doi = doi.strip()
+                reward_text = reward_text.strip()
+                try:
+                    reward_tokens = int(reward_text)
+                    if reward_tokens < 1:
+                        print(f"Error: Reward tokens must be at least 1 at line {line_num}: '{line}'")
                         exit(1)
-                    
-                    # Check for duplicate DOIs
-                    if doi in seen_dois:
-                        print(f"Warning: Duplicate DOI found at line {line_num}: '{doi}' - skipping")
-                        continue
-                    
-                    seen_dois.add(doi)
-                    doi_reward_pairs.append((doi, reward_tokens))
-                    debug_print(f"Read valid DOI {len(doi_reward_pairs)}: {doi} (reward tokens: {reward_tokens})")
+                except ValueError:
+                    print(f"Error: Invalid reward tokens '{reward_text}' at line {line_num}: '{line}'")
+                    exit(1)
+            else:
+                # Just DOI, use default reward tokens
+                reward_tokens = 1
+
+            # Validate DOI format
+            if not is_valid_doi(doi):
+                print(f"Error: Invalid DOI format at line {line_num}: '{doi}'")
+                print("DOI format should be like: 10.1000/182 or https://doi.org/10.1000/182")
+                print("Exiting due to invalid DOI format.")
+                exit(1)
+
+            # Check for duplicate DOIs
+            if doi in seen_dois:
+                print(f"Warning: Duplicate DOI found at line {line_num}: '{doi}' - skipping")
+                continue
+
+            seen_dois.add(doi)
+            doi_reward_pairs.append((doi, reward_tokens))
+            debug_print(f"Read valid DOI {len(doi_reward_pairs)}: {doi} (reward tokens: {reward_tokens})")
         
         print(f"Read {len(doi_reward_pairs)} valid DOI-reward pairs from file: {file_path}")
         
@@ -184,6 +586,30 @@ def read_dois_with_rewards_from_file(file_path):
     
     return doi_reward_pairs
 
+def iter_pdf_files(directory_path, recursive=False):
+    """
+    Lazily yield PDF file paths found in a directory, in directory order
+    
+    Args:
+        directory_path: Path to the directory containing PDF files
+        recursive: Whether to search subdirectories recursively
+    
+    Yields:
+        str: Path of each PDF file as soon as it is found
+    """
+    # os.scandir entries carry the file type from the directory listing,
+    # so is_file()/is_dir() do not need an extra stat per entry; symlinks
+    # are not followed, so links out of the tree or in a loop are skipped
+    pending_dirs = [directory_path]
+    while pending_dirs:
+        with os.scandir(pending_dirs.pop()) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False) and entry.name.lower().endswith('.pdf'):
+                    yield entry.path
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    # Search recursively
+                    pending_dirs.append(entry.path)
+
 def get_pdf_files_from_directory(directory_path, recursive=False):
     """
     Get all PDF files from a directory
@@ -206,20 +632,7 @@ def get_pdf_files_from_directory(directory_path, recursive=False):
         return pdf_files
     
     try:
-        if recursive:
-            # Search recursively
-            for root, dirs, files in os.walk(directory_path):
-                for file in files:
-                    if file.lower().endswith('.pdf'):
-                        pdf_files.append(os.path.join(root, file))
-        else:
-            # Search only in the specified directory
-            for file in os.listdir(directory_path):
-                file_path = os.path.join(directory_path, file)
-                if os.path.isfile(file_path) and file.lower().endswith('.pdf'):
-                    pdf_files.append(file_path)
-        
-        pdf_files.sort()  # Sort alphabetically
+        pdf_files = sorted(iter_pdf_files(directory_path, recursive))  # Sort alphabetically
         print(f"Found {len(pdf_files)} PDF files in {directory_path}")
         
     except Exception as e:
@@ -232,12 +645,12 @@ def save_login_cache(driver, username):
     try:
         cache_data = {
             'cookies': driver.get_cookies(),
-            'timestamp': datetime.now(),
+            'timestamp': datetime.now().isoformat(),
             'user_agent': driver.execute_script("return navigator.userAgent;"),
             'username': username
         }
-        with open(CACHE_FILE, 'wb') as f:
-            pickle.dump(cache_data, f)
+        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache_data, f)
         os.chmod(CACHE_FILE, stat.S_IRUSR | stat.S_IWUSR)
         debug_print(f"Login cache saved successfully for user: {username}")
         return True
@@ -245,16 +658,31 @@ def save_login_cache(driver, username):
         debug_print(f"Failed to save login cache for user {username}: {str(e)}")
         return False
 
+def read_login_cache_file():
+    """
+    Read the JSON login cache file and parse its timestamp.
+
+    Returns:
+        dict: Cache data with 'timestamp' converted to a datetime (when present)
+
+    Raises:
+        OSError, ValueError: If the file cannot be read or parsed
+    """
+    with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+        cache_data = json.load(f)
+    if isinstance(cache_data, dict) and isinstance(cache_data.get('timestamp'), str):
+        cache_data['timestamp'] = datetime.fromisoformat(cache_data['timestamp'])
+    return cache_data
+
 def load_login_cache():
     """Load cached login data for the single user (no multi-user support)"""
     try:
-        if not os.path.exists(CACHE_FILE):
+        try:
+            cache_data = read_login_cache_file()
+        except FileNotFoundError:
             debug_print("No login cache file found")
             return None
 
-        with open(CACHE_FILE, 'rb') as f:
-            cache_data = pickle.load(f)
-
         # Expect cache_data to be a dict with required fields
         if not isinstance(cache_data, dict) or 'timestamp' not in cache_data:
             debug_print("Cache file format invalid, removing...")
@@ -263,7 +691,7 @@ def load_login_cache():
 
         # Check if cache is still valid
         cache_age = datetime.now() - cache_data['timestamp']
-        if cache_age > timedelta(hours=CACHE_DURATION_HOURS):
+        if cache_age > _CACHE_TTL:
             debug_print(f"Login cache expired (age: {cache_age})")
             os.remove(CACHE_FILE)
             return None
@@ -279,6 +707,24 @@ def load_login_cache():
             pass
         return None
 
+def _to_cdp_cookies(cookies):
+    """Convert Selenium cookie dicts to the DevTools Network.CookieParam format"""
+    cdp_cookies = []
+    for cookie in cookies:
+        cdp_cookie = {
+            'name': cookie['name'],
+            'value': cookie['value'],
+            'domain': cookie.get('domain', '.sci-net.xyz'),
+            'path': cookie.get('path', '/'),
+        }
+        for key in ('secure', 'httpOnly', 'sameSite'):
+            if key in cookie:
+                cdp_cookie[key] = cookie[key]
+        if 'expiry' in cookie:
+            cdp_cookie['expires'] = cookie['expiry']
+        cdp_cookies.append(cdp_cookie)
+    return cdp_cookies
+
 def apply_login_cache(driver, cache_data):
     """Apply cached cookies to current session (single-user cache)"""
     try:
@@ -288,17 +734,25 @@ def apply_login_cache(driver, cache_data):
             EC.presence_of_element_located((By.TAG_NAME, "body"))
         )
 
-        # Add each cookie from the cache_data (single user dict)
+        # Ensure each cached cookie domain is compatible (single user dict)
         cookies = cache_data.get('cookies', [])
         for cookie in cookies:
-            try:
-                # Ensure cookie domain is compatible
-                if 'domain' in cookie and not cookie['domain'].endswith('sci-net.xyz'):
-                    cookie['domain'] = '.sci-net.xyz'
-                driver.add_cookie(cookie)
-                debug_print(f"Added cookie: {cookie.get('name', 'unknown')}")
-            except Exception as e:
-                debug_print(f"Failed to add cookie {cookie.get('name', 'unknown')}: {str(e)}")
+            if 'domain' in cookie and not cookie['domain'].endswith('sci-net.xyz'):
+                cookie['domain'] = '.sci-net.xyz'
+
+        # Add all cookies in one DevTools call, falling back to one WebDriver
+        # command per cookie when CDP is unavailable
+        try:
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": _to_cdp_cookies(cookies)})
+            debug_print(f"Added {len(cookies)} cookies via CDP")
+        except Exception as e:
+            debug_print(f"CDP cookie injection failed, adding cookies one by one: {str(e)}")
+            for cookie in cookies:
+                try:
+                    driver.add_cookie(cookie)
+                    debug_print(f"Added cookie: {cookie.get('name', 'unknown')}")
+                except Exception as e:
+                    debug_print(f"Failed to add cookie {cookie.get('name', 'unknown')}: {str(e)}")
 
         # Refresh to apply cookies
         driver.refresh()
@@ -314,9 +768,16 @@ def apply_login_cache(driver, cache_data):
 def is_logged_in(driver):
     """Check if user is currently logged in"""
     try:
+        # Skip the navigation when the upload page is already loaded
+        if "upload" in driver.current_url and driver.find_elements(By.ID, "pool"):
+            debug_print("User is logged in (already on upload page)")
+            return True
+
         # Navigate to upload page to test login status
         driver.get("https://sci-net.xyz/upload")
-        time.sleep(2)
+        WebDriverWait(driver, 5).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
         
         # Check if we're redirected to login page or if upload elements are present
         current_url = driver.current_url
@@ -347,6 +808,9 @@ def is_logged_in(driver):
         debug_print(f"Error checking login status: {str(e)}")
         return False
 
+# Number of leading characters typed one at a time by simulate_human_typing
+HUMAN_TYPED_CHARS = 3
+
 def simulate_human_typing(element, text, log_func=None):
     """
     Simulate human-like typing patterns into a Selenium element.
@@ -358,14 +822,17 @@ def simulate_human_typing(element, text, log_func=None):
     """
     if log_func:
         log_func(f"Typing text: {text[:20]}{'...' if len(text) > 20 else ''}")
-    for char in text:
+    # Type the first few characters one by one, then send the rest in a
+    # single WebDriver command
+    for char in text[:HUMAN_TYPED_CHARS]:
         element.send_keys(char)
         time.sleep(random.uniform(0.1, 0.3))
-        if random.random() < 0.1:
-            pause_time = random.uniform(0.3, 0.7)
-            if log_func:
-                log_func(f"Random pause: {pause_time:.2f}s")
-            time.sleep(pause_time)
+    if len(text) > HUMAN_TYPED_CHARS:
+        pause_time = random.uniform(0.3, 0.7)
+        if log_func:
+            log_func(f"Random pause: {pause_time:.2f}s")
+        time.sleep(pause_time)
+        element.send_keys(text[HUMAN_TYPED_CHARS:])
 
 def perform_login(driver, username, password):
     """Perform actual login process with human-like typing and paste."""
@@ -403,18 +870,10 @@ def perform_login(driver, username, password):
         # Enter credentials with human-like typing for first 3 chars, then paste the rest
         debug_print("Entering credentials with human-like typing and paste...")
         username_field.clear()
-        if len(username) > 3:
-            simulate_human_typing(username_field, username[:3], debug_print)
-            username_field.send_keys(username[3:])
-        else:
-            simulate_human_typing(username_field, username, debug_print)
+        simulate_human_typing(username_field, username, debug_print)
 
         password_field.clear()
-        if len(password) > 3:
-            simulate_human_typing(password_field, password[:3], debug_print)
-            password_field.send_keys(password[3:])
-        else:
-            simulate_human_typing(password_field, password, debug_print)
+        simulate_human_typing(password_field, password, debug_print)
 
         # Find and click login button
         debug_print("Looking for login button...")
@@ -438,9 +897,14 @@ def perform_login(driver, username, password):
             return False
 
         debug_print("Clicking login button...")
+        pre_login_url = driver.current_url
         login_button.click()
 
-        time.sleep(3)
+        # Continue as soon as the login form navigates away
+        try:
+            WebDriverWait(driver, 15).until(EC.url_changes(pre_login_url))
+        except TimeoutException:
+            debug_print("URL did not change after clicking login button")
 
         if is_logged_in(driver):
             print("Login successful!")
@@ -476,12 +940,13 @@ def load_credentials_from_json(json_path):
         # Expand user home directory
         json_path = os.path.expanduser(json_path)
 
-        if not os.path.exists(json_path):
+        try:
+            file_stat = os.stat(json_path)
+        except FileNotFoundError:
             print(f"Credentials file not found: {json_path}")
             return None
 
         # Check file permissions for security
-        file_stat = os.stat(json_path)
         file_mode = stat.filemode(file_stat.st_mode)
         if file_stat.st_mode & (stat.S_IRGRP | stat.S_IROTH):
             print(f"Warning: Credentials file {json_path} is readable by others ({file_mode})")
@@ -546,27 +1011,38 @@ def load_credentials_from_json(json_path):
         print(f"Error loading credentials from {json_path}: {str(e)}")
         return None
 
-def login_to_scinet(username, password, headless=False):
+def build_chrome_options(headless, user_data_dir, bulk=False, minimal_resources=None, page_load_strategy="normal"):
     """
-    Login to sci-net.xyz with caching support
-    Returns driver instance if successful, None otherwise
+    Build the Chrome options shared by every SciNet browser session
+
+    Args:
+        headless: Whether to run browser in headless mode
+        user_data_dir: Chrome profile directory to use
+        bulk: Whether the session runs a multi-DOI/multi-PDF job, which
+            skips GPU use and image loading to cut per-page time
+        minimal_resources: Whether to skip images, fonts, plugins and
+            background traffic (default: same as bulk)
+        page_load_strategy: "normal", or "eager" to return from driver.get
+            once the DOM is ready when every step waits for its own element
+
+    Returns:
+        ChromeOptions: Configured options instance
     """
-    # Setup webdriver
+    if minimal_resources is None:
+        minimal_resources = bulk
     options = webdriver.ChromeOptions()
+    options.page_load_strategy = page_load_strategy
     # Suppress DevTools logging
     options.add_experimental_option('excludeSwitches', ['enable-logging'])
     if headless:
-        options.add_argument("--headless")
+        options.add_argument("--headless=new" if bulk else "--headless")
         debug_print("Running in headless mode")
     else:
         debug_print("Running with visible browser")
-        
-    # Use a subdirectory of the cache directory for Chrome user data
-    user_data_dir = os.path.join(get_cache_directory(), "chrome_user_data")
-    os.makedirs(user_data_dir, exist_ok=True)
+
     options.add_argument(f"--user-data-dir={user_data_dir}")
     debug_print(f"Using Chrome user data directory: {user_data_dir}")
-    
+
     # Add options to ignore permission requests
     options.add_argument("--disable-notifications")
     options.add_argument("--disable-popup-blocking")
@@ -576,14 +1052,77 @@ def login_to_scinet(username, password, headless=False):
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--disable-web-security")
     options.add_argument("--allow-running-insecure-content")
+    if bulk:
+        options.add_argument("--disable-gpu")
+    if minimal_resources:
+        # Only page text is read, so images and fonts are never needed.
+        # Stylesheets stay enabled: the visibility checks on .found, .error
+        # and .post depend on them
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--disable-plugins")
+        options.add_argument("--disable-background-networking")
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+        })
+    return options
+
+def block_heavy_resources(driver):
+    """
+    Block images, web fonts and analytics scripts at the network level
+    through the DevTools protocol, so they are never even requested
+
+    Stylesheets are not blocked: the visibility checks on .found, .error
+    and .post depend on them.
+
+    Args:
+        driver: Selenium WebDriver instance
+
+    Returns:
+        bool: True if the block list was applied, False if CDP is unavailable
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(BLOCKED_URL_PATTERNS)})
+        debug_print(f"Blocking {len(BLOCKED_URL_PATTERNS)} resource URL patterns via CDP")
+        return True
+    except Exception as e:
+        debug_print(f"Could not block resources via CDP: {str(e)}")
+        return False
+
+def login_to_scinet(username, password, headless=False, bulk=False, session_dir=None, minimal_resources=None, page_load_strategy="normal"):
+    """
+    Login to sci-net.xyz with caching support
+    Set bulk=True for multi-DOI/multi-PDF jobs and minimal_resources=True to
+    skip images and fonts for single jobs too (see build_chrome_options)
+    page_load_strategy="eager" suits flows that wait for their own elements
+    session_dir is the persistent Chrome profile that keeps the session
+    between runs (default: chrome_user_data in the cache directory)
+    Returns driver instance if successful, None otherwise
+    """
+    # Use a subdirectory of the cache directory for Chrome user data
+    user_data_dir = session_dir or os.path.join(get_cache_directory(), "chrome_user_data")
+    os.makedirs(user_data_dir, exist_ok=True)
+    # A browser still quitting in the background may hold the profile lock
+    _join_quit_threads()
+    options = build_chrome_options(headless, user_data_dir, bulk, minimal_resources, page_load_strategy)
     
     debug_print("Initializing Chrome driver...")
     driver = build_chrome_driver(options, log=debug_print)
+    if minimal_resources is None:
+        minimal_resources = bulk
+    if minimal_resources:
+        block_heavy_resources(driver)
     
     try:
-        # Try to use cached login first
-        cache_data = load_login_cache()
-        login_success = False
+        # The persistent profile may still hold a valid session from an
+        # earlier run, in which case neither cookies nor credentials are needed
+        login_success = is_logged_in(driver)
+        if login_success:
+            print("Already logged in from the saved browser session!")
+        
+        # Try to use cached login next
+        cache_data = None if login_success else load_login_cache()
         
         if cache_data:
             print("Attempting to use cached login...")
@@ -597,55 +1136,36 @@ def login_to_scinet(username, password, headless=False):
         # If cache didn't work, perform fresh login
         if not login_success:
             print("Performing fresh login...")
+            # perform_login saves the login cache on success
             login_success = perform_login(driver, username, password)
-            # Save cache after successful login
-            if login_success:
-                save_login_cache(driver, username)
         
         # If login failed, ask user for manual input
         if not login_success:
             def timeout_handler(signum, frame):
-                print("\nTimeout: No input received within 30 seconds. Login failed.")
+                print(f"\nTimeout: No input received within {MANUAL_LOGIN_TIMEOUT} seconds. Login failed.")
                 raise TimeoutError("Login timeout")
             
             try:
                 print("\nLogin failed. Please enter credentials manually:")
                 
-                # Set up timeout signal (only on Unix-like systems)
-                if hasattr(signal, 'SIGALRM'):
-                    signal.signal(signal.SIGALRM, timeout_handler)
-                    signal.alarm(30)  # 30 second timeout
-                
-                manual_username = input("Username: ").strip()
-                manual_password = getpass.getpass("Password: ")
-                
-                # Cancel the alarm (only on Unix-like systems)
-                if hasattr(signal, 'alarm'):
-                    signal.alarm(0)
+                # getpass reads the terminal directly, so only SIGALRM can
+                # interrupt these prompts
+                with _input_timeout(MANUAL_LOGIN_TIMEOUT, timeout_handler):
+                    manual_username = input("Username: ").strip()
+                    manual_password = getpass.getpass("Password: ")
                 
                 if manual_username and manual_password:
                     print("Attempting login with manually entered credentials...")
                     login_success = perform_login(driver, manual_username, manual_password)
-                    # Save cache after successful manual login
-                    if login_success:
-                        save_login_cache(driver, manual_username)
                 else:
                     print("Error: Username or password is empty")
                     
             except (KeyboardInterrupt, TimeoutError):
-                if hasattr(signal, 'alarm'):
-                    signal.alarm(0)  # Cancel alarm
                 print("\nLogin cancelled or timeout. Operation aborted.")
                 login_success = False
             except Exception as manual_error:
-                if hasattr(signal, 'alarm'):
-                    signal.alarm(0)  # Cancel alarm
                 print(f"Error during manual login: {str(manual_error)}")
                 login_success = False
-            finally:
-                # Make sure alarm is always cancelled (only on Unix-like systems)
-                if hasattr(signal, 'alarm'):
-                    signal.alarm(0)
         
         if login_success:
             return driver
@@ -659,246 +1179,568 @@ def login_to_scinet(username, password, headless=False):
         driver.quit()
         return None
 
-def upload_pdf_to_scinet(driver, pdf_path, headless=False):
+def _open_cached_driver(cache_data, headless, slot):
     """
-    Upload a PDF file to sci-net.xyz using an authenticated driver session
+    Open an extra Chrome driver on its own persistent profile and make sure
+    it is logged in, falling back to the login cache
+
+    Args:
+        cache_data: Login cache data from load_login_cache()
+        headless: Whether to run browser in headless mode
+        slot: Pool slot number, used to pick the profile directory
+
+    Returns:
+        WebDriver: Logged-in driver, or None if it could not be logged in
     """
+    # Chrome locks a profile to a single process, so every slot gets its
+    # own directory; keeping them between runs keeps their caches warm
+    profile_dir = os.path.join(get_cache_directory(), f"chrome_user_data_pool_{slot}")
+    os.makedirs(profile_dir, exist_ok=True)
     try:
-        # Check if PDF file exists
-        if not os.path.exists(pdf_path):
-            print(f"Error: PDF file not found at {pdf_path}")
-            return False
-        
-        debug_print(f"PDF file found at {pdf_path}")
-        debug_print(f"File size: {os.path.getsize(pdf_path)} bytes")
-        
-        # Navigate to upload page
-        print("Navigating to upload page...")
-        driver.get("https://sci-net.xyz/upload")
-        debug_print(f"Current URL: {driver.current_url}")
-        
-        print("Uploading PDF file...")
-        # Wait for the upload pool to be available
-        debug_print("Looking for upload pool element...")
-        WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.ID, "pool"))
-        )
-        debug_print("Upload pool element found")
-        
-        # Try to find existing file input or create one
-        debug_print("Looking for file input element...")
+        driver = build_chrome_driver(build_chrome_options(headless, profile_dir, bulk=True), log=debug_print)
+    except Exception as e:
+        debug_print(f"Failed to start pooled browser: {str(e)}")
+        return None
+    block_heavy_resources(driver)
+
+    if is_logged_in(driver):
+        return driver
+    if apply_login_cache(driver, cache_data) and is_logged_in(driver):
+        return driver
+
+    debug_print("Pooled browser could not reuse the login cache")
+    driver.quit()
+    return None
+
+# Threads started by quit_driver_in_background(), joined before the next
+# login and at interpreter exit
+_quit_threads = []
+_quit_threads_lock = threading.Lock()
+
+def _join_quit_threads():
+    """Wait (up to DRIVER_QUIT_JOIN_TIMEOUT each) for browsers still shutting down"""
+    with _quit_threads_lock:
+        threads = list(_quit_threads)
+        _quit_threads.clear()
+    for thread in threads:
+        thread.join(timeout=DRIVER_QUIT_JOIN_TIMEOUT)
+
+atexit.register(_join_quit_threads)
+
+def quit_driver_in_background(driver):
+    """
+    Quit a driver on a daemon thread so the caller does not wait for Chrome to exit
+
+    The thread is joined (with DRIVER_QUIT_JOIN_TIMEOUT) when the interpreter
+    exits, so the browser is not left running after the program ends.
+
+    Args:
+        driver: Selenium WebDriver instance to quit
+    """
+    def quit_driver():
         try:
-            file_input = driver.find_element(By.CSS_SELECTOR, "input[type='file']")
-            debug_print("Found existing file input")
-        except:
-            debug_print("Creating file input via JavaScript...")
-            driver.execute_script("""
-                var input = document.createElement('input');
-                input.type = 'file';
-                input.accept = '.pdf';
-                input.multiple = false;
-                input.style.position = 'absolute';
-                input.style.left = '-9999px';
-                input.id = 'selenium-file-input';
-                document.body.appendChild(input);
-            """)
-            file_input = driver.find_element(By.ID, "selenium-file-input")
-        
-        # Send file to the input
-        debug_print("Sending file to input...")
-        abs_path = os.path.abspath(pdf_path)
-        debug_print(f"Absolute file path: {abs_path}")
-        file_input.send_keys(abs_path)
-        
-        # Trigger the upload using the site's upload mechanism
-        debug_print("Triggering upload via JavaScript...")
-        result = driver.execute_script("""
-            var input = document.getElementById('selenium-file-input') || document.querySelector('input[type="file"]');
-            var files = input.files;
-            console.log('Files found:', files.length);
-            
-            if (files.length > 0) {
-                var file = files[0];
-                console.log('Processing file:', file.name, 'size:', file.size);
-                
-                // Check if uploads object exists
-                if (typeof uploads === 'undefined') {
-                    window.uploads = {};
-                }
-                
-                // Check if article class exists
-                if (typeof article !== 'undefined') {
-                    if (!(file.name in uploads)) {
-                        console.log('Starting upload for:', file.name);
-                        var articleInstance = new article(file);
-                        articleInstance.upload();
-                        return 'Upload initiated for ' + file.name;
-                    } else {
-                        return 'File already in uploads: ' + file.name;
-                    }
-                } else {
-                    // Fallback: trigger change event on file input
-                    var event = new Event('change', { bubbles: true });
-                    input.dispatchEvent(event);
-                    return 'Triggered change event on file input';
-                }
-            } else {
-                return 'No files found in input';
-            }
-        """)
-        debug_print(f"JavaScript execution result: {result}")
-        
-        # Calculate wait time based on file size
-        file_size_mb = os.path.getsize(pdf_path) / (1024 * 1024)
-        wait_time = max(10, min(120, int(file_size_mb * 5)))
-        
-        debug_print(f"File size: {file_size_mb:.2f} MB, waiting {wait_time} seconds...")
-        time.sleep(wait_time)
-        debug_print(f"{wait_time} second wait completed, checking upload status...")
-        
-        # Check for upload status and messages
+            driver.quit()
+        except Exception as e:
+            debug_print(f"Failed to quit browser: {str(e)}")
+
+    thread = threading.Thread(target=quit_driver, daemon=True)
+    with _quit_threads_lock:
+        # Forget threads that have already finished
+        _quit_threads[:] = [t for t in _quit_threads if t.is_alive()]
+        _quit_threads.append(thread)
+    thread.start()
+
+class BrowserPool:
+    """
+    Pool of authenticated Chrome drivers for running SciNet jobs concurrently.
+
+    The caller's logged-in driver is always part of the pool and is never quit
+    by it. Extra drivers run on persistent per-slot profiles and are logged in
+    from the login cache when their own session has expired.
+    """
+
+    def __init__(self, driver, size=DEFAULT_BROWSER_POOL_SIZE, headless=True):
+        if size > MAX_BROWSER_POOL_SIZE:
+            print(f"Limiting browser pool to {MAX_BROWSER_POOL_SIZE} browsers")
+            size = MAX_BROWSER_POOL_SIZE
+        self._available = queue.Queue()
+        self._extra = []
+        self._available.put(driver)
+
+        cache_data = load_login_cache() if size > 1 else None
+        if size > 1 and not cache_data:
+            print("No login cache available, using a single browser")
+        elif size > 1:
+            print(f"Starting {size - 1} additional browser(s)...")
+            for slot in range(1, size):
+                extra = _open_cached_driver(cache_data, headless, slot)
+                if extra is None:
+                    break
+                self._extra.append(extra)
+                self._available.put(extra)
+        self.size = 1 + len(self._extra)
+
+    @contextlib.contextmanager
+    def acquire(self):
+        """Borrow a driver from the pool, blocking until one is free"""
+        driver = self._available.get()
         try:
-            # Check for notice messages
-            found_messages = driver.find_elements(By.CSS_SELECTOR, ".found")
-            for msg in found_messages:
-                if msg.is_displayed():
-                    message_text = msg.text.strip()
-                    if message_text:
-                        print(f"Notice: {message_text}")
-            
-            # Check for error messages
-            error_messages = driver.find_elements(By.CSS_SELECTOR, ".error")
-            for error in error_messages:
-                if error.is_displayed():
-                    error_text = error.text.strip()
-                    if error_text:
-                        print(f"Error: {error_text}")
-            
-        except Exception as save_error:
-            debug_print(f"Error checking upload status: {str(save_error)}")
-        
-        return True
-            
-    except Exception as e:
-        print(f"Upload error: {str(e)}")
-        debug_print(f"Current URL when error occurred: {driver.current_url}")
-        debug_print(f"Page title: {driver.title}")
-        # Take a screenshot for debugging if not headless
-        if not headless:
-            try:
-                screenshot_path = "debug_screenshot.png"
-                driver.save_screenshot(screenshot_path)
-                debug_print(f"Screenshot saved to {screenshot_path}")
-            except:
-                debug_print("Could not save screenshot")
+            yield driver
+        finally:
+            self._available.put(driver)
+
+    def close(self):
+        """Quit the extra drivers in the background, all at the same time"""
+        for driver in self._extra:
+            quit_driver_in_background(driver)
+        self._extra = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
         return False
 
-def upload_multiple_pdfs_to_scinet(driver, pdf_paths, headless=False):
+class TokenBucket:
+    """
+    Token bucket limiting how often SciNet jobs are started.
+
+    acquire() only sleeps for the part of the interval that the previous job
+    has not already used up, so slow uploads and DOI searches are followed
+    immediately by the next one. Safe to share between pool threads.
+    """
+
+    def __init__(self, rate=DEFAULT_JOB_RATE, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available"""
+        if not self.rate or self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens < 1:
+                delay_seconds = (1 - self._tokens) / self.rate
+                debug_print(f"Rate limit: waiting {delay_seconds:.1f} seconds before next job...")
+                time.sleep(delay_seconds)
+                self._last = time.monotonic()
+                self._tokens = 1
+            self._tokens -= 1
+
+def _direct_upload_pdf(driver, pdf_path):
     """
-    Upload multiple PDF files to sci-net.xyz using an authenticated driver session
-    
+    POST a PDF straight to DIRECT_UPLOAD_URL with the driver's session cookies
+
     Args:
         driver: Selenium WebDriver instance (already logged in)
-        pdf_paths: List of paths to PDF files to upload
-        headless: Whether running in headless mode (for debugging)
-    
+        pdf_path: Path to the PDF file to upload
+
     Returns:
-        dict: Summary of upload results
+        bool: True if the server accepted the upload, False to fall back to
+        the browser-driven upload
     """
-    if not pdf_paths:
-        print("No PDF files provided for upload")
-        return {
-            'total_files': 0,
-            'successful_uploads': 0,
-            'failed_uploads': 0,
-            'results': []
-        }
-    
-    print(f"Starting upload of {len(pdf_paths)} PDF files...")
+    cookies = {cookie['name']: cookie['value'] for cookie in driver.get_cookies()}
+    headers = {
+        'User-Agent': driver.execute_script("return navigator.userAgent;"),
+        'Referer': "https://sci-net.xyz/upload",
+    }
+    try:
+        with open(pdf_path, 'rb') as f:
+            response = _SESSION.post(
+                DIRECT_UPLOAD_URL,
+                files={'file': (os.path.basename(pdf_path), f, 'application/pdf')},
+                cookies=cookies,
+                headers=headers,
+                timeout=DOWNLOAD_TIMEOUT,
+            )
+    except requests.RequestException as e:
+        debug_print(f"Direct upload failed: {str(e)}")
+        return False
+
+    if response.status_code != 200:
+        debug_print(f"Direct upload returned HTTP {response.status_code}, falling back to browser upload")
+        return False
+
+    try:
+        payload = response.json()
+    except ValueError:
+        debug_print("Direct upload returned a non-JSON response, falling back to browser upload")
+        return False
+
+    if isinstance(payload, dict) and payload.get('error'):
+        print(f"Error: {payload['error']}")
+        return False
+
+    print(f"Uploaded {os.path.basename(pdf_path)} directly")
+    debug_print(f"Direct upload response: {payload}")
+    return True
+
+def submit_upload(driver, pdf_path):
+    """
+    Hand a PDF to the sci-net.xyz upload page without waiting for the result
     
-    results = []
-    successful_uploads = 0
-    failed_uploads = 0
-    all_notices = []
+    Args:
+        driver: Selenium WebDriver instance (already logged in)
+        pdf_path: Path to the PDF file to upload
     
-    for i, pdf_path in enumerate(pdf_paths, 1):
-        print(f"\n--- Uploading file {i}/{len(pdf_paths)} ---")
-        print(f"File: {os.path.basename(pdf_path)}")
-        
-        # Check if file exists before attempting upload
-        if not os.path.exists(pdf_path):
-            result = {
-                'file_path': pdf_path,
-                'file_name': os.path.basename(pdf_path),
-                'success': False,
-                'error': f'File not found: {pdf_path}',
-                'file_size': 0,
-                'notices': []
+    Returns:
+        str: What the page's upload script reported
+    """
+    # Navigate to upload page
+    print("Navigating to upload page...")
+    driver.get("https://sci-net.xyz/upload")
+    debug_print(f"Current URL: {driver.current_url}")
+    
+    print("Uploading PDF file...")
+    # Wait for the upload pool to be available
+    debug_print("Looking for upload pool element...")
+    WebDriverWait(driver, 10).until(
+        EC.element_to_be_clickable((By.ID, "pool"))
+    )
+    debug_print("Upload pool element found")
+    
+    # Try to find existing file input or create one
+    debug_print("Looking for file input element...")
+    try:
+        file_input = driver.find_element(By.CSS_SELECTOR, "input[type='file']")
+        debug_print("Found existing file input")
+    except:
+        debug_print("Creating file input via JavaScript...")
+        driver.execute_script("""
+            var input = document.createElement('input');
+            input.type = 'file';
+            input.accept = '.pdf';
+            input.multiple = false;
+            input.style.position = 'absolute';
+            input.style.left = '-9999px';
+            input.id = 'selenium-file-input';
+            document.body.appendChild(input);
+        """)
+        file_input = driver.find_element(By.ID, "selenium-file-input")
+    
+    # Send file to the input
+    debug_print("Sending file to input...")
+    abs_path = os.path.abspath(pdf_path)
+    debug_print(f"Absolute file path: {abs_path}")
+    file_input.send_keys(abs_path)
+    
+    # Trigger the upload using the site's upload mechanism
+    debug_print("Triggering upload via JavaScript...")
+    result = driver.execute_script("""
+        var input = document.getElementById('selenium-file-input') || document.querySelector('input[type="file"]');
+        var files = input.files;
+        console.log('Files found:', files.length);
+        
+        if (files.length > 0) {
+            var file = files[0];
+            console.log('Processing file:', file.name, 'size:', file.size);
+            
+            // Check if uploads object exists
+            if (typeof uploads === 'undefined') {
+                window.uploads = {};
             }
-            results.append(result)
-            failed_uploads += 1
-            print(f"✗ Error: File not found - {pdf_path}")
-            continue
+            
+            // Check if article class exists
+            if (typeof article !== 'undefined') {
+                if (!(file.name in uploads)) {
+                    console.log('Starting upload for:', file.name);
+                    var articleInstance = new article(file);
+                    articleInstance.upload();
+                    return 'Upload initiated for ' + file.name;
+                } else {
+                    return 'File already in uploads: ' + file.name;
+                }
+            } else {
+                // Fallback: trigger change event on file input
+                var event = new Event('change', { bubbles: true });
+                input.dispatchEvent(event);
+                return 'Triggered change event on file input';
+            }
+        } else {
+            return 'No files found in input';
+        }
+    """)
+    debug_print(f"JavaScript execution result: {result}")
+    return result
+
+def wait_for_upload(driver):
+    """
+    Wait until the upload page reports a result for the submitted upload
+    
+    Args:
+        driver: Selenium WebDriver instance on the upload page
+    
+    Returns:
+        bool: True if the page reported a result, False on timeout
+    """
+    # Wait until the site reports a result for the upload instead of
+    # sleeping for a size-based guess
+    debug_print(f"Waiting up to {UPLOAD_WAIT_TIMEOUT} seconds for upload to finish...")
+    try:
+        WebDriverWait(driver, UPLOAD_WAIT_TIMEOUT, poll_frequency=0.5).until(
+            lambda d: d.execute_script(UPLOAD_FINISHED_JS)
+        )
+        debug_print("Upload finished, checking upload status...")
+        return True
+    except TimeoutException:
+        debug_print(f"No upload result after {UPLOAD_WAIT_TIMEOUT} seconds, checking upload status...")
+        return False
+
+def collect_upload_notices(driver):
+    """
+    Read the notices and errors currently shown on the upload page
+    
+    Args:
+        driver: Selenium WebDriver instance on the upload page
+    
+    Returns:
+        list: Notice texts in page order; errors are prefixed with "Error: "
+    """
+    # The set keeps the duplicate check constant-time while the list keeps
+    # page order
+    notices = []
+    seen_notices = set()
+    try:
+        # Visibility and text are read in one script call rather than an
+        # is_displayed()/text round trip per element
+        shown = driver.execute_script(UPLOAD_NOTICES_JS) or {}
+        
+        # Check for notice messages
+        for message_text in shown.get('found', []):
+            if message_text and message_text not in seen_notices:
+                seen_notices.add(message_text)
+                notices.append(message_text)
+        
+        # Check for error messages
+        for error_text in shown.get('error', []):
+            if not error_text:
+                continue
+            error_notice = "Error: " + error_text
+            if error_notice not in seen_notices:
+                seen_notices.add(error_notice)
+                notices.append(error_notice)
+    except Exception as notice_error:
+        debug_print(f"Error checking upload status: {str(notice_error)}")
+    return notices
+
+def _upload_pdf(driver, pdf_path, headless=False):
+    """
+    Upload a PDF and read the page's notices once
+
+    Returns:
+        tuple: (success, notices)
+    """
+    try:
+        # Check if PDF file exists (one stat for existence and size)
+        try:
+            pdf_stat = os.stat(pdf_path)
+        except FileNotFoundError:
+            print(f"Error: PDF file not found at {pdf_path}")
+            return False, []
         
-        # Get file size for reporting
-        file_size = os.path.getsize(pdf_path)
-        file_size_mb = file_size / (1024 * 1024)
+        debug_print(f"PDF file found at {pdf_path}")
+        debug_print(f"File size: {pdf_stat.st_size} bytes")
         
-        # Use the existing upload_pdf_to_scinet function
-        upload_success = upload_pdf_to_scinet(driver, pdf_path, headless)
+        # Post the file directly when an upload endpoint is configured
+        if DIRECT_UPLOAD_URL and _direct_upload_pdf(driver, pdf_path):
+            return True, []
         
-        # Capture any notices after upload attempt
-        file_notices = []
-        try:
-            # Check for notice messages
-            found_messages = driver.find_elements(By.CSS_SELECTOR, ".found")
-            for msg in found_messages:
-                if msg.is_displayed():
-                    message_text = msg.text.strip()
-                    if message_text and message_text not in file_notices:
-                        file_notices.append(message_text)
-                        all_notices.append(f"{os.path.basename(pdf_path)}: {message_text}")
-            
-            # Check for error messages
-            error_messages = driver.find_elements(By.CSS_SELECTOR, ".error")
-            for error in error_messages:
-                if error.is_displayed():
-                    error_text = error.text.strip()
-                    if error_text and error_text not in file_notices:
-                        file_notices.append(f"Error: {error_text}")
-                        all_notices.append(f"{os.path.basename(pdf_path)}: Error: {error_text}")
-        except Exception as notice_error:
-            debug_print(f"Error capturing notices for {pdf_path}: {str(notice_error)}")
+        submit_upload(driver, pdf_path)
+        wait_for_upload(driver)
         
-        result = {
+        # Check for upload status and messages
+        notices = collect_upload_notices(driver)
+        for notice in notices:
+            print(notice if notice.startswith("Error: ") else f"Notice: {notice}")
+        
+        return True, notices
+            
+    except Exception as e:
+        print(f"Upload error: {str(e)}")
+        debug_print(f"Current URL when error occurred: {driver.current_url}")
+        debug_print(f"Page title: {driver.title}")
+        # Take a screenshot for debugging if not headless
+        if not headless:
+            try:
+                screenshot_path = "debug_screenshot.png"
+                driver.save_screenshot(screenshot_path)
+                debug_print(f"Screenshot saved to {screenshot_path}")
+            except:
+                debug_print("Could not save screenshot")
+        return False, collect_upload_notices(driver)
+
+def upload_pdf_to_scinet(driver, pdf_path, headless=False):
+    """
+    Upload a PDF file to sci-net.xyz using an authenticated driver session
+    """
+    upload_success, _ = _upload_pdf(driver, pdf_path, headless)
+    return upload_success
+
+def _upload_pdf_with_notices(driver, pdf_path, headless=False):
+    """
+    Upload one PDF and collect the notices the site shows for it
+
+    Returns:
+        dict: Upload result for the file
+    """
+    name = os.path.basename(pdf_path)
+    
+    # One stat call gives both existence and size
+    try:
+        file_size = os.stat(pdf_path).st_size
+    except FileNotFoundError:
+        print(f"✗ Error: File not found - {pdf_path}")
+        return {
             'file_path': pdf_path,
-            'file_name': os.path.basename(pdf_path),
-            'success': upload_success,
-            'error': None if upload_success else 'Upload failed (see previous error messages)',
+            'file_name': name,
+            'success': False,
+            'error': f'File not found: {pdf_path}',
+            'file_size': 0,
+            'notices': []
+        }
+    
+    # Reject empty and non-PDF files locally instead of letting the server do it
+    invalid_reason = None
+    if file_size == 0:
+        invalid_reason = f'Empty file: {pdf_path}'
+    else:
+        try:
+            with open(pdf_path, 'rb') as f:
+                if f.read(5) != PDF_MAGIC:
+                    invalid_reason = f'Not a PDF file: {pdf_path}'
+        except OSError as e:
+            invalid_reason = f'Could not read file: {str(e)}'
+    if invalid_reason:
+        print(f"✗ Error: {invalid_reason}")
+        return {
+            'file_path': pdf_path,
+            'file_name': name,
+            'success': False,
+            'error': invalid_reason,
             'file_size': file_size,
-            'file_size_mb': round(file_size_mb, 2),
-            'notices': file_notices
+            'notices': []
         }
-        
-        results.append(result)
-        
-        if upload_success:
-            successful_uploads += 1
-            print(f"✓ Successfully uploaded: {os.path.basename(pdf_path)} ({result['file_size_mb']} MB)")
+    
+    file_size_mb = file_size / (1024 * 1024)
+    
+    # Upload and read the page's notices in the same pass
+    upload_success, file_notices = _upload_pdf(driver, pdf_path, headless)
+    
+    result = {
+        'file_path': pdf_path,
+        'file_name': name,
+        'success': upload_success,
+        'error': None if upload_success else 'Upload failed (see previous error messages)',
+        'file_size': file_size,
+        'file_size_mb': round(file_size_mb, 2),
+        'notices': file_notices
+    }
+    
+    if upload_success:
+        print(f"✓ Successfully uploaded: {name} ({result['file_size_mb']} MB)")
+    else:
+        print(f"✗ Failed to upload: {name}")
+    
+    # Print notices for this file if any
+    if file_notices:
+        for notice in file_notices:
+            print(f"  Notice: {notice}")
+    
+    return result
+
+def _upload_pdfs_with_pool(pool, pdf_paths, headless=False, bucket=None):
+    """
+    Upload PDFs concurrently, one job per pooled driver, retrying failed
+    uploads with a linear backoff
+
+    Returns:
+        list: Upload results in the same order as pdf_paths
+    """
+    total = len(pdf_paths)
+
+    def upload_job(index, pdf_path):
+        name = os.path.basename(pdf_path)
+        for attempt in range(1, UPLOAD_RETRIES + 2):
+            with pool.acquire() as pooled_driver:
+                if bucket:
+                    bucket.acquire()
+                print(f"\n--- Uploading file {index}/{total}: {name} ---")
+                result = _upload_pdf_with_notices(pooled_driver, pdf_path, headless)
+            # Missing and invalid files come back without file_size_mb and are not retried
+            missing = 'file_size_mb' not in result
+            if result['success'] or missing or attempt > UPLOAD_RETRIES:
+                return result
+            backoff = UPLOAD_BACKOFF_SECONDS * attempt
+            print(f"Retrying {name} in {backoff} seconds...")
+            time.sleep(backoff)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=pool.size) as executor:
+        futures = [executor.submit(upload_job, i, pdf_path) for i, pdf_path in enumerate(pdf_paths, 1)]
+        return [future.result() for future in futures]
+
+def upload_multiple_pdfs_to_scinet(driver, pdf_paths, headless=False, workers=1, rate=DEFAULT_JOB_RATE, print_summary=True):
+    """
+    Upload multiple PDF files to sci-net.xyz using an authenticated driver session
+    
+    Args:
+        driver: Selenium WebDriver instance (already logged in)
+        pdf_paths: List of paths to PDF files to upload
+        headless: Whether running in headless mode (for debugging)
+        workers: Number of browsers to upload with concurrently (default: 1)
+        rate: Maximum uploads started per second (default: one every 3 seconds)
+        print_summary: Whether to print the summary block (default: True)
+    
+    Returns:
+        dict: Summary of upload results
+    """
+    if not pdf_paths:
+        print("No PDF files provided for upload")
+        return {
+            'total_files': 0,
+            'successful_uploads': 0,
+            'failed_uploads': 0,
+            'results': []
+        }
+    
+    print(f"Starting upload of {len(pdf_paths)} PDF files...")
+    
+    # Space out uploads to avoid overwhelming the server
+    bucket = TokenBucket(rate)
+    if workers > 1 and len(pdf_paths) > 1:
+        with BrowserPool(driver, min(workers, len(pdf_paths)), headless) as pool:
+            print(f"Uploading with {pool.size} browser(s)")
+            results = _upload_pdfs_with_pool(pool, pdf_paths, headless, bucket)
+    else:
+        results = []
+        for i, pdf_path in enumerate(pdf_paths, 1):
+            bucket.acquire()
+            print(f"\n--- Uploading file {i}/{len(pdf_paths)} ---")
+            print(f"File: {os.path.basename(pdf_path)}")
+            results.append(_upload_pdf_with_notices(driver, pdf_path, headless))
+    
+    # Split the results, total the sizes and collect notices in one pass
+    successful_results = []
+    failed_results = []
+    all_notices = []
+    total_size_mb = 0
+    for result in results:
+        if result['success']:
+            successful_results.append(result)
+            total_size_mb += result['file_size_mb']
         else:
-            failed_uploads += 1
-            print(f"✗ Failed to upload: {os.path.basename(pdf_path)}")
-        
-        # Print notices for this file if any
-        if file_notices:
-            for notice in file_notices:
-                print(f"  Notice: {notice}")
-        
-        # Add delay between uploads to avoid overwhelming the server
-        if i < len(pdf_paths):
-            delay_seconds = 3
-            print(f"Waiting {delay_seconds} seconds before next upload...")
-            time.sleep(delay_seconds)
+            failed_results.append(result)
+        if result['notices']:
+            prefix = result['file_name'] + ": "
+            all_notices.extend(prefix + notice for notice in result['notices'])
+    successful_uploads = len(successful_results)
+    failed_uploads = len(failed_results)
     
     # Summary
     summary = {
@@ -910,40 +1752,40 @@ def upload_multiple_pdfs_to_scinet(driver, pdf_paths, headless=False):
         'timestamp': datetime.now().isoformat()
     }
     
-    print(f"\n{'='*80}")
-    print(f"MULTIPLE PDF UPLOAD SUMMARY")
-    print(f"{'='*80}")
-    print(f"Total files processed: {summary['total_files']}")
-    print(f"Successful uploads: {summary['successful_uploads']}")
-    print(f"Failed uploads: {summary['failed_uploads']}")
-    
-    if successful_uploads > 0:
-        print(f"\nSuccessfully uploaded files:")
-        total_size_mb = 0
-        for result in results:
-            if result['success']:
-                print(f"  ✓ {result['file_name']} ({result['file_size_mb']} MB)")
-                total_size_mb += result['file_size_mb']
-        print(f"  Total size uploaded: {round(total_size_mb, 2)} MB")
-    
-    if failed_uploads > 0:
-        print(f"\nFailed uploads:")
-        for result in results:
-            if not result['success']:
-                print(f"  ✗ {result['file_name']}")
+    # Callers that only need the returned dict can skip the formatting
+    if print_summary:
+        lines = [
+            f"\n{'='*80}",
+            "MULTIPLE PDF UPLOAD SUMMARY",
+            f"{'='*80}",
+            f"Total files processed: {summary['total_files']}",
+            f"Successful uploads: {successful_uploads}",
+            f"Failed uploads: {failed_uploads}",
+        ]
+    
+        if successful_results:
+            lines.append("\nSuccessfully uploaded files:")
+            lines.extend(f"  ✓ {result['file_name']} ({result['file_size_mb']} MB)" for result in successful_results)
+            lines.append(f"  Total size uploaded: {round(total_size_mb, 2)} MB")
+    
+        if failed_results:
+            lines.append("\nFailed uploads:")
+            for result in failed_results:
+                lines.append(f"  ✗ {result['file_name']}")
                 if result['error']:
-                    print(f"    Error: {result['error']}")
+                    lines.append(f"    Error: {result['error']}")
     
-    if all_notices:
-        print(f"\nNotices received during upload:")
-        for notice in all_notices:
-            print(f"  • {notice}")
+        if all_notices:
+            lines.append("\nNotices received during upload:")
+            lines.extend(f"  • {notice}" for notice in all_notices)
     
-    print(f"{'='*80}")
+        lines.append(f"{'='*80}")
+        # One write for the whole block instead of a print per line
+        sys.stdout.write("\n".join(lines) + "\n")
     
     return summary
 
-def login_and_upload_multiple_pdfs(username, password, pdf_paths, headless=False):
+def login_and_upload_multiple_pdfs(username, password, pdf_paths, headless=True, workers=1, rate=DEFAULT_JOB_RATE):
     """
     Login to sci-net.xyz and upload multiple PDF files with caching support
     
@@ -951,21 +1793,23 @@ def login_and_upload_multiple_pdfs(username, password, pdf_paths, headless=False
         username: Username for login
         password: Password for login
         pdf_paths: List of paths to PDF files to upload
-        headless: Whether to run browser in headless mode
+        headless: Whether to run browser in headless mode (default: True)
+        workers: Number of browsers to upload with concurrently (default: 1)
+        rate: Maximum uploads started per second (default: one every 3 seconds)
     
     Returns:
         dict: Summary of upload results, or None if login failed
     """
-    driver = login_to_scinet(username, password, headless)
+    driver = login_to_scinet(username, password, headless, bulk=True)
     if not driver:
         return None
     
     try:
-        summary = upload_multiple_pdfs_to_scinet(driver, pdf_paths, headless)
+        summary = upload_multiple_pdfs_to_scinet(driver, pdf_paths, headless, workers, rate)
         return summary
     finally:
         print("Multiple PDF upload process completed, closing browser.")
-        driver.quit()
+        quit_driver_in_background(driver)
 
 def login_and_upload_pdf(username, password, pdf_path, headless=False):
     """
@@ -980,7 +1824,7 @@ def login_and_upload_pdf(username, password, pdf_path, headless=False):
         return success
     finally:
         print("PDF upload process completed, closing browser.")
-        driver.quit()
+        quit_driver_in_background(driver)
         
 def upload_pdf_to_scinet_simple(filepath, verbose=False):
     """
@@ -1001,11 +1845,10 @@ def upload_pdf_to_scinet_simple(filepath, verbose=False):
         cache_data = None
         if os.path.exists(CACHE_FILE):
             try:
-                with open(CACHE_FILE, 'rb') as f:
-                    cache_data = pickle.load(f)
+                cache_data = read_login_cache_file()
                 if isinstance(cache_data, dict) and 'timestamp' in cache_data:
                     cache_age = datetime.now() - cache_data['timestamp']
-                    if cache_age <= timedelta(hours=CACHE_DURATION_HOURS):
+                    if cache_age <= _CACHE_TTL:
                         # Use cached username if available
                         username = cache_data.get('username', USERNAME)
                         password = PASSWORD  # Password not needed if cache is valid
@@ -1042,7 +1885,7 @@ def upload_pdf_to_scinet_simple(filepath, verbose=False):
     finally:
         VERBOSE = old_verbose
 
-def login_and_upload_directory_pdfs(username, password, directory_path, recursive=False, headless=False):
+def login_and_upload_directory_pdfs(username, password, directory_path, recursive=False, headless=True, workers=1, rate=DEFAULT_JOB_RATE):
     """
     Login to sci-net.xyz and upload all PDF files from a directory
     
@@ -1051,7 +1894,9 @@ def login_and_upload_directory_pdfs(username, password, directory_path, recursiv
         password: Password for login
         directory_path: Path to the directory containing PDF files
         recursive: Whether to search subdirectories recursively
-        headless: Whether to run browser in headless mode
+        headless: Whether to run browser in headless mode (default: True)
+        workers: Number of browsers to upload with concurrently (default: 1)
+        rate: Maximum uploads started per second (default: one every 3 seconds)
     
     Returns:
         dict: Summary of upload results
@@ -1075,7 +1920,23 @@ def login_and_upload_directory_pdfs(username, password, directory_path, recursiv
     if recursive:
         print("Including subdirectories in search")
     
-    return login_and_upload_multiple_pdfs(username, password, pdf_files, headless)
+    return login_and_upload_multiple_pdfs(username, password, pdf_files, headless, workers, rate)
+
+def availability_summary(availability):
+    """
+    Describe where a searched paper is available, e.g. "Sci Hub, Arxiv"
+    
+    Args:
+        availability: The 'availability' dict of a request_paper_by_doi result
+    
+    Returns:
+        str: Comma-separated source names, or an empty string
+    """
+    return ", ".join(
+        source.replace('_', ' ').title()
+        for source, info in availability.items()
+        if info.get('available') or info.get('already_requested')
+    )
 
 def request_paper_by_doi(driver, doi, wait_seconds=50, reward_tokens=1):
     """
@@ -1113,9 +1974,16 @@ def request_paper_by_doi(driver, doi, wait_seconds=50, reward_tokens=1):
         debug_print("Clicking search button...")
         search_button.click()
         
-        # Wait for the specified time for results to load
-        debug_print(f"Waiting {wait_seconds} seconds for results...")
-        time.sleep(wait_seconds)
+        # Wait until search results are shown, up to wait_seconds
+        debug_print(f"Waiting up to {wait_seconds} seconds for results...")
+        try:
+            WebDriverWait(driver, wait_seconds).until(EC.any_of(
+                EC.visibility_of_element_located((By.CSS_SELECTOR, ".found")),
+                EC.visibility_of_element_located((By.CSS_SELECTOR, ".preview")),
+                EC.visibility_of_element_located((By.CSS_SELECTOR, ".error"))
+            ))
+        except TimeoutException:
+            debug_print(f"No results shown after {wait_seconds} seconds")
         
         # Capture the current page state/output
         try:
@@ -1129,194 +1997,89 @@ def request_paper_by_doi(driver, doi, wait_seconds=50, reward_tokens=1):
                 'availability': {}
             }
             
-            # Check for different availability sources in the .found container
-            found_container = driver.find_element(By.CSS_SELECTOR, ".found")
-            
-            # Check for Sci-Hub availability
-            try:
-                sci_hub_element = found_container.find_element(By.CSS_SELECTOR, ".sci-hub")
-                if sci_hub_element.is_displayed():
-                    sci_hub_link = sci_hub_element.get_attribute("href")
-                    result_data['availability']['sci_hub'] = {
-                        'available': True,
-                        'link': sci_hub_link,
-                        'message': sci_hub_element.text.strip()
-                    }
-                    print("Found: Paper available on Sci-Hub")
-            except:
-                pass
-            
-            # Check for Open Access availability
-            try:
-                oa_element = found_container.find_element(By.CSS_SELECTOR, ".openaccess")
-                if oa_element.is_displayed():
-                    oa_link = oa_element.get_attribute("href")
-                    result_data['availability']['open_access'] = {
-                        'available': True,
-                        'link': oa_link,
-                        'message': oa_element.text.strip()
-                    }
-                    print("Found: Paper is open access")
-            except:
-                pass
-            
-            # Check for arXiv availability
-            try:
-                arxiv_element = found_container.find_element(By.CSS_SELECTOR, ".arxiv")
-                if arxiv_element.is_displayed():
-                    arxiv_link = arxiv_element.get_attribute("href")
-                    result_data['availability']['arxiv'] = {
-                        'available': True,
-                        'link': arxiv_link,
-                        'message': arxiv_element.text.strip()
-                    }
-                    print("Found: Paper available on arXiv")
-            except:
-                pass
-            
-            # Check for preprint availability
-            try:
-                preprint_element = found_container.find_element(By.CSS_SELECTOR, ".preprint")
-                if preprint_element.is_displayed():
-                    preprint_link = preprint_element.get_attribute("href")
-                    result_data['availability']['preprint'] = {
-                        'available': True,
-                        'link': preprint_link,
-                        'message': preprint_element.text.strip()
-                    }
-                    print("Found: Paper available as preprint")
-            except:
-                pass
-            
-            # Check if already posted on Sci-Net
-            try:
-                scinet_element = found_container.find_element(By.CSS_SELECTOR, ".sci-net")
-                if scinet_element.is_displayed():
-                    scinet_link_element = scinet_element.find_element(By.TAG_NAME, "a")
-                    scinet_link = scinet_link_element.get_attribute("href")
-                    result_data['availability']['sci_net'] = {
-                        'already_requested': True,
-                        'link': scinet_link,
-                        'message': scinet_element.text.strip()
-                    }
-                    print("Found: Paper already requested on Sci-Net")
-            except:
-                pass
+            # Read the whole result page in a single script call
+            scraped = driver.execute_script(SEARCH_RESULT_JS)
+            if scraped is None:
+                raise Exception("Search result container (.found) not found")
+            
+            availability = scraped.get('availability') or {}
+            found_messages = {
+                'sci_hub': "Found: Paper available on Sci-Hub",
+                'open_access': "Found: Paper is open access",
+                'arxiv': "Found: Paper available on arXiv",
+                'preprint': "Found: Paper available as preprint",
+                'sci_net': "Found: Paper already requested on Sci-Net",
+            }
+            for key, found_message in found_messages.items():
+                source = availability.get(key)
+                if not source:
+                    continue
+                status_key = 'already_requested' if key == 'sci_net' else 'available'
+                result_data['availability'][key] = {
+                    status_key: True,
+                    'link': source.get('link'),
+                    'message': source.get('message') or ''
+                }
+                print(found_message)
+            # Summarised once here so reports do not rebuild it per print
+            result_data['sources_summary'] = availability_summary(result_data['availability'])
             
-            # Extract paper information from preview section
-            try:
-                preview_section = driver.find_element(By.CSS_SELECTOR, ".preview")
-                
-                # Get year and journal
-                try:
-                    yejo_element = preview_section.find_element(By.CSS_SELECTOR, ".yejo")
-                    year = yejo_element.find_element(By.CSS_SELECTOR, ".year").text.strip()
-                    journal = yejo_element.find_element(By.CSS_SELECTOR, ".journal").text.strip()
-                    result_data['paper_info']['year'] = year
-                    result_data['paper_info']['journal'] = journal
-                except:
-                    pass
-                
-                # Get title
-                try:
-                    title_element = preview_section.find_element(By.CSS_SELECTOR, ".title a")
-                    title = title_element.text.strip()
-                    title_link = title_element.get_attribute("href")
-                    result_data['paper_info']['title'] = title
-                    result_data['paper_info']['title_link'] = title_link
-                except:
-                    pass
-                
-                # Get authors
-                try:
-                    authors_element = preview_section.find_element(By.CSS_SELECTOR, ".authors")
-                    authors = authors_element.text.strip()
-                    result_data['paper_info']['authors'] = authors
-                except:
-                    pass
-                
-                # Get abstract
-                try:
-                    abstract_element = preview_section.find_element(By.CSS_SELECTOR, ".abstract")
-                    abstract = abstract_element.text.strip()
-                    result_data['paper_info']['abstract'] = abstract
-                except:
-                    pass
-                
-                # Get publisher
-                try:
-                    publisher_element = preview_section.find_element(By.CSS_SELECTOR, ".publisher img")
-                    publisher_logo = publisher_element.get_attribute("src")
-                    publisher_title = publisher_element.get_attribute("title")
-                    result_data['paper_info']['publisher'] = {
-                        'name': publisher_title,
-                        'logo': publisher_logo
-                    }
-                except:
-                    pass
-                
-            except:
+            if scraped.get('paper_info') is not None:
+                result_data['paper_info'].update(scraped['paper_info'])
+            else:
                 debug_print("Could not find preview section")
             
             # Check for error messages
-            try:
-                error_element = driver.find_element(By.CSS_SELECTOR, ".error")
-                if error_element.is_displayed():
-                    error_text = error_element.text.strip()
-                    if error_text:
-                        result_data['messages'].append(f"Error: {error_text}")
-                        print(f"Error found: {error_text}")
-            except:
-                pass
+            error_text = scraped.get('error')
+            if error_text:
+                result_data['messages'].append(f"Error: {error_text}")
+                print(f"Error found: {error_text}")
             
             # Check if request section is available (paper can be requested)
-            try:
-                post_section = driver.find_element(By.CSS_SELECTOR, ".post")
-                if post_section.is_displayed():
-                    result_data['can_request'] = True
+            result_data['can_request'] = bool(scraped.get('can_request'))
+            reward_info = scraped.get('reward')
+            if result_data['can_request'] and reward_info:
+                try:
+                    default_reward = reward_info.get('default')
+                    max_reward = reward_info.get('max')
+                    result_data['request_info'] = {
+                        'default_reward': default_reward,
+                        'max_reward': max_reward
+                    }
                     
-                    # Get reward information
+                    # Use the specified reward tokens, but respect the max limit
+                    max_reward_int = int(max_reward) if max_reward else float('inf')
+                    final_reward = min(reward_tokens, max_reward_int)
+                    
+                    # Only the inputs we interact with are looked up through Selenium
+                    post_section = driver.find_element(By.CSS_SELECTOR, ".post")
+                    reward_input = post_section.find_element(By.ID, "reward")
+                    debug_print(f"Requested reward: {reward_tokens}, Max reward: {max_reward_int}, Setting reward to: {final_reward}")
+                    reward_input.clear()
+                    reward_input.send_keys(str(final_reward))
+                    result_data['request_info']['set_reward'] = final_reward
+                    
+                    # Click the request button
                     try:
-                        reward_input = post_section.find_element(By.ID, "reward")
-                        default_reward = reward_input.get_attribute("value")
-                        max_reward = reward_input.get_attribute("max")
-                        result_data['request_info'] = {
-                            'default_reward': default_reward,
-                            'max_reward': max_reward
-                        }
+                        request_button = post_section.find_element(By.CSS_SELECTOR, "button[onclick='request()']")
+                        debug_print("Clicking request button...")
+                        request_button.click()
+                        result_data['request_submitted'] = True
                         
-                        # Use the specified reward tokens, but respect the max limit
-                        max_reward_int = int(max_reward) if max_reward else float('inf')
-                        final_reward = min(reward_tokens, max_reward_int)
-                        
-                        debug_print(f"Requested reward: {reward_tokens}, Max reward: {max_reward_int}, Setting reward to: {final_reward}")
-                        reward_input.clear()
-                        reward_input.send_keys(str(final_reward))
-                        result_data['request_info']['set_reward'] = final_reward
-                        
-                        # Click the request button
+                        # Wait for the request form to go away once processed
                         try:
-                            request_button = post_section.find_element(By.CSS_SELECTOR, "button[onclick='request()']")
-                            debug_print("Clicking request button...")
-                            request_button.click()
-                            result_data['request_submitted'] = True
-                            
-                            # Wait a moment for the request to be processed
-                            time.sleep(3)
-                            debug_print("Request submitted successfully")
-                            
-                        except Exception as request_error:
-                            debug_print(f"Error clicking request button: {str(request_error)}")
-                            result_data['request_submitted'] = False
-                            result_data['request_error'] = str(request_error)
+                            WebDriverWait(driver, 3).until(EC.invisibility_of_element(post_section))
+                        except TimeoutException:
+                            pass
+                        debug_print("Request submitted successfully")
                         
-                    except Exception as reward_error:
-                        debug_print(f"Error processing reward input: {str(reward_error)}")
-                        pass
-                else:
-                    result_data['can_request'] = False
-            except:
-                result_data['can_request'] = False
+                    except Exception as request_error:
+                        debug_print(f"Error clicking request button: {str(request_error)}")
+                        result_data['request_submitted'] = False
+                        result_data['request_error'] = str(request_error)
+                    
+                except Exception as reward_error:
+                    debug_print(f"Error processing reward input: {str(reward_error)}")
             
             print(f"DOI search completed. Current URL: {driver.current_url}")
             if result_data['messages']:
@@ -1346,7 +2109,7 @@ def login_and_request_doi(username, password, doi, wait_seconds=50, reward_token
     Login to sci-net.xyz and request a paper by DOI
     Returns the search results
     """
-    driver = login_to_scinet(username, password, headless)
+    driver = login_to_scinet(username, password, headless, minimal_resources=True)
     if not driver:
         return None
     
@@ -1355,9 +2118,155 @@ def login_and_request_doi(username, password, doi, wait_seconds=50, reward_token
         return result
     finally:
         print("DOI search process completed, closing browser.")
-        driver.quit()
+        quit_driver_in_background(driver)
+
+def _request_doi_and_report(driver, index, total, doi, reward_tokens, wait_seconds):
+    """
+    Request one DOI and print how it went
 
-def request_multiple_papers_by_dois(driver, dois, wait_seconds=50, reward_tokens=1):
+    Returns:
+        dict: Result from request_paper_by_doi, or an error result
+    """
+    print(f"\n--- Requesting DOI {index}/{total} ---")
+    print(f"DOI: {doi}")
+    print(f"Reward tokens: {reward_tokens}")
+    
+    # Clean the DOI string
+    clean_doi = doi.strip()
+    if not clean_doi:
+        print(f"✗ Error: Empty DOI")
+        return {
+            'doi': doi,
+            'success': False,
+            'error': 'Empty DOI provided',
+            'timestamp': datetime.now().isoformat()
+        }
+    
+    # Use the existing request_paper_by_doi function
+    result = request_paper_by_doi(driver, clean_doi, wait_seconds, reward_tokens)
+    
+    if result and not result.get('error'):
+        print(f"✓ Successfully processed request for: {clean_doi}")
+        
+        # Print any availability information
+        availability = result.get('availability', {})
+        if availability:
+            for source, info in availability.items():
+                if info.get('available') or info.get('already_requested'):
+                    status = "already requested" if info.get('already_requested') else "available"
+                    print(f"  - {source.replace('_', ' ').title()}: {status}")
+        
+        # Print if request was submitted
+        if result.get('request_submitted'):
+            actual_reward = result.get('request_info', {}).get('set_reward', reward_tokens)
+            print(f"  - New request submitted with {actual_reward} reward token(s)")
+        elif result.get('can_request') == False:
+            print(f"  - Request not needed (paper already available or requested)")
+    else:
+        error_msg = result.get('error', 'Unknown error') if result else 'Request failed'
+        print(f"✗ Failed to process: {clean_doi}")
+        print(f"  Error: {error_msg}")
+    
+    return result
+
+def _run_doi_requests(driver, doi_reward_pairs, wait_seconds=50, workers=1, headless=True, rate=DEFAULT_JOB_RATE):
+    """
+    Request every (doi, reward_tokens) pair, either one after another on the
+    given driver or concurrently on a BrowserPool, starting at most rate
+    requests per second
+
+    Returns:
+        list: Results in the same order as doi_reward_pairs
+    """
+    total = len(doi_reward_pairs)
+    # Space out requests to avoid overwhelming the server
+    bucket = TokenBucket(rate)
+    
+    if workers > 1 and total > 1:
+        with BrowserPool(driver, min(workers, total), headless) as pool:
+            print(f"Requesting with {pool.size} browser(s)")
+            
+            def request_job(index, doi, reward_tokens):
+                with pool.acquire() as pooled_driver:
+                    bucket.acquire()
+                    return _request_doi_and_report(pooled_driver, index, total, doi, reward_tokens, wait_seconds)
+            
+            with concurrent.futures.ThreadPoolExecutor(max_workers=pool.size) as executor:
+                futures = [
+                    executor.submit(request_job, i, doi, reward_tokens)
+                    for i, (doi, reward_tokens) in enumerate(doi_reward_pairs, 1)
+                ]
+                return [future.result() for future in futures]
+    
+    results = []
+    for i, (doi, reward_tokens) in enumerate(doi_reward_pairs, 1):
+        bucket.acquire()
+        results.append(_request_doi_and_report(driver, i, total, doi, reward_tokens, wait_seconds))
+    return results
+
+def _print_doi_request_summary(summary, doi_reward_pairs):
+    """
+    Print the summary block for a multi-DOI request run
+
+    Args:
+        summary: Summary dict with total/successful/failed counts and results
+        doi_reward_pairs: List of (doi, reward_tokens) in the order of results
+    """
+    # Build the success and failure lines and the counters in one pass
+    success_lines = []
+    failure_lines = []
+    new_requests = 0
+    already_available = 0
+    total_tokens_used = 0
+    for (doi, reward_tokens), result in zip(doi_reward_pairs, summary['results']):
+        if not result:
+            continue
+        if result.get('error'):
+            failure_lines.append(f"  ✗ {doi} - {result['error']}")
+        elif result.get('request_submitted'):
+            new_requests += 1
+            actual_reward = result.get('request_info', {}).get('set_reward', reward_tokens)
+            total_tokens_used += actual_reward
+            success_lines.append(f"  ✓ {doi} - New request submitted ({actual_reward} tokens)")
+        else:
+            already_available += 1
+            sources = result.get('sources_summary')
+            if sources is None:
+                sources = availability_summary(result.get('availability', {}))
+            if sources:
+                success_lines.append(f"  ✓ {doi} - Available via: {sources}")
+            else:
+                success_lines.append(f"  ✓ {doi} - Processed successfully")
+    
+    lines = [
+        f"\n{'='*80}",
+        "MULTIPLE DOI REQUEST SUMMARY",
+        f"{'='*80}",
+        f"Total DOIs processed: {summary['total_dois']}",
+        f"Successful requests: {summary['successful_requests']}",
+        f"Failed requests: {summary['failed_requests']}",
+    ]
+    if summary.get('filtered_dois'):
+        lines.append(f"Skipped invalid/duplicate DOIs: {summary['filtered_dois']}")
+    
+    if success_lines:
+        lines.append("\nSuccessfully processed DOIs:")
+        lines.extend(success_lines)
+        if new_requests > 0:
+            lines.append(f"\n  New requests submitted: {new_requests}")
+            lines.append(f"  Total tokens used: {total_tokens_used}")
+        if already_available > 0:
+            lines.append(f"  Papers already available: {already_available}")
+    
+    if failure_lines:
+        lines.append("\nFailed requests:")
+        lines.extend(failure_lines)
+    
+    lines.append(f"{'='*80}")
+    # One write for the whole block instead of a print per line
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def request_multiple_papers_by_dois(driver, dois, wait_seconds=50, reward_tokens=1, workers=1, headless=True, rate=DEFAULT_JOB_RATE, print_summary=True):
     """
     Request multiple papers by their DOIs
     
@@ -1366,141 +2275,55 @@ def request_multiple_papers_by_dois(driver, dois, wait_seconds=50, reward_tokens
         dois: List of DOI strings to request
         wait_seconds: Seconds to wait for each DOI search results
         reward_tokens: Number of reward tokens to offer for each request
+        workers: Number of browsers to request with concurrently (default: 1)
+        headless: Whether the extra pooled browsers run headless (default: True)
+        rate: Maximum requests started per second (default: one every 3 seconds)
+        print_summary: Whether to print the summary block (default: True)
     
     Returns:
         dict: Summary of request results
     """
-    if not dois:
+    # Drop blank, malformed and repeated DOIs before any browser work
+    cleaned_dois = clean_doi_list(dois or [])
+    filtered_dois = len(dois or []) - len(cleaned_dois)
+    if filtered_dois:
+        print(f"Skipping {filtered_dois} invalid or duplicate DOI(s)")
+    
+    if not cleaned_dois:
         print("No DOIs provided for requesting")
         return {
             'total_dois': 0,
             'successful_requests': 0,
             'failed_requests': 0,
+            'filtered_dois': filtered_dois,
             'results': []
         }
     
-    print(f"Starting request process for {len(dois)} DOIs...")
+    print(f"Starting request process for {len(cleaned_dois)} DOIs...")
     
-    results = []
-    successful_requests = 0
-    failed_requests = 0
-    
-    for i, doi in enumerate(dois, 1):
-        print(f"\n--- Requesting DOI {i}/{len(dois)} ---")
-        print(f"DOI: {doi}")
-        
-        # Clean the DOI string
-        clean_doi = doi.strip()
-        if not clean_doi:
-            result = {
-                'doi': doi,
-                'success': False,
-                'error': 'Empty DOI provided',
-                'timestamp': datetime.now().isoformat()
-            }
-            results.append(result)
-            failed_requests += 1
-            print(f"✗ Error: Empty DOI")
-            continue
-        
-        # Use the existing request_paper_by_doi function
-        result = request_paper_by_doi(driver, clean_doi, wait_seconds, reward_tokens)
-        results.append(result)
-        
-        if result and not result.get('error'):
-            successful_requests += 1
-            print(f"✓ Successfully processed request for: {clean_doi}")
-            
-            # Print any availability information
-            availability = result.get('availability', {})
-            if availability:
-                for source, info in availability.items():
-                    if info.get('available') or info.get('already_requested'):
-                        status = "already requested" if info.get('already_requested') else "available"
-                        print(f"  - {source.replace('_', ' ').title()}: {status}")
-            
-            # Print if request was submitted
-            if result.get('request_submitted'):
-                reward = result.get('request_info', {}).get('set_reward', reward_tokens)
-                print(f"  - New request submitted with {reward} reward token(s)")
-            elif result.get('can_request') == False:
-                print(f"  - Request not needed (paper already available or requested)")
-        else:
-            failed_requests += 1
-            error_msg = result.get('error', 'Unknown error') if result else 'Request failed'
-            print(f"✗ Failed to process: {clean_doi}")
-            print(f"  Error: {error_msg}")
-        
-        # Add delay between requests to avoid overwhelming the server
-        if i < len(dois):
-            delay_seconds = 3
-            print(f"Waiting {delay_seconds} seconds before next request...")
-            time.sleep(delay_seconds)
+    doi_reward_pairs = [(doi, reward_tokens) for doi in cleaned_dois]
+    results = _run_doi_requests(driver, doi_reward_pairs, wait_seconds, workers, headless, rate)
+    successful_requests = sum(1 for result in results if result and not result.get('error'))
+    failed_requests = len(results) - successful_requests
     
     # Summary
     summary = {
-        'total_dois': len(dois),
+        'total_dois': len(cleaned_dois),
         'successful_requests': successful_requests,
         'failed_requests': failed_requests,
+        'filtered_dois': filtered_dois,
         'results': results,
         'reward_tokens_per_request': reward_tokens,
         'wait_seconds': wait_seconds,
         'timestamp': datetime.now().isoformat()
     }
     
-    print(f"\n{'='*80}")
-    print(f"MULTIPLE DOI REQUEST SUMMARY")
-    print(f"{'='*80}")
-    print(f"Total DOIs processed: {summary['total_dois']}")
-    print(f"Successful requests: {summary['successful_requests']}")
-    print(f"Failed requests: {summary['failed_requests']}")
-    
-    if successful_requests > 0:
-        print(f"\nSuccessfully processed DOIs:")
-        new_requests = 0
-        already_available = 0
-        
-        for result in results:
-            if result and not result.get('error'):
-                doi = result.get('doi', 'Unknown')
-                
-                if result.get('request_submitted'):
-                    new_requests += 1
-                    reward = result.get('request_info', {}).get('set_reward', reward_tokens)
-                    print(f"  ✓ {doi} - New request submitted ({reward} tokens)")
-                else:
-                    already_available += 1
-                    # Check what type of availability
-                    availability = result.get('availability', {})
-                    sources = []
-                    for source, info in availability.items():
-                        if info.get('available') or info.get('already_requested'):
-                            sources.append(source.replace('_', ' ').title())
-                    
-                    if sources:
-                        print(f"  ✓ {doi} - Available via: {', '.join(sources)}")
-                    else:
-                        print(f"  ✓ {doi} - Processed successfully")
-        
-        if new_requests > 0:
-            print(f"\n  New requests submitted: {new_requests}")
-            print(f"  Total tokens used: {new_requests * reward_tokens}")
-        if already_available > 0:
-            print(f"  Papers already available: {already_available}")
-    
-    if failed_requests > 0:
-        print(f"\nFailed requests:")
-        for result in results:
-            if result and result.get('error'):
-                doi = result.get('doi', 'Unknown')
-                error = result.get('error', 'Unknown error')
-                print(f"  ✗ {doi} - {error}")
-    
-    print(f"{'='*80}")
+    if print_summary:
+        _print_doi_request_summary(summary, doi_reward_pairs)
     
     return summary
 
-def login_and_request_multiple_dois(username, password, dois, wait_seconds=50, reward_tokens=1, headless=False):
+def login_and_request_multiple_dois(username, password, dois, wait_seconds=50, reward_tokens=1, headless=True, workers=1, rate=DEFAULT_JOB_RATE):
     """
     Login to sci-net.xyz and request multiple papers by DOIs
     
@@ -1510,21 +2333,23 @@ def login_and_request_multiple_dois(username, password, dois, wait_seconds=50, r
         dois: List of DOI strings to request
         wait_seconds: Seconds to wait for each DOI search results
         reward_tokens: Number of reward tokens to offer for each request
-        headless: Whether to run browser in headless mode
+        headless: Whether to run browser in headless mode (default: True)
+        workers: Number of browsers to request with concurrently (default: 1)
+        rate: Maximum requests started per second (default: one every 3 seconds)
     
     Returns:
         dict: Summary of request results, or None if login failed
     """
-    driver = login_to_scinet(username, password, headless)
+    driver = login_to_scinet(username, password, headless, bulk=True)
     if not driver:
         return None
     
     try:
-        summary = request_multiple_papers_by_dois(driver, dois, wait_seconds, reward_tokens)
+        summary = request_multiple_papers_by_dois(driver, dois, wait_seconds, reward_tokens, workers, headless, rate)
         return summary
     finally:
         print("Multiple DOI request process completed, closing browser.")
-        driver.quit()
+        quit_driver_in_background(driver)
 
 def login_and_request_multiple_dois_simple(dois, wait_seconds=50, reward_tokens=1, headless=True):
     """
@@ -1548,7 +2373,7 @@ def login_and_request_multiple_dois_simple(dois, wait_seconds=50, reward_tokens=
     else:
         username = USERNAME or input("Sci-Net Username: ").strip()
         password = PASSWORD or getpass.getpass("Sci-Net Password: ")
-    driver = login_to_scinet(username, password, headless)
+    driver = login_to_scinet(username, password, headless, bulk=True)
     if not driver:
         return None
     try:
@@ -1556,9 +2381,9 @@ def login_and_request_multiple_dois_simple(dois, wait_seconds=50, reward_tokens=
         return summary
     finally:
         print("Multiple DOI request process completed, closing browser.")
-        driver.quit()
+        quit_driver_in_background(driver)
 
-def login_and_request_multiple_dois_with_rewards(username, password, doi_reward_pairs, wait_seconds=50, headless=False):
+def login_and_request_multiple_dois_with_rewards(username, password, doi_reward_pairs, wait_seconds=50, headless=True, workers=1, rate=DEFAULT_JOB_RATE, print_summary=True):
     """
     Login to sci-net.xyz and request multiple papers by DOIs with individual reward tokens
     
@@ -1567,62 +2392,24 @@ def login_and_request_multiple_dois_with_rewards(username, password, doi_reward_
         password: Password for login
         doi_reward_pairs: List of tuples (doi, reward_tokens)
         wait_seconds: Seconds to wait for each DOI search results
-        headless: Whether to run browser in headless mode
+        headless: Whether to run browser in headless mode (default: True)
+        workers: Number of browsers to request with concurrently (default: 1)
+        rate: Maximum requests started per second (default: one every 3 seconds)
+        print_summary: Whether to print the summary block (default: True)
     
     Returns:
         dict: Summary of request results, or None if login failed
     """
-    driver = login_to_scinet(username, password, headless)
+    driver = login_to_scinet(username, password, headless, bulk=True)
     if not driver:
         return None
     
     try:
-        # Convert doi_reward_pairs to separate lists for the existing function
-        # But we need to handle different reward tokens per DOI
-        results = []
-        successful_requests = 0
-        failed_requests = 0
-        
         print(f"Starting request process for {len(doi_reward_pairs)} DOIs with individual reward tokens...")
         
-        for i, (doi, reward_tokens) in enumerate(doi_reward_pairs, 1):
-            print(f"\n--- Requesting DOI {i}/{len(doi_reward_pairs)} ---")
-            print(f"DOI: {doi}")
-            print(f"Reward tokens: {reward_tokens}")
-            
-            # Use the existing request_paper_by_doi function
-            result = request_paper_by_doi(driver, doi, wait_seconds, reward_tokens)
-            results.append(result)
-            
-            if result and not result.get('error'):
-                successful_requests += 1
-                print(f"✓ Successfully processed request for: {doi}")
-                
-                # Print any availability information
-                availability = result.get('availability', {})
-                if availability:
-                    for source, info in availability.items():
-                        if info.get('available') or info.get('already_requested'):
-                            status = "already requested" if info.get('already_requested') else "available"
-                            print(f"  - {source.replace('_', ' ').title()}: {status}")
-                
-                # Print if request was submitted
-                if result.get('request_submitted'):
-                    actual_reward = result.get('request_info', {}).get('set_reward', reward_tokens)
-                    print(f"  - New request submitted with {actual_reward} reward token(s)")
-                elif result.get('can_request') == False:
-                    print(f"  - Request not needed (paper already available or requested)")
-            else:
-                failed_requests += 1
-                error_msg = result.get('error', 'Unknown error') if result else 'Request failed'
-                print(f"✗ Failed to process: {doi}")
-                print(f"  Error: {error_msg}")
-            
-            # Add delay between requests to avoid overwhelming the server
-            if i < len(doi_reward_pairs):
-                delay_seconds = 3
-                print(f"Waiting {delay_seconds} seconds before next request...")
-                time.sleep(delay_seconds)
+        results = _run_doi_requests(driver, doi_reward_pairs, wait_seconds, workers, headless, rate)
+        successful_requests = sum(1 for result in results if result and not result.get('error'))
+        failed_requests = len(results) - successful_requests
         
         # Summary
         summary = {
@@ -1634,245 +2421,196 @@ def login_and_request_multiple_dois_with_rewards(username, password, doi_reward_
             'timestamp': datetime.now().isoformat()
         }
         
-        print(f"\n{'='*80}")
-        print(f"MULTIPLE DOI REQUEST SUMMARY")
-        print(f"{'='*80}")
-        print(f"Total DOIs processed: {summary['total_dois']}")
-        print(f"Successful requests: {summary['successful_requests']}")
-        print(f"Failed requests: {summary['failed_requests']}")
-        
-        if successful_requests > 0:
-            print(f"\nSuccessfully processed DOIs:")
-            new_requests = 0
-            already_available = 0
-            total_tokens_used = 0
-            
-            for i, result in enumerate(results):
-                if result and not result.get('error'):
-                    doi, reward_tokens = doi_reward_pairs[i]
-                    
-                    if result.get('request_submitted'):
-                        new_requests += 1
-                        actual_reward = result.get('request_info', {}).get('set_reward', reward_tokens)
-                        total_tokens_used += actual_reward
-                        print(f"  ✓ {doi} - New request submitted ({actual_reward} tokens)")
-                    else:
-                        already_available += 1
-                        # Check what type of availability
-                        availability = result.get('availability', {})
-                        sources = []
-                        for source, info in availability.items():
-                            if info.get('available') or info.get('already_requested'):
-                                sources.append(source.replace('_', ' ').title())
-                        
-                        if sources:
-                            print(f"  ✓ {doi} - Available via: {', '.join(sources)}")
-                        else:
-                            print(f"  ✓ {doi} - Processed successfully")
-            
-            if new_requests > 0:
-                print(f"\n  New requests submitted: {new_requests}")
-                print(f"  Total tokens used: {total_tokens_used}")
-            if already_available > 0:
-                print(f"  Papers already available: {already_available}")
-        
-        if failed_requests > 0:
-            print(f"\nFailed requests:")
-            for i, result in enumerate(results):
-                if result and result.get('error'):
-                    doi, _ = doi_reward_pairs[i]
-                    error = result.get('error', 'Unknown error')
-                    print(f"  ✗ {doi} - {error}")
-        
-        print(f"{'='*80}")
+        if print_summary:
+            _print_doi_request_summary(summary, doi_reward_pairs)
         
         return summary
     finally:
         print("Multiple DOI request process completed, closing browser.")
-        driver.quit()
+        quit_driver_in_background(driver)
 
-def get_active_requests(driver, limit=None):
+def _scroll_for_more_requests(driver, current_request_count, timeout=5):
     """
-    Get the list of active requests from sci-net.xyz
-    Returns a list of request dictionaries with details
+    Scroll to the bottom of the requests list and wait for more to load
+    
+    The wait ends as soon as more requests or a taller page show up. It also
+    ends early once the scroll has fired at least one XHR/fetch and the page
+    has then had none in flight for NETWORK_QUIET_SECONDS. If the page loads
+    nothing over XHR/fetch, or only after a debounce, the list is judged by
+    its growth within timeout alone.
+    
+    Returns:
+        bool: True if the list grew, False if it seems to be complete
+    """
+    # Start counting the page's requests in flight before the scroll fires them
+    before_scroll = driver.execute_script(
+        PENDING_REQUESTS_JS
+        + "var started = window.__scinetPending.started;"
+        + "window.scrollTo(0, document.body.scrollHeight);"
+        + "return {'height': document.body.scrollHeight, 'started': started};"
+    )
+    previous_height = before_scroll['height']
+    # Requests started so far and when network activity was last seen
+    activity = {'started': before_scroll['started'], 'since': None}
+    
+    def grown_or_quiet(d):
+        state = d.execute_script(LIST_GROWTH_JS)
+        if state['count'] > current_request_count or state['height'] > previous_height:
+            return 'grown'
+        now = time.monotonic()
+        if state['pending'] > 0 or state['started'] != activity['started']:
+            activity['started'] = state['started']
+            activity['since'] = now
+            return False
+        if activity['since'] is None:
+            # Nothing fired yet; only the timeout can end the wait
+            return False
+        return 'quiet' if now - activity['since'] >= NETWORK_QUIET_SECONDS else False
+    
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=0.1).until(grown_or_quiet) == 'grown'
+    except TimeoutException:
+        return False
+
+def iter_active_requests(driver, limit=None):
+    """
+    Yield active requests from sci-net.xyz one at a time as they are parsed
+    
+    Requests are streamed while the page is scrolled, so only the current
+    batch of scraped fields is held in memory. Closing the generator early
+    stops scrolling.
     
     Args:
         driver: Selenium WebDriver instance
-        limit: Optional integer to limit the number of requests returned
+        limit: Optional integer to stop after this many requests
+    
+    Yields:
+        dict: Request details with the same fields as get_active_requests
     """
+    print("Getting active requests from sci-net.xyz...")
+    
+    # Navigate to the main page
+    driver.get("https://sci-net.xyz")
+    
+    # Wait for the page to load
+    WebDriverWait(driver, 10).until(
+        EC.presence_of_element_located((By.TAG_NAME, "body"))
+    )
+    
+    debug_print("Looking for active requests section...")
+    
+    # Make sure the requests container exists
     try:
-        print("Getting active requests from sci-net.xyz...")
-        
-        # Navigate to the main page
-        driver.get("https://sci-net.xyz")
-        
-        # Wait for the page to load
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        debug_print("Looking for active requests section...")
+        driver.find_element(By.CSS_SELECTOR, ".requests")
+    except:
+        debug_print("Could not find requests container")
+        return
+    
+    yielded_count = 0
+    last_request_count = 0
+    scroll_attempts = 0
+    max_scroll_attempts = 100  # Prevent infinite scrolling
+    
+    while True:
+        # If we have a limit and reached it, stop before touching the page
+        if limit is not None and limit > 0 and yielded_count >= limit:
+            debug_print(f"Reached target limit of {limit} valid requests")
+            break
         
-        # Find the requests container
-        try:
-            requests_container = driver.find_element(By.CSS_SELECTOR, ".requests")
-        except:
-            debug_print("Could not find requests container")
-            return []
+        # Count the request items without sending every element handle
+        # across the WebDriver bridge
+        current_request_count = driver.execute_script(REQUEST_COUNT_JS)
+        debug_print(f"Found {current_request_count} total request elements")
         
-        active_requests = []
-        last_request_count = 0
-        scroll_attempts = 0
-        max_scroll_attempts = 100  # Prevent infinite scrolling
+        # Read the fields of every new request element in one script call
+        new_requests = driver.execute_script(ACTIVE_REQUESTS_JS, last_request_count, current_request_count) or []
         
-        while True:
-            # Find all request items
-            request_elements = requests_container.find_elements(By.CSS_SELECTOR, ".request")
-            debug_print(f"Found {len(request_elements)} total request elements")
-            
-            # Process new request elements
-            for i in range(last_request_count, len(request_elements)):
-                # If we have a limit and reached it, stop processing
-                if limit is not None and limit > 0 and len(active_requests) >= limit:
-                    debug_print(f"Reached target limit of {limit} valid requests")
-                    break
-                    
-                request_element = request_elements[i]
+        # Process new request elements
+        for i, fields in enumerate(new_requests, last_request_count):
+            # If we have a limit and reached it, stop processing
+            if limit is not None and limit > 0 and yielded_count >= limit:
+                break
+            
+            try:
+                request_data = {
+                    'index': yielded_count + 1,
+                    'title': fields.get('title') or '',
+                    'authors': fields.get('authors') or '',
+                    'journal': fields.get('journal') or '',
+                    'year': fields.get('year') or '',
+                    'doi': fields.get('doi') or '',
+                    'reward': fields.get('reward') or '',
+                    'time_left': fields.get('time_left') or '',
+                    'requester': '',
+                    'link': fields.get('link') or ''
+                }
                 
-                try:
-                    request_data = {
-                        'index': len(active_requests) + 1,
-                        'title': '',
-                        'authors': '',
-                        'journal': '',
-                        'year': '',
-                        'doi': '',
-                        'reward': '',
-                        'time_left': '',
-                        'requester': '',
-                        'link': ''
-                    }
-                    
-                    # Get title and link
-                    try:
-                        title_element = request_element.find_element(By.CSS_SELECTOR, ".title a")
-                        request_data['title'] = title_element.text.strip()
-                        request_data['link'] = title_element.get_attribute("href")
-                    except:
-                        try:
-                            title_element = request_element.find_element(By.CSS_SELECTOR, ".title")
-                            request_data['title'] = title_element.text.strip()
-                        except:
-                            pass
-                    
-                    # Get authors
-                    try:
-                        authors_element = request_element.find_element(By.CSS_SELECTOR, ".authors")
-                        request_data['authors'] = authors_element.text.strip()
-                    except:
-                        pass
-                    
-                    # Get journal and year
-                    try:
-                        journal_element = request_element.find_element(By.CSS_SELECTOR, ".journal")
-                        request_data['journal'] = journal_element.text.strip()
-                    except:
-                        pass
-                    
-                    try:
-                        year_element = request_element.find_element(By.CSS_SELECTOR, ".year")
-                        request_data['year'] = year_element.text.strip()
-                    except:
-                        pass
-                    
-                    # Get DOI
-                    try:
-                        doi_element = request_element.find_element(By.CSS_SELECTOR, ".doi")
-                        request_data['doi'] = doi_element.text.strip()
-                    except:
-                        pass
-                    
-                    # Get reward
-                    try:
-                        reward_element = request_element.find_element(By.CSS_SELECTOR, ".reward")
-                        request_data['reward'] = reward_element.text.strip()
-                    except:
-                        pass
-                    
-                    # Get time left
-                    try:
-                        time_element = request_element.find_element(By.CSS_SELECTOR, ".time")
-                        request_data['time_left'] = time_element.text.strip()
-                    except:
-                        pass
-                    
-                    # Get requester from the user block
-                    try:
-                        user_block = request_element.find_element(By.CSS_SELECTOR, ".block.user")
-                        avatar_link = user_block.find_element(By.CSS_SELECTOR, ".avatar a")
-                        href = avatar_link.get_attribute("href")
-                        # Extract username from href (format: "/@username")
-                        if href and href.startswith("/@"):
-                            request_data['requester'] = href[2:]  # Remove "/@" prefix
-                        else:
-                            # Fallback to img title attribute
-                            img_element = avatar_link.find_element(By.TAG_NAME, "img")
-                            request_data['requester'] = img_element.get_attribute("title")
-                    except:
-                        pass
-                    
-                    # Check if the request has meaningful information
-                    # Ignore requests with no title, authors, DOI, or journal
-                    has_info = any([
-                        request_data['title'],
-                        request_data['authors'],
-                        request_data['doi'],
-                        request_data['journal']
-                    ])
-                    
-                    if has_info:
-                        active_requests.append(request_data)
-                        debug_print(f"Parsed request {len(active_requests)}: {request_data['title'][:50]}...")
-                    else:
-                        debug_print(f"Ignoring request {i+1}: no meaningful information found")
-                    
-                except Exception as parse_error:
-                    debug_print(f"Error parsing request {i+1}: {str(parse_error)}")
-                    continue
+                # Get requester from the user block
+                href = fields.get('requester_href')
+                # Extract username from href (format: "/@username")
+                if href and href.startswith("/@"):
+                    request_data['requester'] = href[2:]  # Remove "/@" prefix
+                else:
+                    # Fallback to img title attribute
+                    request_data['requester'] = fields.get('requester_title') or ''
+                
+                # Check if the request has meaningful information
+                # Ignore requests with no title, authors, DOI, or journal
+                has_info = any([
+                    request_data['title'],
+                    request_data['authors'],
+                    request_data['doi'],
+                    request_data['journal']
+                ])
+                
+                if has_info:
+                    yielded_count += 1
+                    debug_print(f"Parsed request {yielded_count}: {request_data['title'][:50]}...")
+                else:
+                    debug_print(f"Ignoring request {i+1}: no meaningful information found")
+                
+            except Exception as parse_error:
+                debug_print(f"Error parsing request {i+1}: {str(parse_error)}")
+                continue
             
-            # If we have a limit and reached it, stop
-            if limit is not None and limit > 0 and len(active_requests) >= limit:
-                debug_print(f"Reached target limit of {limit} valid requests")
+            if has_info:
+                yield request_data
+        
+        # Check if we found new requests
+        if current_request_count == last_request_count:
+            # No new requests found, try scrolling
+            scroll_attempts += 1
+            if scroll_attempts >= max_scroll_attempts:
+                debug_print(f"Max scroll attempts ({max_scroll_attempts}) reached, stopping")
                 break
             
-            # Check if we found new requests
-            current_request_count = len(request_elements)
-            if current_request_count == last_request_count:
-                # No new requests found, try scrolling
-                scroll_attempts += 1
-                if scroll_attempts >= max_scroll_attempts:
-                    debug_print(f"Max scroll attempts ({max_scroll_attempts}) reached, stopping")
-                    break
-                
-                debug_print(f"No new requests found, scrolling down (attempt {scroll_attempts})...")
-                
-                # Scroll to the bottom of the page
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                
-                # Wait for potential new content to load
-                time.sleep(2)
-                
-                # Check if new content was loaded
-                new_request_elements = requests_container.find_elements(By.CSS_SELECTOR, ".request")
-                if len(new_request_elements) == current_request_count:
-                    # Still no new requests after scrolling and waiting
-                    debug_print("No new requests loaded after scrolling, assuming end of content")
-                    break
-            else:
-                # New requests found, reset scroll attempts and update count
-                scroll_attempts = 0
-                last_request_count = current_request_count
-                debug_print(f"Found {current_request_count - last_request_count} new request elements")
+            debug_print(f"No new requests found, scrolling down (attempt {scroll_attempts})...")
+            
+            # Scroll to the bottom of the page and wait until new content is
+            # loaded; a page that stops growing has no more requests to load
+            if not _scroll_for_more_requests(driver, current_request_count):
+                # Still no new requests after scrolling and waiting
+                debug_print("Page stopped growing after scrolling, assuming end of content")
+                break
+        else:
+            # New requests found, reset scroll attempts and update count
+            new_request_count = current_request_count - last_request_count
+            scroll_attempts = 0
+            last_request_count = current_request_count
+            debug_print(f"Found {new_request_count} new request elements")
+
+def get_active_requests(driver, limit=None):
+    """
+    Get the list of active requests from sci-net.xyz
+    Returns a list of request dictionaries with details
+    
+    Args:
+        driver: Selenium WebDriver instance
+        limit: Optional integer to limit the number of requests returned
+    """
+    try:
+        stop = limit if limit is not None and limit > 0 else None
+        active_requests = list(islice(iter_active_requests(driver, limit), stop))
         
         print(f"Successfully parsed {len(active_requests)} active requests (ignored empty results)")
         return active_requests
@@ -1950,7 +2688,15 @@ def login_and_get_active_requests(username, password, headless=False, limit=None
         return requests
     finally:
         print("Active requests retrieval completed, closing browser.")
-        driver.quit()
+        quit_driver_in_background(driver)
+
+@dataclass(slots=True)
+class SolvedPaper:
+    """One of the user's requests that has been fulfilled on sci-net.xyz."""
+
+    title: str = 'Unknown'
+    doi: str = ''
+    link: str = ''
 
 def check_fulfilled_requests(driver):
     """
@@ -1990,7 +2736,7 @@ def check_fulfilled_requests(driver):
                 fulfilled_data['notice_message'] = notice_text
                 
                 # Extract count from notice message (e.g., "Your requests (3) have been solved!")
-                count_match = re.search(r'\((\d+)\)', notice_text)
+                count_match = _COUNT_RE.search(notice_text)
                 if count_match:
                     fulfilled_data['fulfilled_count'] = int(count_match.group(1))
                 
@@ -2005,26 +2751,20 @@ def check_fulfilled_requests(driver):
                 
                 for solved_element in solved_elements:
                     try:
-                        paper_info = {
-                            'title': solved_element.text.strip(),
-                            'link': solved_element.get_attribute("href"),
-                            'doi': ''
-                        }
-                        
-                        # Extract DOI from href if it follows the pattern /10.xxxx/...
-                        href = paper_info['link']
-                        if href and '/10.' in href:
-                            # Extract DOI from URL (remove leading slash)
-                            doi_start = href.find('/10.')
-                            if doi_start != -1:
-                                paper_info['doi'] = href[doi_start + 1:]  # Remove leading slash
+                        href = solved_element.get_attribute("href") or ''
+                        paper_info = SolvedPaper(
+                            title=solved_element.text.strip(),
+                            # Extract DOI from href if it follows the pattern /10.xxxx/...
+                            doi=doi_from_href(href),
+                            link=href
+                        )
                         
                         fulfilled_data['solved_papers'].append(paper_info)
-                        print(f"Solved paper: {paper_info['title']}")
-                        if paper_info['doi']:
-                            print(f"  DOI: {paper_info['doi']}")
-                        if paper_info['link']:
-                            print(f"  Link: {paper_info['link']}")
+                        print(f"Solved paper: {paper_info.title}")
+                        if paper_info.doi:
+                            print(f"  DOI: {paper_info.doi}")
+                        if paper_info.link:
+                            print(f"  Link: {paper_info.link}")
                         
                     except Exception as paper_error:
                         debug_print(f"Error parsing solved paper: {str(paper_error)}")
@@ -2077,13 +2817,13 @@ def format_fulfilled_requests(fulfilled_data):
         print(f"{'-'*80}")
         
         for i, paper in enumerate(solved_papers, 1):
-            print(f"\n[{i}] {paper['title']}")
+            print(f"\n[{i}] {paper.title}")
             
-            if paper['doi']:
-                print(f"    DOI: {paper['doi']}")
+            if paper.doi:
+                print(f"    DOI: {paper.doi}")
             
-            if paper['link']:
-                print(f"    Download Link: {paper['link']}")
+            if paper.link:
+                print(f"    Download Link: {paper.link}")
             
             # Add separator between papers (but not after the last one)
             if i < len(solved_papers):
@@ -2094,10 +2834,313 @@ def format_fulfilled_requests(fulfilled_data):
     print(f"Checked on: {fulfilled_data.get('timestamp', 'Unknown')}")
     print(f"{'='*80}")
 
-def login_and_check_fulfilled_requests(username, password, headless=False):
+def _direct_pdf_url(doi, user_agent, cookies, referer):
+    """
+    Check whether a solved paper's PDF is served at its DOI-derived URL
+    
+    Args:
+        doi: DOI of the paper (may be empty)
+        user_agent: Browser user agent to send
+        cookies: Cookies of the logged-in browser session
+        referer: Paper page URL to send as referer
+    
+    Returns:
+        str: The PDF URL if the server answers 200, None otherwise
+    """
+    if not doi:
+        return None
+    # DOIs may hold characters such as '#', '?', ';' or spaces that would
+    # end or break the URL path
+    pdf_url = f"{PDF_BASE_URL}/{quote(doi, safe='/')}.pdf"
+    try:
+        response = _SESSION.head(
+            pdf_url,
+            headers={'User-Agent': user_agent, 'Accept': 'application/pdf,*/*', 'Referer': referer},
+            cookies=cookies,
+            allow_redirects=True,
+            timeout=10,
+        )
+        if response.status_code == 200:
+            return pdf_url
+        debug_print(f"    Direct PDF URL answered HTTP {response.status_code}, using paper page")
+    except Exception as e:
+        debug_print(f"    Direct PDF URL check failed: {str(e)}")
+    return None
+
+def _unique_download_path(filepath, used_paths):
+    """
+    Return filepath, or filepath with " (2)", " (3)", ... before the
+    extension, whichever is not yet in used_paths, and add it to used_paths
+
+    Papers with the same title would otherwise be downloaded in parallel
+    into the same file.
+
+    Args:
+        filepath: Path the download would normally be saved to
+        used_paths: Set of normalized paths already taken in this run
+
+    Returns:
+        str: A path no other download of this run writes to
+    """
+    base, ext = os.path.splitext(filepath)
+    candidate = filepath
+    counter = 2
+    while os.path.normcase(candidate) in used_paths:
+        candidate = f"{base} ({counter}){ext}"
+        counter += 1
+    used_paths.add(os.path.normcase(candidate))
+    return candidate
+
+def _download_pdf_file(pdf_url, filepath, headers, cookies):
+    """
+    Download one PDF with the shared HTTP session
+    
+    Args:
+        pdf_url: URL of the PDF file
+        filepath: Path to save the PDF to
+        headers: Request headers mimicking the browser
+        cookies: Cookies of the logged-in browser session
+    
+    Returns:
+        bool: True if the file was saved, False otherwise, or None if the
+        server refused the cookies (401/403)
+    """
+    print(f"    Downloading PDF to: {filepath}")
+    try:
+        # Make the request to download PDF
+        response = _SESSION.get(
+            pdf_url,
+            headers=headers,
+            cookies=cookies,
+            stream=True,
+            timeout=DOWNLOAD_TIMEOUT,
+        )
+        if response.status_code in (401, 403):
+            print(f"    Download of {os.path.basename(filepath)} refused (HTTP {response.status_code})")
+            response.close()
+            return None
+        response.raise_for_status()
+        
+        # The streamed response's headers arrive before its body, so empty
+        # or oversized files are skipped without downloading them
+        content_length = response.headers.get('Content-Length')
+        expected_size = int(content_length) if content_length and content_length.isdigit() else None
+        if expected_size == 0 or (expected_size or 0) > MAX_PDF_BYTES:
+            print(f"    Skipping {os.path.basename(filepath)}: server reports {expected_size} bytes")
+            response.close()
+            return False
+        
+        # Error pages are often served with status 200, so only save
+        # bodies that start like a PDF
+        response.raw.decode_content = True
+        head = response.raw.read(len(PDF_MAGIC))
+        if head != PDF_MAGIC:
+            print(f"    Skipping {os.path.basename(filepath)}: response is not a PDF file")
+            response.close()
+            return False
+        
+        # Save the PDF content to file; copyfileobj runs the copy loop in C
+        # with 1 MiB reads instead of a Python loop over 8 KiB chunks
+        with open(filepath, 'wb') as f:
+            # Reserve the space up front when the length on the wire is the
+            # length on disk
+            if expected_size and hasattr(os, 'posix_fallocate') and not response.headers.get('Content-Encoding'):
+                try:
+                    os.posix_fallocate(f.fileno(), 0, expected_size)
+                except OSError as e:
+                    debug_print(f"    Could not preallocate {filepath}: {str(e)}")
+            f.write(head)
+            shutil.copyfileobj(response.raw, f, length=1 << 20)
+            f.truncate()
+        
+        file_size = os.path.getsize(filepath)
+        print(f"    ✓ PDF downloaded successfully: {filepath} ({file_size} bytes)")
+        return True
+        
+    except Exception as download_error:
+        print(f"    Error downloading PDF {os.path.basename(filepath)}: {str(download_error)}")
+        return False
+
+def fast_wait(driver, timeout=10, poll=FAST_POLL_SECONDS):
+    """
+    WebDriverWait that polls every poll seconds instead of Selenium's
+    default half second, for elements that usually appear almost at once
+
+    Args:
+        driver: Selenium WebDriver instance
+        timeout: Maximum seconds to wait (default: 10)
+        poll: Seconds between checks (default: FAST_POLL_SECONDS)
+
+    Returns:
+        WebDriverWait: Wait instance to call until() on
+    """
+    return WebDriverWait(driver, timeout, poll_frequency=poll)
+
+def _wait_for_first(driver, selectors, timeout=10):
+    """
+    Wait until any of the CSS selectors matches, in a single wait
+
+    Each poll tries the selectors in order, so the earliest selector wins
+    when several match; a comma-joined selector would pick by document order.
+
+    Returns:
+        WebElement: First element matched by the most preferred selector
+
+    Raises:
+        TimeoutException: If nothing matches within timeout seconds
+    """
+    def first_match(d):
+        for selector in selectors:
+            elements = d.find_elements(By.CSS_SELECTOR, selector)
+            if elements:
+                return elements[0]
+        return False
+
+    return fast_wait(driver, timeout).until(first_match)
+
+def _wait_for_view_link(driver, timeout=10):
+    """
+    Wait for the View link in a paper page's preview section, preferring
+    the green button when the preview has several
+
+    Returns:
+        WebElement: The View link
+
+    Raises:
+        TimeoutException: If no View link appears within timeout seconds
+    """
+    return _wait_for_first(driver, VIEW_LINK_SELECTORS, timeout)
+
+def _find_paper_pdf_url(driver, paper):
+    """
+    Open a solved paper's page and read the PDF URL from its viewer
+
+    Args:
+        driver: Selenium WebDriver instance (already logged in)
+        paper: SolvedPaper from check_fulfilled_requests()
+
+    Returns:
+        tuple: (pdf_url, referer), or None if no PDF URL was found
+    """
+    print(f"    Navigating to: {paper.link}")
+    
+    # Navigate to the paper page
+    driver.get(paper.link)
+    
+    # Try to find and click the "View" button on the paper
+    # page, unless the PDF viewer is already embedded
+    if driver.find_elements(By.CSS_SELECTOR, INLINE_PDF_SELECTOR):
+        print("    PDF viewer already on the page, skipping View button...")
+    else:
+        try:
+            print("    Looking for View button in preview section...")
+            view_link = _wait_for_view_link(driver)
+            print("    Found View link, clicking...")
+            view_link.click()
+        except:
+            print("    View button not found in preview section, proceeding to look for PDF...")
+    
+    print("    Looking for PDF Link...")
+    # Wait until the PDF div holds a source element instead
+    # of sleeping for a fixed time before looking
+    try:
+        WebDriverWait(driver, 30).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, PDF_SOURCE_SELECTOR))
+        )
+        pdf_div = driver.find_element(By.CSS_SELECTOR, "div.pdf")
+        
+        # Try the iframe first, then embed, object and
+        # direct link; find_elements returns [] instead of
+        # raising when a tag is absent
+        iframe_src = None
+        for tag_name, attribute in PDF_SOURCE_ATTRIBUTES:
+            source_elements = pdf_div.find_elements(By.TAG_NAME, tag_name)
+            if source_elements:
+                iframe_src = source_elements[0].get_attribute(attribute)
+                debug_print(f"    Found {tag_name} element with PDF URL")
+                break
+        else:
+            debug_print("    No PDF source found in div.pdf")
+        
+        # Extract the PDF URL from the found source
+        
+        if iframe_src:
+            debug_print(f"    Raw iframe src: {iframe_src}")
+            
+            # Process the URL to handle the sci-net.xyz PDF format
+            if iframe_src.startswith("//pdf.sci-net.xyz/"):
+                # Add https: protocol
+                pdf_url = "https:" + iframe_src
+            elif iframe_src.startswith("/"):
+                # Handle relative paths - could be to pdf.sci-net.xyz
+                if iframe_src.startswith("/pdf/") or "/pdf/" in iframe_src:
+                    # This is likely a PDF path, use pdf.sci-net.xyz domain
+                    pdf_url = "https://pdf.sci-net.xyz" + iframe_src
+                else:
+                    pdf_url = "https://sci-net.xyz" + iframe_src
+            elif iframe_src.startswith("https://pdf.sci-net.xyz/"):
+                # Already a complete PDF URL
+                pdf_url = iframe_src
+            else:
+                pdf_url = iframe_src
+            
+            # Remove query parameters (everything from ? onwards)
+            if "?" in pdf_url:
+                pdf_url = pdf_url.split("?")[0]
+            
+            # Remove URL fragments (everything from # onwards)
+            if "#" in pdf_url:
+                pdf_url = pdf_url.split("#")[0]
+            
+            print(f"    Processed PDF URL: {pdf_url}")
+            
+            return pdf_url, driver.current_url
+        else:
+            print(f"    Warning: Could not extract PDF URL from iframe")
+    
+    except TimeoutException:
+        print(f"    Warning: Could not find PDF div/iframe for {paper.title}")
+    except Exception as pdf_error:
+        print(f"    Error finding PDF div/iframe: {str(pdf_error)}")
+    return None
+
+def _find_paper_pdf_urls(driver, browser_papers, workers=1, headless=True):
+    """
+    Find the PDF URLs of (paper, filepath) pairs, either one after another on
+    the given driver or concurrently on a BrowserPool
+
+    Returns:
+        list: (paper, filepath, (pdf_url, referer) or None) in input order
+    """
+    def find_job(pooled_driver, paper, filepath):
+        try:
+            return paper, filepath, _find_paper_pdf_url(pooled_driver, paper)
+        except Exception as paper_error:
+            print(f"    Error processing paper {paper.title}: {str(paper_error)}")
+            return paper, filepath, None
+
+    total = len(browser_papers)
+    if workers > 1 and total > 1:
+        with BrowserPool(driver, min(workers, total), headless) as pool:
+            print(f"Opening paper pages with {pool.size} browser(s)")
+
+            def pooled_job(paper, filepath):
+                with pool.acquire() as pooled_driver:
+                    return find_job(pooled_driver, paper, filepath)
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=pool.size) as executor:
+                futures = [executor.submit(pooled_job, paper, filepath) for paper, filepath in browser_papers]
+                return [future.result() for future in futures]
+
+    return [find_job(driver, paper, filepath) for paper, filepath in browser_papers]
+
+def login_and_check_fulfilled_requests(username, password, headless=False, workers=1):
     """
     Login to sci-net.xyz and check for fulfilled requests
     Returns fulfillment information
+
+    Args:
+        workers: Number of browsers to open paper pages with concurrently (default: 1)
     """
     driver = login_to_scinet(username, password, headless)
     if not driver:
@@ -2115,166 +3158,83 @@ def login_and_check_fulfilled_requests(username, password, headless=False):
             downloads_dir = DEFAULT_DOWNLOAD_DIR
             print(f"Download directory: {downloads_dir}")
             
+            # The user agent and session cookies do not change between papers,
+            # so they are read from the browser once
+            user_agent = driver.execute_script("return navigator.userAgent;")
+            session_cookies = {cookie['name']: cookie['value'] for cookie in driver.get_cookies()}
+            
+            # Papers without a direct URL need their page opened in a browser;
+            # downloads run in parallel after all URLs are known
+            download_tasks = []
+            browser_papers = []
+            # Target paths taken so far; downloads run in parallel, so no two
+            # papers may share a file
+            used_paths = set()
             for i, paper in enumerate(result['solved_papers'], 1):
                 try:
-                    if paper.get('link'):
-                        print(f"\n[{i}] Processing: {paper['title']}")
-                        print(f"    Navigating to: {paper['link']}")
+                    if paper.link:
+                        print(f"\n[{i}] Processing: {paper.title}")
                         
-                        # Navigate to the paper page
-                        driver.get(paper['link'])
-
-                        # Try to find and click the "View" button on the paper page
-                        try:
-                            print("    Looking for View button in preview section...")
-                            # First try to find the view link in the preview div
-                            preview_div = WebDriverWait(driver, 10).until(
-                                EC.presence_of_element_located((By.CSS_SELECTOR, "div.preview"))
-                            )
-                            try:
-                                view_link = preview_div.find_element(By.CSS_SELECTOR, "a.button.green")
-                            except:
-                                view_link = preview_div.find_element(By.CSS_SELECTOR, "a.button")
-                            print("    Found View link, clicking...")
-                            view_link.click()
-                            time.sleep(3)  # Wait for the PDF to load
-                        except:
-                            print("    View button not found in preview section, proceeding to look for PDF...")
+                        # Create a safe filename from the paper title
+                        safe_title = _UNSAFE_FN_RE.sub('_', paper.title)
+                        safe_title = safe_title[:100]  # Limit filename length
+                        filename = f"{safe_title}.pdf"
+                        filepath = _unique_download_path(os.path.join(downloads_dir, filename), used_paths)
                         
-                        # Wait for a few seconds before parsing the page
-                        print("    Waiting for page to load...")
-                        time.sleep(5)
+                        # Most solved papers are served at a URL derived from
+                        # their DOI; only open the paper page when it is not
+                        direct_url = _direct_pdf_url(paper.doi, user_agent, session_cookies, paper.link)
+                        if direct_url:
+                            print(f"    Found PDF at: {direct_url}")
+                            headers = {
+                                'User-Agent': user_agent,
+                                'Accept': 'application/pdf,*/*',
+                                'Referer': paper.link
+                            }
+                            download_tasks.append((direct_url, filepath, headers, session_cookies))
+                            continue
                         
-                        print("    Looking for PDF Link...")
-                        # Look for the PDF div and iframe with increased timeout and error handling
-                        try:
-                            pdf_div = WebDriverWait(driver, 30).until(
-                                EC.presence_of_element_located((By.CSS_SELECTOR, "div.pdf"))
-                            )
-                            
-                            # Try to find iframe first
-                            iframe_src = None
-                            try:
-                                pdf_iframe = pdf_div.find_element(By.TAG_NAME, "iframe")
-                                iframe_src = pdf_iframe.get_attribute("src")
-                            except:
-                                debug_print("    No iframe found in PDF div, trying alternative methods...")
-                                
-                                # Try to find direct PDF link or embed element
-                                try:
-                                    # Look for embed element
-                                    embed_element = pdf_div.find_element(By.TAG_NAME, "embed")
-                                    iframe_src = embed_element.get_attribute("src")
-                                    debug_print("    Found embed element with PDF URL")
-                                except:
-                                    # Look for object element
-                                    try:
-                                        object_element = pdf_div.find_element(By.TAG_NAME, "object")
-                                        iframe_src = object_element.get_attribute("data")
-                                        debug_print("    Found object element with PDF URL")
-                                    except:
-                                        # Look for direct link (a tag)
-                                        try:
-                                            link_element = pdf_div.find_element(By.TAG_NAME, "a")
-                                            iframe_src = link_element.get_attribute("href")
-                                            debug_print("    Found direct link to PDF")
-                                        except:
-                                            debug_print("    No PDF source found in div.pdf")
-                            
-                            # Extract the PDF URL from the found source
-                            
-                            if iframe_src:
-                                debug_print(f"    Raw iframe src: {iframe_src}")
-                                
-                                # Process the URL to handle the sci-net.xyz PDF format
-                                if iframe_src.startswith("//pdf.sci-net.xyz/"):
-                                    # Add https: protocol
-                                    pdf_url = "https:" + iframe_src
-                                elif iframe_src.startswith("/"):
-                                    # Handle relative paths - could be to pdf.sci-net.xyz
-                                    if iframe_src.startswith("/pdf/") or "/pdf/" in iframe_src:
-                                        # This is likely a PDF path, use pdf.sci-net.xyz domain
-                                        pdf_url = "https://pdf.sci-net.xyz" + iframe_src
-                                    else:
-                                        pdf_url = "https://sci-net.xyz" + iframe_src
-                                elif iframe_src.startswith("https://pdf.sci-net.xyz/"):
-                                    # Already a complete PDF URL
-                                    pdf_url = iframe_src
-                                else:
-                                    pdf_url = iframe_src
-                                
-                                # Remove query parameters (everything from ? onwards)
-                                if "?" in pdf_url:
-                                    pdf_url = pdf_url.split("?")[0]
-                                
-                                # Remove URL fragments (everything from # onwards)
-                                if "#" in pdf_url:
-                                    pdf_url = pdf_url.split("#")[0]
-                                
-                                print(f"    Processed PDF URL: {pdf_url}")
-                                
-                                # Create a safe filename from the paper title
-                                safe_title = re.sub(r'[<>:"/\\|?*]', '_', paper['title'])
-                                safe_title = safe_title[:100]  # Limit filename length
-                                filename = f"{safe_title}.pdf"
-                                filepath = os.path.join(downloads_dir, filename)
-                                
-                                print(f"    Downloading PDF to: {filepath}")
-                                
-                                # Download the PDF using Python requests
-                                try:
-                                    # Get cookies from the current driver session
-                                    cookies = {}
-                                    for cookie in driver.get_cookies():
-                                        cookies[cookie['name']] = cookie['value']
-                                    
-                                    # Set up headers to mimic browser request
-                                    headers = {
-                                        'User-Agent': driver.execute_script("return navigator.userAgent;"),
-                                        'Accept': 'application/pdf,*/*',
-                                        'Referer': driver.current_url
-                                    }
-                                    
-                                    # Make the request to download PDF
-                                    response = requests.get(
-                                        pdf_url,
-                                        headers=headers,
-                                        cookies=cookies,
-                                        stream=True,
-                                        timeout=DOWNLOAD_TIMEOUT,
-                                    )
-                                    response.raise_for_status()
-                                    
-                                    # Save the PDF content to file
-                                    with open(filepath, 'wb') as f:
-                                        for chunk in response.iter_content(chunk_size=8192):
-                                            if chunk:
-                                                f.write(chunk)
-                                    
-                                    file_size = os.path.getsize(filepath)
-                                    print(f"    ✓ PDF downloaded successfully: {filepath}")
-                                    print(f"    File size: {file_size} bytes")
-                                    
-                                except Exception as download_error:
-                                    print(f"    Error downloading PDF: {str(download_error)}")
-                            else:
-                                print(f"    Warning: Could not extract PDF URL from iframe")
-                                
-                        except TimeoutException:
-                            print(f"    Warning: Could not find PDF div/iframe for {paper['title']}")
-                        except Exception as pdf_error:
-                            print(f"    Error finding PDF div/iframe: {str(pdf_error)}")
+                        # The paper page is opened after all direct URLs are
+                        # known, so it can be spread over several browsers
+                        browser_papers.append((paper, filepath))
                             
                 except Exception as paper_error:
                     print(f"    Error processing paper {i}: {str(paper_error)}")
                     continue
             
+            for paper, filepath, found in _find_paper_pdf_urls(driver, browser_papers, workers, headless):
+                if found:
+                    pdf_url, referer = found
+                    # Set up headers to mimic browser request
+                    headers = {
+                        'User-Agent': user_agent,
+                        'Accept': 'application/pdf,*/*',
+                        'Referer': referer
+                    }
+                    download_tasks.append((pdf_url, filepath, headers, session_cookies))
+            
+            if download_tasks:
+                print(f"\nDownloading {len(download_tasks)} PDF(s)...")
+                with concurrent.futures.ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+                    outcomes = list(executor.map(lambda task: _download_pdf_file(*task), download_tasks))
+                
+                # Retry downloads that were refused with freshly read cookies
+                refused = [task for task, outcome in zip(download_tasks, outcomes) if outcome is None]
+                if refused:
+                    print(f"\nRetrying {len(refused)} refused download(s) with refreshed cookies...")
+                    session_cookies = {cookie['name']: cookie['value'] for cookie in driver.get_cookies()}
+                    with concurrent.futures.ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+                        list(executor.map(
+                            lambda task: _download_pdf_file(task[0], task[1], task[2], session_cookies),
+                            refused
+                        ))
+            
             print(f"\nDownload process completed. Check {downloads_dir} for downloaded files.")
         
         return result
     finally:
         print("Fulfilled requests check completed, closing browser.")
-        driver.quit()
+        quit_driver_in_background(driver)
 
 def accept_fulfilled_request_by_doi(driver, doi):
     """
@@ -2306,28 +3266,20 @@ def accept_fulfilled_request_by_doi(driver, doi):
         print(f"Navigating to: {doi_url}")
         driver.get(doi_url)
         
-        # Wait for the page to load
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        # Try to find and click the "View" button on the paper page
+        # Try to find and click the "View" button on the paper page; the
+        # wait for the view link also covers the page load
         try:
             print("Looking for View button in preview section...")
-            preview_div = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div.preview"))
-            )
-            try:
-                view_link = preview_div.find_element(By.CSS_SELECTOR, "a.button.green")
-            except:
-                view_link = preview_div.find_element(By.CSS_SELECTOR, "a.button")
+            view_link = _wait_for_view_link(driver)
             print("Found View link, clicking...")
             view_link.click()
             result['view_clicked'] = True
             
-            # Wait for the page to load
+            # Wait for the accept/reject buttons instead of a fixed pause
             print("Waiting for page to load...")
-            time.sleep(5)
+            fast_wait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "div.buttons"))
+            )
         except Exception as view_error:
             print(f"Warning: Could not find or click View button: {str(view_error)}")
             debug_print(f"View button error: {str(view_error)}")
@@ -2336,28 +3288,26 @@ def accept_fulfilled_request_by_doi(driver, doi):
         try:
             print("Looking for Accept button in buttons div...")
             
-            # Find the buttons div
-            buttons_div = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div.buttons"))
+            # Wait for the accept link itself, so there is no gap between
+            # finding the buttons div and the link inside it
+            accept_link = fast_wait(driver, 10).until(
+                EC.element_to_be_clickable((By.CSS_SELECTOR, "div.buttons a.accept"))
             )
             
-            # Look for the accept link within the buttons div
-            accept_link = buttons_div.find_element(By.CSS_SELECTOR, "a.accept")
-            
             print("Found Accept link, clicking...")
             debug_print(f"Accept link href: {accept_link.get_attribute('href')}")
             debug_print(f"Accept link text: '{accept_link.text}'")
             
-            # Scroll to the button to ensure it's visible
-            driver.execute_script("arguments[0].scrollIntoView(true);", accept_link)
-            time.sleep(1)
-            
-            # Click the accept link
-            accept_link.click()
+            # Scroll to the accept link and click it in a single script call
+            driver.execute_script(SCROLL_AND_CLICK_JS, accept_link)
             result['accept_clicked'] = True
             
             print("Accept link clicked, waiting for processing...")
-            time.sleep(5)
+            # The accept link is replaced once the server has handled it
+            try:
+                fast_wait(driver, 10).until(EC.staleness_of(accept_link))
+            except TimeoutException:
+                debug_print("Accept link still on the page after 10 seconds")
             
             result['success'] = True
             print("✓ Request accepted successfully")
@@ -2371,16 +3321,17 @@ def accept_fulfilled_request_by_doi(driver, doi):
             # Debug: Try to find and log available buttons
             if VERBOSE:
                 try:
-                    buttons_div = driver.find_element(By.CSS_SELECTOR, "div.buttons")
-                    all_links = buttons_div.find_elements(By.TAG_NAME, "a")
-                    print("Debug: Available links in buttons div:")
-                    for i, link in enumerate(all_links):
-                        try:
-                            print(f"  {i+1}. class: '{link.get_attribute('class')}', text: '{link.text}', href: '{link.get_attribute('href')}'")
-                        except:
-                            pass
-                except:
-                    print("Debug: Could not find buttons div for debugging")
+                    # Read every link of the buttons div in one script call
+                    # instead of three WebDriver commands per link
+                    all_links = driver.execute_script(BUTTON_LINKS_JS)
+                    if all_links is None:
+                        print("Debug: Could not find buttons div for debugging")
+                    else:
+                        print("Debug: Available links in buttons div:")
+                        for i, link in enumerate(all_links):
+                            print(f"  {i+1}. class: '{link['class']}', text: '{link['text']}', href: '{link['href']}'")
+                except Exception as debug_error:
+                    print(f"Debug: Could not read buttons div: {str(debug_error)}")
         
         return result
         
@@ -2409,7 +3360,20 @@ def login_and_accept_fulfilled_request_by_doi(username, password, doi, headless=
     Returns:
         dict: Result of the acceptance attempt
     """
-    driver = login_to_scinet(username, password, headless)
+    # A malformed DOI can never match a request, so fail before paying
+    # for the browser start and login
+    if not is_valid_doi(doi):
+        print(f"Error: Invalid DOI format: '{doi}'")
+        return {
+            'doi': doi,
+            'success': False,
+            'error': 'Invalid DOI format',
+            'view_clicked': False,
+            'accept_clicked': False,
+            'request_url': ''
+        }
+    
+    driver = login_to_scinet(username, password, headless, minimal_resources=True, page_load_strategy="eager")
     if not driver:
         return None
     
@@ -2418,7 +3382,36 @@ def login_and_accept_fulfilled_request_by_doi(username, password, doi, headless=
         return result
     finally:
         print("Accept fulfilled request by DOI process completed, closing browser.")
-        driver.quit()
+        quit_driver_in_background(driver)
+
+def accept_fulfilled_requests_by_dois(username, password, dois, headless=False, workers=1, rate=DEFAULT_JOB_RATE):
+    """
+    Login to sci-net.xyz once and accept the fulfilled requests for several DOIs
+    
+    Args:
+        username: Username for login
+        password: Password for login
+        dois: List of DOIs of the fulfilled requests to accept
+        headless: Whether to run browser in headless mode
+        workers: Number of browsers to accept with concurrently (default: 1)
+        rate: Maximum acceptances started per second (default: one every 3 seconds)
+    
+    Returns:
+        list: Result of each acceptance attempt, in the order of dois,
+            or None if login failed
+    """
+    driver = login_to_scinet(username, password, headless, minimal_resources=True, page_load_strategy="eager")
+    if not driver:
+        return None
+    
+    try:
+        return _run_fulfilled_actions(
+            driver, dois, accept_fulfilled_request_by_doi, "DOI",
+            workers=workers, headless=headless, rate=rate
+        )
+    finally:
+        print("Accept fulfilled requests by DOI process completed, closing browser.")
+        quit_driver_in_background(driver)
 
 def accept_fulfilled_request(driver, paper):
     """
@@ -2426,14 +3419,14 @@ def accept_fulfilled_request(driver, paper):
     
     Args:
         driver: Selenium WebDriver instance
-        paper: Dictionary containing paper information with 'doi' and other details
+        paper: SolvedPaper from check_fulfilled_requests()
     
     Returns:
         dict: Result of the acceptance attempt
     """
     try:
-        title = paper.get('title', 'Unknown')
-        doi = paper.get('doi', '')
+        title = paper.title
+        doi = paper.doi
         
         print(f"\nProcessing: {title}")
         
@@ -2442,7 +3435,7 @@ def accept_fulfilled_request(driver, paper):
             print(f"Error: {error_msg}")
             return {
                 'title': title,
-                'link': paper.get('link', ''),
+                'link': paper.link,
                 'success': False,
                 'error': error_msg,
                 'view_clicked': False,
@@ -2457,7 +3450,7 @@ def accept_fulfilled_request(driver, paper):
         
         # Update the result to include the original paper data
         result['title'] = title
-        result['link'] = paper.get('link', '')
+        result['link'] = paper.link
         
         return result
         
@@ -2465,24 +3458,170 @@ def accept_fulfilled_request(driver, paper):
         error_msg = f"Error accepting fulfilled request: {str(e)}"
         print(f"Error: {error_msg}")
         return {
-            'title': paper.get('title', 'Unknown'),
-            'link': paper.get('link', ''),
+            'title': paper.title,
+            'link': paper.link,
             'success': False,
             'error': error_msg,
             'view_clicked': False,
             'accept_clicked': False
         }
 
+@contextlib.contextmanager
+def _input_timeout(seconds, handler):
+    """
+    Run handler if the enclosed input() takes longer than seconds
+
+    Only has an effect where SIGALRM exists; the alarm is always cancelled
+    and the previous SIGALRM handler restored on exit.
+
+    Args:
+        seconds: Seconds to wait before handler is called
+        handler: Signal handler taking (signum, frame)
+    """
+    has_alarm = hasattr(signal, 'SIGALRM')
+    if has_alarm:
+        previous_handler = signal.signal(signal.SIGALRM, handler)
+        signal.alarm(seconds)
+    try:
+        yield
+    finally:
+        if has_alarm:
+            signal.alarm(0)
+            signal.signal(signal.SIGALRM, previous_handler)
+
+def _input_with_timeout(prompt, timeout=SELECTION_INPUT_TIMEOUT):
+    """
+    Read a line from the user, giving up after timeout seconds
+
+    Piped or redirected stdin is read with a plain input(): earlier reads may
+    already hold its next lines in Python's buffer, where waiting on the file
+    descriptor cannot see them, and scripted input needs no timeout. On a
+    terminal the main thread uses input() under _input_timeout(), keeping
+    readline line editing; other threads wait on stdin with a
+    selectors.DefaultSelector, or msvcrt polling on Windows. The caller
+    decides what a timeout means.
+
+    Args:
+        prompt: Text shown before the input
+        timeout: Seconds to wait for the line to be entered
+
+    Returns:
+        str: The entered line without the trailing newline
+
+    Raises:
+        TimeoutError: If no line was entered within timeout seconds
+        EOFError: If stdin was closed before a line was entered
+    """
+    if not sys.stdin.isatty():
+        return input(prompt)
+    
+    if hasattr(signal, 'SIGALRM') and threading.current_thread() is threading.main_thread():
+        def timeout_handler(signum, frame):
+            raise TimeoutError(f"No input within {timeout} seconds")
+        
+        with _input_timeout(timeout, timeout_handler):
+            return input(prompt)
+    
+    print(prompt, end='', flush=True)
+    
+    if platform.system() == 'Windows':
+        input_chars = []
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            while msvcrt.kbhit():
+                char = msvcrt.getwche()
+                if char in ('\r', '\n'):
+                    print()
+                    return ''.join(input_chars)
+                if char == '\b':
+                    if input_chars:
+                        input_chars.pop()
+                        print(' \b', end='', flush=True)
+                else:
+                    input_chars.append(char)
+            time.sleep(0.05)
+        raise TimeoutError(f"No input within {timeout} seconds")
+    
+    with selectors.DefaultSelector() as selector:
+        selector.register(sys.stdin, selectors.EVENT_READ)
+        ready = selector.select(timeout)
+    if not ready:
+        raise TimeoutError(f"No input within {timeout} seconds")
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
+
+def _parse_selection(user_input, count):
+    """
+    Parse comma-separated 1-based numbers into sorted unique 0-based indices,
+    printing one warning for all invalid or out-of-range entries
+
+    Args:
+        user_input: Text entered by the user, e.g. "1,3,5"
+        count: Number of items that can be selected
+
+    Returns:
+        list: Sorted 0-based indices of the valid selections
+    """
+    selected_indices = set()
+    invalid = []
+    for part in user_input.split(','):
+        match = _SELECTION_RE.fullmatch(part)
+        if match and 1 <= int(match.group(1)) <= count:
+            selected_indices.add(int(match.group(1)) - 1)
+        else:
+            invalid.append(part.strip())
+    if invalid:
+        print(f"Warning: Ignoring invalid or out-of-range entries (valid: 1-{count}): {', '.join(invalid)}")
+    return sorted(selected_indices)
+
+def _parse_range_selection(user_input, count):
+    """
+    Parse comma-separated 1-based numbers and ranges such as "1,3,5-7" into
+    sorted unique 0-based indices, warning about each invalid entry
+
+    Ranges are clamped to 1-count before they are expanded, so a huge range
+    costs no more than the whole list.
+
+    Args:
+        user_input: Text entered by the user, e.g. "1,3,5-7"
+        count: Number of items that can be selected
+
+    Returns:
+        list: Sorted 0-based indices of the valid selections
+    """
+    # A set, so repeated and overlapping entries are only counted once
+    selected_indices = set()
+    for part in user_input.replace(' ', '').split(','):
+        try:
+            if '-' in part:
+                # Handle range (e.g., "1-5")
+                start, end = map(int, part.split('-'))
+                # Clamp to the valid 1-based indices and convert to 0-based
+                selected_indices.update(range(max(start, 1) - 1, min(end, count)))
+            else:
+                # Handle single number
+                index = int(part)
+                if 1 <= index <= count:
+                    selected_indices.add(index - 1)  # Convert to 0-based
+                else:
+                    print(f"Warning: Index {index} is out of range (1-{count})")
+        except ValueError:
+            print(f"Warning: '{part}' is not a valid number or range")
+    return sorted(selected_indices)
+
 def select_requests_to_accept(fulfilled_requests, no_confirm=False):
     """
     Allow user to select which fulfilled requests to accept
     
     Args:
-        fulfilled_requests: List of fulfilled request dictionaries
+        fulfilled_requests: List of SolvedPaper entries
         no_confirm: If True, automatically accept all requests without user confirmation
     
     Returns:
-        list: Selected requests to accept
+        list: Selected requests to accept; selecting all returns
+            fulfilled_requests itself, which is not modified downstream
     """
     if not fulfilled_requests:
         print("No fulfilled requests available to accept.")
@@ -2491,19 +3630,15 @@ def select_requests_to_accept(fulfilled_requests, no_confirm=False):
     # If no_confirm is True, automatically accept all requests
     if no_confirm:
         print(f"Auto-accepting all {len(fulfilled_requests)} fulfilled request(s) (--noconfirm specified)")
-        return fulfilled_requests.copy()
-    
-    def timeout_handler(signum, frame):
-        print("\nTimeout: No input received within 30 seconds. Quitting.")
-        exit(1)
+        return fulfilled_requests
     
     print(f"\nYou have {len(fulfilled_requests)} fulfilled request(s) available:")
     print("-" * 60)
     
     for i, paper in enumerate(fulfilled_requests, 1):
-        print(f"[{i}] {paper['title']}")
-        if paper.get('doi'):
-            print(f"    DOI: {paper['doi']}")
+        print(f"[{i}] {paper.title}")
+        if paper.doi:
+            print(f"    DOI: {paper.doi}")
     
     print("-" * 60)
     
@@ -2514,16 +3649,7 @@ def select_requests_to_accept(fulfilled_requests, no_confirm=False):
             print("- Enter 'all' or 'a' to accept all requests")
             print("- Enter 'none' or 'n' to accept no requests")
             
-            # Set up timeout signal (only on Unix-like systems)
-            if hasattr(signal, 'SIGALRM'):
-                signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(30)  # 30 second timeout
-            
-            user_input = input("\nWhich requests would you like to accept? ").strip().lower()
-            
-            # Cancel the alarm (only on Unix-like systems)
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)
+            user_input = _input_with_timeout("\nWhich requests would you like to accept? ").strip().lower()
             
             if user_input in ['none', 'n', '']:
                 print("No requests selected for acceptance.")
@@ -2531,65 +3657,120 @@ def select_requests_to_accept(fulfilled_requests, no_confirm=False):
             
             if user_input in ['all', 'a']:
                 print(f"All {len(fulfilled_requests)} requests selected for acceptance.")
-                return fulfilled_requests.copy()
+                return fulfilled_requests
             
-            # Parse comma-separated numbers
-            selected_indices = []
-            for part in user_input.split(','):
-                try:
-                    index = int(part.strip())
-                    if 1 <= index <= len(fulfilled_requests):
-                        selected_indices.append(index - 1)  # Convert to 0-based index
-                    else:
-                        print(f"Warning: Index {index} is out of range (1-{len(fulfilled_requests)})")
-                except ValueError:
-                    print(f"Warning: '{part.strip()}' is not a valid number")
+            # Parse comma-separated numbers into sorted unique indices
+            selected_indices = _parse_selection(user_input, len(fulfilled_requests))
             
             if not selected_indices:
                 print("No valid selections made. Please try again.")
                 continue
             
-            # Remove duplicates and sort
-            selected_indices = sorted(list(set(selected_indices)))
-            selected_requests = [fulfilled_requests[i] for i in selected_indices]
+            # Show the selection from the indices; the list of papers is only
+            # built once the selection is confirmed
+            print(f"\nSelected {len(selected_indices)} request(s) for acceptance:")
+            for i, index in enumerate(selected_indices, 1):
+                print(f"  {i}. {fulfilled_requests[index].title}")
             
-            print(f"\nSelected {len(selected_requests)} request(s) for acceptance:")
-            for i, paper in enumerate(selected_requests, 1):
-                print(f"  {i}. {paper['title']}")
-            
-            # Set up timeout for confirmation (only on Unix-like systems)
-            if hasattr(signal, 'SIGALRM'):
-                signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(30)  # 30 second timeout
-            
-            confirm = input("\nProceed with accepting these requests? (y/n): ").strip().lower()
-            
-            # Cancel the alarm (only on Unix-like systems)
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)
+            confirm = _input_with_timeout("\nProceed with accepting these requests? (y/n): ").strip().lower()
             
             if confirm in ['y', 'yes']:
-                return selected_requests
+                return [fulfilled_requests[i] for i in selected_indices]
             else:
                 print("Selection cancelled. Please choose again.")
                 continue
                 
-        except KeyboardInterrupt:
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)  # Cancel alarm
+        except TimeoutError:
+            print(f"\nTimeout: No input received within {SELECTION_INPUT_TIMEOUT} seconds.")
+            return []
+        except (KeyboardInterrupt, EOFError):
             print("\n\nOperation cancelled by user.")
             return []
         except Exception as e:
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)  # Cancel alarm
             print(f"Error in selection: {str(e)}. Please try again.")
             continue
-        finally:
-            # Make sure alarm is always cancelled (only on Unix-like systems)
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)
 
-def login_and_accept_fulfilled_requests(username, password, headless=False, no_confirm=False):
+def _run_fulfilled_actions(driver, papers, action, label, workers=1, headless=True, rate=DEFAULT_JOB_RATE):
+    """
+    Run action(driver, paper) on every selected fulfilled request or DOI, either one
+    after another on the given driver or concurrently on a BrowserPool,
+    starting at most rate actions per second
+
+    Returns:
+        list: Results in the same order as papers
+    """
+    total = len(papers)
+    # Space out actions to avoid overwhelming the server
+    bucket = TokenBucket(rate)
+    # Extra pause that only grows while the server reports rate limiting
+    # and drops back to nothing after the next action that is not limited
+    backoff = {'delay': 0}
+    backoff_lock = threading.Lock()
+
+    def action_job(action_driver, index, paper):
+        bucket.acquire()
+        print(f"\n--- Processing {label} {index}/{total} ---")
+        result = action(action_driver, paper)
+        with backoff_lock:
+            if _RATE_LIMIT_RE.search(result.get('error') or ''):
+                backoff['delay'] = min(max(backoff['delay'] * 1.5, RATE_LIMIT_BACKOFF_MIN), RATE_LIMIT_BACKOFF_MAX)
+            else:
+                backoff['delay'] = 0
+            delay_seconds = backoff['delay']
+        if delay_seconds:
+            print(f"Rate limited, waiting {delay_seconds:.1f} seconds...")
+            time.sleep(delay_seconds)
+        return result
+
+    if workers > 1 and total > 1:
+        with BrowserPool(driver, min(workers, total), headless) as pool:
+            print(f"Processing with {pool.size} browser(s)")
+
+            def pooled_job(index, paper):
+                with pool.acquire() as pooled_driver:
+                    return action_job(pooled_driver, index, paper)
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=pool.size) as executor:
+                futures = [executor.submit(pooled_job, i, paper) for i, paper in enumerate(papers, 1)]
+                return [future.result() for future in futures]
+
+    return [action_job(driver, i, paper) for i, paper in enumerate(papers, 1)]
+
+def _print_fulfilled_action_summary(heading, count_lines, results, failed_heading, success_heading):
+    """
+    Print the summary block for an accept or reject run
+
+    Args:
+        heading: Title line of the block
+        count_lines: Lines with the counters, printed under the title
+        results: Per-request results with title, success and error
+        failed_heading: Heading over the failed requests
+        success_heading: Heading over the successful requests
+    """
+    # Split the results into failure and success lines in one pass
+    failure_lines = []
+    success_lines = []
+    for result in results:
+        if result['success']:
+            success_lines.append(f"  ✓ {result['title']}")
+        else:
+            failure_lines.append(f"  - {result['title']}")
+            if result['error']:
+                failure_lines.append(f"    Error: {result['error']}")
+    
+    lines = [f"\n{'='*80}", heading, f"{'='*80}"]
+    lines.extend(count_lines)
+    if failure_lines:
+        lines.append(f"\n{failed_heading}")
+        lines.extend(failure_lines)
+    if success_lines:
+        lines.append(f"\n{success_heading}")
+        lines.extend(success_lines)
+    lines.append(f"{'='*80}")
+    # One write for the whole block instead of a print per line
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def login_and_accept_fulfilled_requests(username, password, headless=False, no_confirm=False, workers=1, rate=DEFAULT_JOB_RATE):
     """
     Login to sci-net.xyz, check for fulfilled requests, allow user to select which ones to accept,
     and then accept the selected requests
@@ -2599,11 +3780,13 @@ def login_and_accept_fulfilled_requests(username, password, headless=False, no_c
         password: Password for login  
         headless: Whether to run browser in headless mode
         no_confirm: If True, automatically accept all requests without user confirmation
+        workers: Number of browsers to accept with concurrently (default: 1)
+        rate: Maximum acceptances started per second (default: one every 3 seconds)
     
     Returns:
         dict: Summary of acceptance results
     """
-    driver = login_to_scinet(username, password, headless)
+    driver = login_to_scinet(username, password, headless, minimal_resources=True, page_load_strategy="eager")
     if not driver:
         return None
     
@@ -2630,7 +3813,7 @@ def login_and_accept_fulfilled_requests(username, password, headless=False, no_c
         # If no_confirm is True, accept all requests automatically
         if no_confirm:
             print("\nAuto-accepting all fulfilled requests (--noconfirm specified)...")
-            selected_requests = solved_papers.copy()
+            selected_requests = solved_papers
         elif headless:
             # In headless mode without no_confirm, we cannot interact with user
             print("\nRunning in headless mode - cannot select requests interactively.")
@@ -2661,23 +3844,12 @@ def login_and_accept_fulfilled_requests(username, password, headless=False, no_c
         
         # Process each selected request
         print(f"\nProcessing {len(selected_requests)} selected request(s)...")
-        results = []
-        successful_accepts = 0
-        failed_accepts = 0
-        
-        for i, paper in enumerate(selected_requests, 1):
-            print(f"\n--- Processing request {i}/{len(selected_requests)} ---")
-            result = accept_fulfilled_request(driver, paper)
-            results.append(result)
-            
-            if result['success']:
-                successful_accepts += 1
-            else:
-                failed_accepts += 1
-            
-            # Small delay between requests
-            if i < len(selected_requests):
-                time.sleep(2)
+        results = _run_fulfilled_actions(
+            driver, selected_requests, accept_fulfilled_request, "request",
+            workers=workers, headless=headless, rate=rate
+        )
+        successful_accepts = sum(1 for result in results if result['success'])
+        failed_accepts = len(results) - successful_accepts
         
         # Summary
         summary = {
@@ -2690,35 +3862,22 @@ def login_and_accept_fulfilled_requests(username, password, headless=False, no_c
             'timestamp': datetime.now().isoformat()
         }
         
-        print(f"\n{'='*80}")
-        print(f"ACCEPTANCE SUMMARY")
-        print(f"{'='*80}")
-        print(f"Total fulfilled requests: {summary['total_requests']}")
-        print(f"Selected for acceptance: {summary['selected_requests']}")
-        print(f"Successfully accepted: {summary['accepted_requests']}")
-        print(f"Failed to accept: {summary['failed_requests']}")
-        
-        if failed_accepts > 0:
-            print(f"\nFailed requests:")
-            for result in results:
-                if not result['success']:
-                    print(f"  - {result['title']}")
-                    if result['error']:
-                        print(f"    Error: {result['error']}")
-        
-        if successful_accepts > 0:
-            print(f"\nSuccessfully accepted requests:")
-            for result in results:
-                if result['success']:
-                    print(f"  ✓ {result['title']}")
-        
-        print(f"{'='*80}")
+        _print_fulfilled_action_summary(
+            "ACCEPTANCE SUMMARY",
+            [
+                f"Total fulfilled requests: {summary['total_requests']}",
+                f"Selected for acceptance: {summary['selected_requests']}",
+                f"Successfully accepted: {summary['accepted_requests']}",
+                f"Failed to accept: {summary['failed_requests']}",
+            ],
+            results, "Failed requests:", "Successfully accepted requests:"
+        )
         
         return summary
         
     finally:
         print("Accept fulfilled requests process completed, closing browser.")
-        driver.quit()
+        quit_driver_in_background(driver)
 
 def reject_fulfilled_request_by_doi(driver, doi, reject_message="Paper quality does not meet requirements"):
     """
@@ -2752,28 +3911,20 @@ def reject_fulfilled_request_by_doi(driver, doi, reject_message="Paper quality d
         print(f"Navigating to: {doi_url}")
         driver.get(doi_url)
         
-        # Wait for the page to load
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        # Try to find and click the "View" button on the paper page
+        # Try to find and click the "View" button on the paper page; the
+        # wait for the view link also covers the page load
         try:
             print("Looking for View button in preview section...")
-            preview_div = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div.preview"))
-            )
-            try:
-                view_link = preview_div.find_element(By.CSS_SELECTOR, "a.button.green")
-            except:
-                view_link = preview_div.find_element(By.CSS_SELECTOR, "a.button")
+            view_link = _wait_for_view_link(driver)
             print("Found View link, clicking...")
             view_link.click()
             result['view_clicked'] = True
             
-            # Wait for the page to load
+            # Wait for the report link instead of a fixed pause
             print("Waiting for page to load...")
-            time.sleep(5)
+            fast_wait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, REPORT_LINK_SELECTOR))
+            )
         except Exception as view_error:
             print(f"Warning: Could not find or click View button: {str(view_error)}")
             debug_print(f"View button error: {str(view_error)}")
@@ -2783,24 +3934,29 @@ def reject_fulfilled_request_by_doi(driver, doi, reject_message="Paper quality d
             print("Looking for Report problem button...")
             
             # Find the report link with class "problem" and onclick "problem()"
-            report_link = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "a.problem[onclick='problem()']"))
+            report_link = fast_wait(driver, 10).until(
+                EC.element_to_be_clickable((By.CSS_SELECTOR, REPORT_LINK_SELECTOR))
             )
             
             print("Found Report problem link, clicking...")
             debug_print(f"Report link text: '{report_link.text}'")
             debug_print(f"Report link onclick: {report_link.get_attribute('onclick')}")
             
-            # Scroll to the link to ensure it's visible
-            driver.execute_script("arguments[0].scrollIntoView(true);", report_link)
-            time.sleep(1)
-            
-            # Click the report link
+            # Click the report link natively: it may open a JavaScript prompt,
+            # which would leave a script-driven click hanging. WebDriver
+            # scrolls the link into view itself, so no pause is needed
             report_link.click()
             result['reject_clicked'] = True
             
             print("Report link clicked, waiting for message interface...")
-            time.sleep(3)
+            # The message is asked for either in an input box or in a
+            # JavaScript prompt; wait for whichever shows up first
+            try:
+                fast_wait(driver, 5).until(
+                    lambda d: EC.alert_is_present()(d) or d.find_elements(By.CSS_SELECTOR, REPORT_INPUT_SELECTOR)
+                )
+            except TimeoutException:
+                debug_print("No message interface appeared after 5 seconds")
             
             # Handle the report message input
             if not _handle_report_message_input(driver, reject_message):
@@ -2849,7 +4005,21 @@ def login_and_reject_fulfilled_request_by_doi(username, password, doi, reject_me
     Returns:
         dict: Result of the rejection attempt
     """
-    driver = login_to_scinet(username, password, headless)
+    # A malformed DOI can never match a request, so fail before paying
+    # for the browser start and login
+    if not is_valid_doi(doi):
+        print(f"Error: Invalid DOI format: '{doi}'")
+        return {
+            'doi': doi,
+            'success': False,
+            'error': 'Invalid DOI format',
+            'view_clicked': False,
+            'reject_clicked': False,
+            'reject_message': reject_message,
+            'request_url': ''
+        }
+    
+    driver = login_to_scinet(username, password, headless, minimal_resources=True, page_load_strategy="eager")
     if not driver:
         return None
     
@@ -2858,7 +4028,38 @@ def login_and_reject_fulfilled_request_by_doi(username, password, doi, reject_me
         return result
     finally:
         print("Reject fulfilled request by DOI process completed, closing browser.")
-        driver.quit()
+        quit_driver_in_background(driver)
+
+def reject_fulfilled_requests_by_dois(username, password, dois, reject_message="Paper quality does not meet requirements", headless=False, workers=1, rate=DEFAULT_JOB_RATE):
+    """
+    Login to sci-net.xyz once and reject the fulfilled requests for several DOIs
+    
+    Args:
+        username: Username for login
+        password: Password for login
+        dois: List of DOIs of the fulfilled requests to reject
+        reject_message: Message to include when rejecting each paper
+        headless: Whether to run browser in headless mode
+        workers: Number of browsers to reject with concurrently (default: 1)
+        rate: Maximum rejections started per second (default: one every 3 seconds)
+    
+    Returns:
+        list: Result of each rejection attempt, in the order of dois,
+            or None if login failed
+    """
+    driver = login_to_scinet(username, password, headless, minimal_resources=True, page_load_strategy="eager")
+    if not driver:
+        return None
+    
+    try:
+        return _run_fulfilled_actions(
+            driver, dois,
+            lambda action_driver, doi: reject_fulfilled_request_by_doi(action_driver, doi, reject_message),
+            "DOI", workers=workers, headless=headless, rate=rate
+        )
+    finally:
+        print("Reject fulfilled requests by DOI process completed, closing browser.")
+        quit_driver_in_background(driver)
 
 def reject_fulfilled_request(driver, paper, reject_message="Paper quality does not meet requirements"):
     """
@@ -2866,15 +4067,15 @@ def reject_fulfilled_request(driver, paper, reject_message="Paper quality does n
     
     Args:
         driver: Selenium WebDriver instance
-        paper: Dictionary containing paper information with 'doi' and other details
+        paper: SolvedPaper from check_fulfilled_requests()
         reject_message: Message to include when rejecting the paper
     
     Returns:
         dict: Result of the rejection attempt
     """
     try:
-        title = paper.get('title', 'Unknown')
-        doi = paper.get('doi', '')
+        title = paper.title
+        doi = paper.doi
         
         print(f"\nProcessing: {title}")
         
@@ -2883,7 +4084,7 @@ def reject_fulfilled_request(driver, paper, reject_message="Paper quality does n
             print(f"Error: {error_msg}")
             return {
                 'title': title,
-                'link': paper.get('link', ''),
+                'link': paper.link,
                 'success': False,
                 'error': error_msg,
                 'view_clicked': False,
@@ -2899,7 +4100,7 @@ def reject_fulfilled_request(driver, paper, reject_message="Paper quality does n
         
         # Update the result to include the original paper data
         result['title'] = title
-        result['link'] = paper.get('link', '')
+        result['link'] = paper.link
         
         return result
         
@@ -2907,8 +4108,8 @@ def reject_fulfilled_request(driver, paper, reject_message="Paper quality does n
         error_msg = f"Error rejecting fulfilled request: {str(e)}"
         print(f"Error: {error_msg}")
         return {
-            'title': paper.get('title', 'Unknown'),
-            'link': paper.get('link', ''),
+            'title': paper.title,
+            'link': paper.link,
             'success': False,
             'error': error_msg,
             'view_clicked': False,
@@ -2926,28 +4127,12 @@ def _handle_report_message_input(driver, reject_message):
     try:
         print("Looking for report message input box...")
         
-        # Try different input selectors in order of preference
-        input_selectors = [
-            "textarea",
-            "input[type='text']", 
-            "input[placeholder*='message']",
-            "input[placeholder*='reason']",
-            "input"
-        ]
-        
-        message_input = None
-        for selector in input_selectors:
-            try:
-                message_input = WebDriverWait(driver, 5).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                )
-                print(f"Found input using selector: {selector}")
-                break
-            except TimeoutException:
-                continue
-        
-        if not message_input:
+        # Wait once for any of the input selectors, in order of preference
+        try:
+            message_input = _wait_for_first(driver, REPORT_MESSAGE_INPUT_SELECTORS, 5)
+        except TimeoutException:
             return False
+        print(f"Found input: {message_input.tag_name}")
         
         print("Entering rejection message...")
         message_input.clear()
@@ -2968,25 +4153,18 @@ def _submit_report_message(driver, message_input):
         bool: True if submission was attempted, False otherwise
     """
     try:
-        # Try to find and click submit button
-        submit_selectors = [
-            "button[type='submit']",
-            "input[type='submit']", 
-            "button:contains('Submit')",
-            "button:contains('Send')",
-            "button"
-        ]
-        
-        for selector in submit_selectors:
+        # Find the submit button in one script call; CSS has no text
+        # matching, so the Submit/Send labels are checked in JavaScript
+        submit_button = driver.execute_script(SUBMIT_BUTTON_JS)
+        if submit_button:
             try:
-                submit_button = driver.find_element(By.CSS_SELECTOR, selector)
-                print(f"Found submit button using selector: {selector}")
+                print("Found submit button, clicking...")
                 submit_button.click()
                 print("Submit button clicked")
                 time.sleep(5)
                 return True
-            except:
-                continue
+            except Exception as click_error:
+                debug_print(f"Could not click submit button: {str(click_error)}")
         
         # If no submit button found, try pressing Enter
         print("No submit button found, pressing Enter...")
@@ -3018,26 +4196,21 @@ def _log_debug_info(driver):
     Log debug information about available elements
     """
     try:
+        # Read the problem links and report spans in one script call instead
+        # of a WebDriver command per attribute of every element
+        info = driver.execute_script(REPORT_DEBUG_JS)
+        
         # Look for problem-related elements
-        problem_links = driver.find_elements(By.CSS_SELECTOR, "a.problem")
+        problem_links = info['problem_links']
         print(f"Debug: Found {len(problem_links)} elements with class 'problem'")
         for i, link in enumerate(problem_links):
-            try:
-                onclick = link.get_attribute('onclick')
-                text = link.text.strip()
-                print(f"  {i+1}. onclick: '{onclick}', text: '{text}'")
-            except:
-                pass
+            print(f"  {i+1}. onclick: '{link['onclick']}', text: '{link['text']}'")
         
         # Look for spans containing report text
-        spans = driver.find_elements(By.TAG_NAME, "span")
-        report_spans = [span for span in spans if "report" in span.text.lower()]
+        report_spans = info['report_spans']
         print(f"Debug: Found {len(report_spans)} spans containing 'report'")
-        for i, span in enumerate(report_spans[:3]):
-            try:
-                print(f"  {i+1}. text: '{span.text.strip()}'")
-            except:
-                pass
+        for i, text in enumerate(report_spans[:3]):
+            print(f"  {i+1}. text: '{text}'")
                 
     except Exception as debug_error:
         print(f"Debug: Error during debugging: {str(debug_error)}")
@@ -3047,11 +4220,12 @@ def select_requests_to_reject(fulfilled_requests, no_confirm=False):
     Allow user to select which fulfilled requests to reject
     
     Args:
-        fulfilled_requests: List of fulfilled request dictionaries
+        fulfilled_requests: List of SolvedPaper entries
         no_confirm: If True, automatically reject all requests without user confirmation
     
     Returns:
-        tuple: (selected_requests, rejection_message)
+        tuple: (selected_requests, rejection_message); selecting all
+            returns fulfilled_requests itself, which is not modified downstream
     """
     if not fulfilled_requests:
         print("No fulfilled requests available to reject.")
@@ -3061,19 +4235,15 @@ def select_requests_to_reject(fulfilled_requests, no_confirm=False):
     if no_confirm:
         print(f"Auto-rejecting all {len(fulfilled_requests)} fulfilled request(s) (--noconfirm specified)")
         default_message = "Paper quality does not meet requirements"
-        return fulfilled_requests.copy(), default_message
-    
-    def timeout_handler(signum, frame):
-        print("\nTimeout: No input received within 30 seconds. Quitting.")
-        exit(1)
+        return fulfilled_requests, default_message
     
     print(f"\nYou have {len(fulfilled_requests)} fulfilled request(s) available:")
     print("-" * 60)
     
     for i, paper in enumerate(fulfilled_requests, 1):
-        print(f"[{i}] {paper['title']}")
-        if paper.get('doi'):
-            print(f"    DOI: {paper['doi']}")
+        print(f"[{i}] {paper.title}")
+        if paper.doi:
+            print(f"    DOI: {paper.doi}")
     
     print("-" * 60)
     
@@ -3084,62 +4254,33 @@ def select_requests_to_reject(fulfilled_requests, no_confirm=False):
             print("- Enter 'all' or 'a' to reject all requests")
             print("- Enter 'none' or 'n' to reject no requests")
             
-            # Set up timeout signal (only on Unix-like systems)
-            if hasattr(signal, 'SIGALRM'):
-                signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(30)  # 30 second timeout
-            
-            user_input = input("\nWhich requests would you like to reject? ").strip().lower()
-            
-            # Cancel the alarm (only on Unix-like systems)
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)
+            user_input = _input_with_timeout("\nWhich requests would you like to reject? ").strip().lower()
             
             if user_input in ['none', 'n', '']:
                 print("No requests selected for rejection.")
                 return [], ""
             
             if user_input in ['all', 'a']:
-                selected_requests = fulfilled_requests.copy()
+                selected_indices = range(len(fulfilled_requests))
             else:
-                # Parse comma-separated numbers
-                selected_indices = []
-                for part in user_input.split(','):
-                    try:
-                        index = int(part.strip())
-                        if 1 <= index <= len(fulfilled_requests):
-                            selected_indices.append(index - 1)  # Convert to 0-based index
-                        else:
-                            print(f"Warning: Index {index} is out of range (1-{len(fulfilled_requests)})")
-                    except ValueError:
-                        print(f"Warning: '{part.strip()}' is not a valid number")
+                # Parse comma-separated numbers into sorted unique indices
+                selected_indices = _parse_selection(user_input, len(fulfilled_requests))
                 
                 if not selected_indices:
                     print("No valid selections made. Please try again.")
                     continue
-                
-                # Remove duplicates and sort
-                selected_indices = sorted(list(set(selected_indices)))
-                selected_requests = [fulfilled_requests[i] for i in selected_indices]
             
-            print(f"\nSelected {len(selected_requests)} request(s) for rejection:")
-            for i, paper in enumerate(selected_requests, 1):
-                print(f"  {i}. {paper['title']}")
+            # Show the selection from the indices; the list of papers is only
+            # built once the selection is confirmed
+            print(f"\nSelected {len(selected_indices)} request(s) for rejection:")
+            for i, index in enumerate(selected_indices, 1):
+                print(f"  {i}. {fulfilled_requests[index].title}")
             
             # Get rejection message
             print("\nPlease provide a reason for rejecting these requests:")
             print("(Common reasons: 'Paper quality does not meet requirements', 'Wrong paper uploaded', 'PDF is corrupted', etc.)")
             
-            # Set up timeout for rejection message input (only on Unix-like systems)
-            if hasattr(signal, 'SIGALRM'):
-                signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(30)  # 30 second timeout
-            
-            reject_message = input("Rejection reason: ").strip()
-            
-            # Cancel the alarm (only on Unix-like systems)
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)
+            reject_message = _input_with_timeout("Rejection reason: ").strip()
             
             if not reject_message:
                 reject_message = "Paper quality does not meet requirements"
@@ -3147,39 +4288,27 @@ def select_requests_to_reject(fulfilled_requests, no_confirm=False):
             
             print(f"\nRejection message: '{reject_message}'")
             
-            # Set up timeout for confirmation (only on Unix-like systems)
-            if hasattr(signal, 'SIGALRM'):
-                signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(30)  # 30 second timeout
-            
-            confirm = input("\nProceed with rejecting these requests? (y/n): ").strip().lower()
-            
-            # Cancel the alarm (only on Unix-like systems)
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)
+            confirm = _input_with_timeout("\nProceed with rejecting these requests? (y/n): ").strip().lower()
             
             if confirm in ['y', 'yes']:
-                return selected_requests, reject_message
+                if user_input in ['all', 'a']:
+                    return fulfilled_requests, reject_message
+                return [fulfilled_requests[i] for i in selected_indices], reject_message
             else:
                 print("Selection cancelled. Please choose again.")
                 continue
                 
-        except KeyboardInterrupt:
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)  # Cancel alarm
+        except TimeoutError:
+            print(f"\nTimeout: No input received within {SELECTION_INPUT_TIMEOUT} seconds.")
+            return [], ""
+        except (KeyboardInterrupt, EOFError):
             print("\n\nOperation cancelled by user.")
             return [], ""
         except Exception as e:
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)  # Cancel alarm
             print(f"Error in selection: {str(e)}. Please try again.")
             continue
-        finally:
-            # Make sure alarm is always cancelled (only on Unix-like systems)
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)
 
-def login_and_reject_fulfilled_requests(username, password, headless=False, reject_message=None, no_confirm=False):
+def login_and_reject_fulfilled_requests(username, password, headless=False, reject_message=None, no_confirm=False, workers=1, rate=DEFAULT_JOB_RATE):
     """
     Login to sci-net.xyz, check for fulfilled requests, allow user to select which ones to reject,
     and then reject the selected requests
@@ -3190,11 +4319,13 @@ def login_and_reject_fulfilled_requests(username, password, headless=False, reje
         headless: Whether to run browser in headless mode
         reject_message: Optional default rejection message
         no_confirm: If True, automatically reject all requests without user confirmation
+        workers: Number of browsers to reject with concurrently (default: 1)
+        rate: Maximum rejections started per second (default: one every 3 seconds)
     
     Returns:
         dict: Summary of rejection results
     """
-    driver = login_to_scinet(username, password, headless)
+    driver = login_to_scinet(username, password, headless, minimal_resources=True, page_load_strategy="eager")
     if not driver:
         return None
     
@@ -3221,7 +4352,7 @@ def login_and_reject_fulfilled_requests(username, password, headless=False, reje
         # If no_confirm is True, reject all requests automatically
         if no_confirm:
             print("\nAuto-rejecting all fulfilled requests (--noconfirm specified)...")
-            selected_requests = solved_papers.copy()
+            selected_requests = solved_papers
             rejection_message = reject_message or "Paper quality does not meet requirements"
         elif headless:
             # In headless mode without no_confirm, we cannot interact with user
@@ -3253,23 +4384,13 @@ def login_and_reject_fulfilled_requests(username, password, headless=False, reje
         
         # Process each selected request
         print(f"\nProcessing {len(selected_requests)} selected request(s) for rejection...")
-        results = []
-        successful_rejects = 0
-        failed_rejects = 0
-        
-        for i, paper in enumerate(selected_requests, 1):
-            print(f"\n--- Processing rejection {i}/{len(selected_requests)} ---")
-            result = reject_fulfilled_request(driver, paper, rejection_message)
-            results.append(result)
-            
-            if result['success']:
-                successful_rejects += 1
-            else:
-                failed_rejects += 1
-            
-            # Small delay between requests
-            if i < len(selected_requests):
-                time.sleep(2)
+        results = _run_fulfilled_actions(
+            driver, selected_requests,
+            lambda action_driver, paper: reject_fulfilled_request(action_driver, paper, rejection_message),
+            "rejection", workers=workers, headless=headless, rate=rate
+        )
+        successful_rejects = sum(1 for result in results if result['success'])
+        failed_rejects = len(results) - successful_rejects
         
         # Summary
         summary = {
@@ -3283,36 +4404,46 @@ def login_and_reject_fulfilled_requests(username, password, headless=False, reje
             'timestamp': datetime.now().isoformat()
         }
         
-        print(f"\n{'='*80}")
-        print(f"REJECTION SUMMARY")
-        print(f"{'='*80}")
-        print(f"Total fulfilled requests: {summary['total_requests']}")
-        print(f"Selected for rejection: {summary['selected_requests']}")
-        print(f"Successfully rejected: {summary['rejected_requests']}")
-        print(f"Failed to reject: {summary['failed_requests']}")
-        print(f"Rejection message: '{summary['rejection_message']}'")
-        
-        if failed_rejects > 0:
-            print(f"\nFailed rejections:")
-            for result in results:
-                if not result['success']:
-                    print(f"  - {result['title']}")
-                    if result['error']:
-                        print(f"    Error: {result['error']}")
-        
-        if successful_rejects > 0:
-            print(f"\nSuccessfully rejected requests:")
-            for result in results:
-                if result['success']:
-                    print(f"  ✓ {result['title']}")
-        
-        print(f"{'='*80}")
+        _print_fulfilled_action_summary(
+            "REJECTION SUMMARY",
+            [
+                f"Total fulfilled requests: {summary['total_requests']}",
+                f"Selected for rejection: {summary['selected_requests']}",
+                f"Successfully rejected: {summary['rejected_requests']}",
+                f"Failed to reject: {summary['failed_requests']}",
+                f"Rejection message: '{summary['rejection_message']}'",
+            ],
+            results, "Failed rejections:", "Successfully rejected requests:"
+        )
         
         return summary
         
     finally:
         print("Reject fulfilled requests process completed, closing browser.")
-        driver.quit()
+        quit_driver_in_background(driver)
+
+@lru_cache(maxsize=1)
+def _setup_readline():
+    """Configure readline key bindings and delimiters for path completion once per process"""
+    readline.parse_and_bind("tab: complete")
+    readline.set_completer_delims(' \t\n`!@#$%^&*()=+[{]}\\|;:\'",<>?')
+
+@lru_cache(maxsize=64)
+def _path_completions(directory, prefix):
+    """Sorted completions for prefix in directory, with a trailing slash on directories"""
+    try:
+        with os.scandir(directory or '.') as entries:
+            # DirEntry.is_dir() reuses the type scandir already read, so no extra stat per match
+            completions = sorted(
+                os.path.join(directory, entry.name) + ('/' if entry.is_dir() else '')
+                for entry in entries
+                if entry.name.startswith(prefix)
+                # Like glob, only offer hidden entries once a dot has been typed
+                and (prefix.startswith('.') or not entry.name.startswith('.'))
+            )
+    except OSError:
+        completions = []
+    return tuple(completions)
 
 def get_file_path_with_completion(prompt="Enter file path: "):
     """
@@ -3331,35 +4462,8 @@ def get_file_path_with_completion(prompt="Enter file path: "):
         if text.startswith('~'):
             text = os.path.expanduser(text)
         
-        # If text ends with a slash, it's a directory - list contents
-        if text.endswith('/'):
-            directory = text
-        else:
-            # Get the directory part and filename part
-            directory = os.path.dirname(text)
-            if not directory:
-                directory = '.'
-            
-        # Get all possible completions
-        if text.endswith('/'):
-            # List directory contents
-            pattern = text + '*'
-        else:
-            # Complete filename
-            pattern = text + '*'
-        
-        matches = glob.glob(pattern)
-        
-        # Add trailing slash for directories
-        completions = []
-        for match in matches:
-            if os.path.isdir(match) and not match.endswith('/'):
-                completions.append(match + '/')
-            else:
-                completions.append(match)
-        
-        # Sort completions
-        completions.sort()
+        directory, prefix = os.path.split(text)
+        completions = _path_completions(directory, prefix)
         
         try:
             return completions[state]
@@ -3369,25 +4473,17 @@ def get_file_path_with_completion(prompt="Enter file path: "):
         print("\nTimeout: No input received within 30 seconds. Quitting.")
         exit(1)
     
-    # Set up readline with tab completion
-    readline.parse_and_bind("tab: complete")
+    # Set up readline with tab completion; listings are only reused within this prompt
+    _setup_readline()
+    _path_completions.cache_clear()
     readline.set_completer(complete_path)
-    readline.set_completer_delims(' \t\n`!@#$%^&*()=+[{]}\\|;:\'",<>?')
     
     try:
         while True:
             try:
-                # Set up timeout signal (only on Unix-like systems)
-                if hasattr(signal, 'SIGALRM'):
-                    signal.signal(signal.SIGALRM, timeout_handler)
-                    signal.alarm(30)  # 30 second timeout
-                
                 # Get input with tab completion
-                file_path = input(prompt).strip()
-                
-                # Cancel the alarm (only on Unix-like systems)
-                if hasattr(signal, 'alarm'):
-                    signal.alarm(0)
+                with _input_timeout(30, timeout_handler):
+                    file_path = input(prompt).strip()
                 
                 if not file_path:
                     print("Please enter a valid file path or press Ctrl+C to cancel.")
@@ -3416,21 +4512,30 @@ def get_file_path_with_completion(prompt="Enter file path: "):
                     continue
                     
             except EOFError:
-                if hasattr(signal, 'alarm'):
-                    signal.alarm(0)  # Cancel alarm
                 print("\nOperation cancelled.")
                 return None
                 
     except KeyboardInterrupt:
-        if hasattr(signal, 'alarm'):
-            signal.alarm(0)  # Cancel alarm
         print("\nOperation cancelled by user.")
         return None
     finally:
         # Clean up
-        if hasattr(signal, 'alarm'):
-            signal.alarm(0)  # Make sure alarm is cancelled
         readline.set_completer(None)
+        _path_completions.cache_clear()
+
+def _solve_page_ready(page_state):
+    """
+    Check a SOLVE_PAGE_STATE_JS result for something solve_request_by_doi() can act on
+
+    Args:
+        page_state: Dictionary returned by SOLVE_PAGE_STATE_JS
+
+    Returns:
+        dict or bool: page_state once a solution or upload button is present, else False
+    """
+    if page_state['has_solution'] or page_state['upload_button']:
+        return page_state
+    return False
 
 def solve_request_by_doi(driver, doi, pdf_path):
     """
@@ -3461,8 +4566,10 @@ def solve_request_by_doi(driver, doi, pdf_path):
         print(f"\nSolving request by DOI: {doi}")
         print(f"PDF: {os.path.basename(pdf_path)}")
         
-        # Check if PDF file exists
-        if not os.path.exists(pdf_path):
+        # Check that the PDF file exists and read its size with one stat call
+        try:
+            file_size_mb = os.stat(pdf_path).st_size / (1024 * 1024)
+        except FileNotFoundError:
             return {
                 'request': request_data,
                 'success': False,
@@ -3471,17 +4578,13 @@ def solve_request_by_doi(driver, doi, pdf_path):
                 'upload_attempted': False,
                 'submit_attempted': False
             }
+        abs_path = os.path.abspath(pdf_path)
         
         # Navigate to the DOI-specific page
         doi_url = f"https://sci-net.xyz/{doi}"
         print(f"Navigating to: {doi_url}")
         driver.get(doi_url)
         
-        # Wait for the page to load
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
         result = {
             'request': request_data,
             'success': False,
@@ -3492,30 +4595,25 @@ def solve_request_by_doi(driver, doi, pdf_path):
             'submit_attempted': False
         }
         
-        # Check if we're on the correct DOI page and if upload is possible
-        current_url = driver.current_url
-        debug_print(f"Current URL after navigation: {current_url}")
-        
         # Look for upload elements or existing solutions
         try:
+            # Read the page state in one script call; the first call usually
+            # settles it and polling only continues while neither an existing
+            # solution nor the upload button has rendered
+            debug_print("Looking for respond block with upload button...")
+            page_state = WebDriverWait(driver, 10, poll_frequency=SOLVE_PAGE_POLL_SECONDS).until(
+                lambda d: _solve_page_ready(d.execute_script(SOLVE_PAGE_STATE_JS))
+            )
+            debug_print(f"Current URL after navigation: {page_state['url']}")
+            
             # Check if there's already a solution posted
-            existing_solution = driver.find_elements(By.CSS_SELECTOR, ".solved, .solution")
-            if existing_solution:
+            if page_state['has_solution']:
                 print("Notice: This request appears to already have a solution posted")
                 result['error'] = 'Request already has a solution'
                 return result
             
-            # Look for the respond block containing the upload button
-            debug_print("Looking for respond block with upload button...")
-            respond_block = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div.respond.block"))
-            )
-            debug_print("Respond block found")
-            
-            # Find the upload button within the respond block
-            debug_print("Looking for upload button...")
-            upload_button = respond_block.find_element(By.CSS_SELECTOR, "a.button[onclick*='upload']")
-            debug_print(f"Upload button found with onclick: {upload_button.get_attribute('onclick')}")
+            upload_button = page_state['upload_button']
+            debug_print(f"Upload button found with onclick: {page_state['upload_onclick']}")
             
             # Create file input for upload (hidden)
             debug_print("Creating file input for upload...")
@@ -3534,7 +4632,6 @@ def solve_request_by_doi(driver, doi, pdf_path):
             
             # Upload the PDF file
             debug_print("Uploading PDF file...")
-            abs_path = os.path.abspath(pdf_path)
             file_input.send_keys(abs_path)
             result['upload_attempted'] = True
             
@@ -3593,19 +4690,24 @@ def solve_request_by_doi(driver, doi, pdf_path):
             debug_print(f"JavaScript execution result: {js_result}")
             
             # Calculate wait time based on file size
-            file_size_mb = os.path.getsize(pdf_path) / (1024 * 1024)
             wait_time = max(15, min(120, int(file_size_mb * 8)))  # Longer wait for solving
             
-            debug_print(f"File size: {file_size_mb:.2f} MB, waiting {wait_time} seconds for upload...")
-            print(f"Waiting {wait_time} seconds for upload to complete...")
-            time.sleep(wait_time)
+            debug_print(f"File size: {file_size_mb:.2f} MB, waiting up to {wait_time} seconds for upload...")
+            print(f"Waiting up to {wait_time} seconds for upload to complete...")
             
-            # Check for uploaded block to confirm successful upload
+            # Check for uploaded block to confirm successful upload; the wait
+            # ends as soon as the block or a visible upload error shows up
             try:
                 debug_print("Looking for uploaded block...")
-                uploaded_block = WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.uploaded.block"))
-                )
+                WebDriverWait(driver, wait_time).until(EC.any_of(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.uploaded.block")),
+                    EC.visibility_of_element_located((By.CSS_SELECTOR, ".error"))
+                ))
+                uploaded_blocks = driver.find_elements(By.CSS_SELECTOR, "div.uploaded.block")
+                if not uploaded_blocks:
+                    # An error was shown instead; report it like a missing block
+                    raise TimeoutException("Upload error shown before uploaded block")
+                uploaded_block = uploaded_blocks[0]
                 
                 # Get upload details from the uploaded block
                 try:
@@ -3767,7 +4869,7 @@ def login_and_solve_request_by_doi(username, password, doi, pdf_path, headless=F
         return result
     finally:
         print("Solve request by DOI process completed, closing browser.")
-        driver.quit()
+        quit_driver_in_background(driver)
 
 
 def solve_active_request(driver, request_data):
@@ -3853,10 +4955,6 @@ def select_requests_to_solve(active_requests, no_confirm=False):
         print(f"Auto-selecting all {len(active_requests)} active request(s) (--noconfirm specified)")
         return active_requests.copy()
     
-    def timeout_handler(signum, frame):
-        print("\nTimeout: No input received within 30 seconds. Quitting.")
-        exit(1)
-    
     while True:
         try:
             print("\nOptions:")
@@ -3865,52 +4963,21 @@ def select_requests_to_solve(active_requests, no_confirm=False):
             print("- Enter 'all' or 'a' to solve all requests")
             print("- Enter 'none' or 'n' to solve no requests")
             
-            # Set up timeout signal (only on Unix-like systems)
-            if hasattr(signal, 'SIGALRM'):
-                signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(30)  # 30 second timeout
-            
-            user_input = input("\nWhich requests would you like to solve? ").strip().lower()
-            
-            # Cancel the alarm (only on Unix-like systems)
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)
+            user_input = _input_with_timeout("\nWhich requests would you like to solve? ").strip().lower()
             
             if user_input in ['none', 'n', '']:
                 print("No requests selected for solving.")
                 return []
             
-            selected_indices = []
-            
             if user_input in ['all', 'a']:
                 selected_indices = list(range(len(active_requests)))
             else:
-                # Parse input (comma-separated numbers and ranges)
-                parts = user_input.replace(' ', '').split(',')
-                for part in parts:
-                    try:
-                        if '-' in part:
-                            # Handle range (e.g., "1-5")
-                            start, end = map(int, part.split('-'))
-                            for idx in range(start, end + 1):
-                                if 1 <= idx <= len(active_requests):
-                                    selected_indices.append(idx - 1)  # Convert to 0-based
-                        else:
-                            # Handle single number
-                            index = int(part)
-                            if 1 <= index <= len(active_requests):
-                                selected_indices.append(index - 1)  # Convert to 0-based
-                            else:
-                                print(f"Warning: Index {index} is out of range (1-{len(active_requests)})")
-                    except ValueError:
-                        print(f"Warning: '{part}' is not a valid number or range")
+                selected_indices = _parse_range_selection(user_input, len(active_requests))
             
             if not selected_indices:
                 print("No valid selections made. Please try again.")
                 continue
             
-            # Remove duplicates and sort
-            selected_indices = sorted(list(set(selected_indices)))
             selected_requests = [active_requests[i] for i in selected_indices]
             
             print(f"\nSelected {len(selected_requests)} request(s) for solving:")
@@ -3919,16 +4986,7 @@ def select_requests_to_solve(active_requests, no_confirm=False):
                 if request.get('doi'):
                     print(f"     DOI: {request['doi']}")
             
-            # Set up timeout for confirmation (only on Unix-like systems)
-            if hasattr(signal, 'SIGALRM'):
-                signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(30)  # 30 second timeout
-            
-            confirm = input(f"\nProceed with solving these {len(selected_requests)} requests? (y/n): ").strip().lower()
-            
-            # Cancel the alarm (only on Unix-like systems)
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)
+            confirm = _input_with_timeout(f"\nProceed with solving these {len(selected_requests)} requests? (y/n): ").strip().lower()
             
             if confirm in ['y', 'yes']:
                 return selected_requests
@@ -3936,20 +4994,15 @@ def select_requests_to_solve(active_requests, no_confirm=False):
                 print("Selection cancelled. Please choose again.")
                 continue
                 
-        except KeyboardInterrupt:
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)  # Cancel alarm
+        except TimeoutError:
+            print(f"\nTimeout: No input received within {SELECTION_INPUT_TIMEOUT} seconds.")
+            return []
+        except (KeyboardInterrupt, EOFError):
             print("\n\nOperation cancelled by user.")
             return []
         except Exception as e:
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)  # Cancel alarm
             print(f"Error in selection: {str(e)}. Please try again.")
             continue
-        finally:
-            # Make sure alarm is always cancelled (only on Unix-like systems)
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)
 
 def solve_active_requests(driver, limit=None, no_confirm=False):
     """
@@ -4095,7 +5148,7 @@ def login_and_solve_active_requests(username, password, headless=False, limit=No
         return result
     finally:
         print("Solve active requests process completed, closing browser.")
-        driver.quit()
+        quit_driver_in_background(driver)
 
 def get_waiting_requests(driver, limit=None):
     """
@@ -4167,10 +5220,7 @@ def get_waiting_requests(driver, limit=None):
                         
                         # Extract DOI from href (format: /10.xxxx/xxxxx)
                         href = link.get_attribute("href")
-                        if href and '/10.' in href:
-                            doi_start = href.find('/10.')
-                            if doi_start != -1:
-                                request_data['doi'] = href[doi_start + 1:]  # Remove leading slash
+                        request_data['doi'] = doi_from_href(href)
                         
                         # Get title
                         try:
@@ -4338,10 +5388,6 @@ def select_requests_to_cancel(waiting_requests, no_confirm=False):
         print(f"Auto-selecting all {len(cancellable_requests)} cancellable request(s) (--noconfirm specified)")
         return cancellable_requests.copy()
     
-    def timeout_handler(signum, frame):
-        print("\nTimeout: No input received within 30 seconds. Quitting.")
-        exit(1)
-    
     while True:
         try:
             print("\nOptions:")
@@ -4350,52 +5396,21 @@ def select_requests_to_cancel(waiting_requests, no_confirm=False):
             print("- Enter 'all' or 'a' to cancel all requests")
             print("- Enter 'none' or 'n' to cancel no requests")
             
-            # Set up timeout signal (only on Unix-like systems)
-            if hasattr(signal, 'SIGALRM'):
-                signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(30)  # 30 second timeout
-            
-            user_input = input("\nWhich waiting requests would you like to cancel? ").strip().lower()
-            
-            # Cancel the alarm (only on Unix-like systems)
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)
+            user_input = _input_with_timeout("\nWhich waiting requests would you like to cancel? ").strip().lower()
             
             if user_input in ['none', 'n', '']:
                 print("No requests selected for cancellation.")
                 return []
             
-            selected_indices = []
-            
             if user_input in ['all', 'a']:
                 selected_indices = list(range(len(cancellable_requests)))
             else:
-                # Parse input (comma-separated numbers and ranges)
-                parts = user_input.replace(' ', '').split(',')
-                for part in parts:
-                    try:
-                        if '-' in part:
-                            # Handle range (e.g., "1-5")
-                            start, end = map(int, part.split('-'))
-                            for idx in range(start, end + 1):
-                                if 1 <= idx <= len(cancellable_requests):
-                                    selected_indices.append(idx - 1)  # Convert to 0-based
-                        else:
-                            # Handle single number
-                            index = int(part)
-                            if 1 <= index <= len(cancellable_requests):
-                                selected_indices.append(index - 1)  # Convert to 0-based
-                            else:
-                                print(f"Warning: Index {index} is out of range (1-{len(cancellable_requests)})")
-                    except ValueError:
-                        print(f"Warning: '{part}' is not a valid number or range")
+                selected_indices = _parse_range_selection(user_input, len(cancellable_requests))
             
             if not selected_indices:
                 print("No valid selections made. Please try again.")
                 continue
             
-            # Remove duplicates and sort
-            selected_indices = sorted(list(set(selected_indices)))
             selected_requests = [cancellable_requests[i] for i in selected_indices]
             
             print(f"\nSelected {len(selected_requests)} request(s) for cancellation:")
@@ -4404,16 +5419,7 @@ def select_requests_to_cancel(waiting_requests, no_confirm=False):
                 if request.get('doi'):
                     print(f"     DOI: {request['doi']}")
             
-            # Set up timeout for confirmation (only on Unix-like systems)
-            if hasattr(signal, 'SIGALRM'):
-                signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(30)  # 30 second timeout
-            
-            confirm = input(f"\nProceed with cancelling these {len(selected_requests)} requests? (y/n): ").strip().lower()
-            
-            # Cancel the alarm (only on Unix-like systems)
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)
+            confirm = _input_with_timeout(f"\nProceed with cancelling these {len(selected_requests)} requests? (y/n): ").strip().lower()
             
             if confirm in ['y', 'yes']:
                 return selected_requests
@@ -4421,20 +5427,15 @@ def select_requests_to_cancel(waiting_requests, no_confirm=False):
                 print("Selection cancelled. Please choose again.")
                 continue
                 
-        except KeyboardInterrupt:
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)  # Cancel alarm
+        except TimeoutError:
+            print(f"\nTimeout: No input received within {SELECTION_INPUT_TIMEOUT} seconds.")
+            return []
+        except (KeyboardInterrupt, EOFError):
             print("\n\nOperation cancelled by user.")
             return []
         except Exception as e:
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)  # Cancel alarm
             print(f"Error in selection: {str(e)}. Please try again.")
             continue
-        finally:
-            # Make sure alarm is always cancelled (only on Unix-like systems)
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)
 
 def cancel_waiting_request_by_doi(driver, doi):
     """
@@ -4610,7 +5611,7 @@ def login_and_cancel_waiting_request_by_doi(username, password, doi, headless=Fa
         return result
     finally:
         print("Cancel waiting request by DOI process completed, closing browser.")
-        driver.quit()
+        quit_driver_in_background(driver)
 
 def cancel_waiting_request(driver, request_data):
     """
@@ -4799,7 +5800,7 @@ def login_and_cancel_waiting_requests(username, password, headless=False, limit=
         return result
     finally:
         print("Cancel waiting requests process completed, closing browser.")
-        driver.quit()
+        quit_driver_in_background(driver)
 
 def setup_argument_autocomplete(parser):
     """
@@ -4961,10 +5962,7 @@ def get_unsolved_requests(driver, limit=None):
                         
                         # Extract DOI from href (format: /10.xxxx/xxxxx)
                         href = link.get_attribute("href")
-                        if href and '/10.' in href:
-                            doi_start = href.find('/10.')
-                            if doi_start != -1:
-                                request_data['doi'] = href[doi_start + 1:]  # Remove leading slash
+                        request_data['doi'] = doi_from_href(href)
                         
                         # Get title
                         try:
@@ -5159,7 +6157,7 @@ def login_and_get_unsolved_requests(username, password, headless=False, limit=No
         return requests
     finally:
         print("Unsolved requests retrieval completed, closing browser.")
-        driver.quit()
+        quit_driver_in_background(driver)
 
 def cancel_unsolved_request_by_doi(driver, doi):
     """
@@ -5301,7 +6299,7 @@ def login_and_cancel_unsolved_request_by_doi(username, password, doi, headless=F
         return result
     finally:
         print("Cancel unsolved request by DOI process completed, closing browser.")
-        driver.quit()
+        quit_driver_in_background(driver)
 
 def cancel_unsolved_request(driver, request_data):
     """
@@ -5371,10 +6369,6 @@ def select_unsolved_requests_to_cancel(unsolved_requests, no_confirm=False):
         print(f"Auto-selecting all {len(unsolved_requests)} unsolved request(s) (--noconfirm specified)")
         return unsolved_requests.copy()
     
-    def timeout_handler(signum, frame):
-        print("\nTimeout: No input received within 30 seconds. Quitting.")
-        exit(1)
-    
     while True:
         try:
             print("\nOptions:")
@@ -5383,52 +6377,21 @@ def select_unsolved_requests_to_cancel(unsolved_requests, no_confirm=False):
             print("- Enter 'all' or 'a' to cancel all requests")
             print("- Enter 'none' or 'n' to cancel no requests")
             
-            # Set up timeout signal (only on Unix-like systems)
-            if hasattr(signal, 'SIGALRM'):
-                signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(30)  # 30 second timeout
-            
-            user_input = input("\nWhich unsolved requests would you like to cancel? ").strip().lower()
-            
-            # Cancel the alarm (only on Unix-like systems)
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)
+            user_input = _input_with_timeout("\nWhich unsolved requests would you like to cancel? ").strip().lower()
             
             if user_input in ['none', 'n', '']:
                 print("No requests selected for cancellation.")
                 return []
             
-            selected_indices = []
-            
             if user_input in ['all', 'a']:
                 selected_indices = list(range(len(unsolved_requests)))
             else:
-                # Parse input (comma-separated numbers and ranges)
-                parts = user_input.replace(' ', '').split(',')
-                for part in parts:
-                    try:
-                        if '-' in part:
-                            # Handle range (e.g., "1-5")
-                            start, end = map(int, part.split('-'))
-                            for idx in range(start, end + 1):
-                                if 1 <= idx <= len(unsolved_requests):
-                                    selected_indices.append(idx - 1)  # Convert to 0-based
-                        else:
-                            # Handle single number
-                            index = int(part)
-                            if 1 <= index <= len(unsolved_requests):
-                                selected_indices.append(index - 1)  # Convert to 0-based
-                            else:
-                                print(f"Warning: Index {index} is out of range (1-{len(unsolved_requests)})")
-                    except ValueError:
-                        print(f"Warning: '{part}' is not a valid number or range")
+                selected_indices = _parse_range_selection(user_input, len(unsolved_requests))
             
             if not selected_indices:
                 print("No valid selections made. Please try again.")
                 continue
             
-            # Remove duplicates and sort
-            selected_indices = sorted(list(set(selected_indices)))
             selected_requests = [unsolved_requests[i] for i in selected_indices]
             
             print(f"\nSelected {len(selected_requests)} request(s) for cancellation:")
@@ -5437,16 +6400,7 @@ def select_unsolved_requests_to_cancel(unsolved_requests, no_confirm=False):
                 if request.get('doi'):
                     print(f"     DOI: {request['doi']}")
             
-            # Set up timeout for confirmation (only on Unix-like systems)
-            if hasattr(signal, 'SIGALRM'):
-                signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(30)  # 30 second timeout
-            
-            confirm = input(f"\nProceed with cancelling these {len(selected_requests)} unsolved requests? (y/n): ").strip().lower()
-            
-            # Cancel the alarm (only on Unix-like systems)
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)
+            confirm = _input_with_timeout(f"\nProceed with cancelling these {len(selected_requests)} unsolved requests? (y/n): ").strip().lower()
             
             if confirm in ['y', 'yes']:
                 return selected_requests
@@ -5454,20 +6408,15 @@ def select_unsolved_requests_to_cancel(unsolved_requests, no_confirm=False):
                 print("Selection cancelled. Please choose again.")
                 continue
                 
-        except KeyboardInterrupt:
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)  # Cancel alarm
+        except TimeoutError:
+            print(f"\nTimeout: No input received within {SELECTION_INPUT_TIMEOUT} seconds.")
+            return []
+        except (KeyboardInterrupt, EOFError):
             print("\n\nOperation cancelled by user.")
             return []
         except Exception as e:
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)  # Cancel alarm
             print(f"Error in selection: {str(e)}. Please try again.")
             continue
-        finally:
-            # Make sure alarm is always cancelled (only on Unix-like systems)
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)
 
 def cancel_unsolved_requests(driver, limit=None, no_confirm=False):
     """
@@ -5602,61 +6551,37 @@ def login_and_cancel_unsolved_requests(username, password, headless=False, limit
         return result
     finally:
         print("Cancel unsolved requests process completed, closing browser.")
-        driver.quit()
+        quit_driver_in_background(driver)
 
 def get_username_with_timeout():
         """Get username from user with timeout"""
         def timeout_handler(signum, frame):
             print("\nTimeout: No username entered within 30 seconds. Exiting.")
             exit(1)
-        if hasattr(signal, 'SIGALRM'):
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(30)
         try:
-            username = input("Username: ").strip()
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)
-            return username
+            with _input_timeout(30, timeout_handler):
+                return input("Username: ").strip()
         except KeyboardInterrupt:
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)
             print("\nOperation cancelled by user.")
             exit(1)
         except Exception as e:
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)
             print(f"Error getting username: {str(e)}")
             exit(1)
-        finally:
-            if hasattr(signal, 'alarm'):
-                signal.alarm(0)
 
 def get_password_with_timeout():
     """Get password from user with timeout"""
     def timeout_handler(signum, frame):
         print("\nTimeout: No password entered within 30 seconds. Exiting.")
         exit(1)
-    if hasattr(signal, 'SIGALRM'):
-        signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(30)
     try:
-        password = getpass.getpass("Password: ")
-        if hasattr(signal, 'alarm'):
-            signal.alarm(0)
-        return password
+        with _input_timeout(30, timeout_handler):
+            return getpass.getpass("Password: ")
     except KeyboardInterrupt:
-        if hasattr(signal, 'alarm'):
-            signal.alarm(0)
         print("\nOperation cancelled by user.")
         exit(1)
     except Exception as e:
-        if hasattr(signal, 'alarm'):
-            signal.alarm(0)
         print(f"Error getting password: {str(e)}")
         exit(1)
-    finally:
-        if hasattr(signal, 'alarm'):
-            signal.alarm(0)
 
 def handle_credentials(args, parser):
     """Handle credential loading and validation"""
@@ -5666,8 +6591,7 @@ def handle_credentials(args, parser):
     cache_data = None
     if os.path.exists(CACHE_FILE):
         try:
-            with open(CACHE_FILE, 'rb') as f:
-                cache_data = pickle.load(f)
+            cache_data = read_login_cache_file()
             if isinstance(cache_data, dict) and 'username' in cache_data:
                 USERNAME = cache_data['username']
                 print(f"Using cached username: {USERNAME}")
@@ -5713,12 +6637,11 @@ def get_password_for_username(username):
         cache_data = None
         try:
             if os.path.exists(CACHE_FILE):
-                with open(CACHE_FILE, 'rb') as f:
-                    cache_data = pickle.load(f)
+                cache_data = read_login_cache_file()
                 # cache_data should be a dict with 'timestamp' and possibly 'cookies'
                 if isinstance(cache_data, dict) and 'timestamp' in cache_data:
                     cache_age = datetime.now() - cache_data['timestamp']
-                    if cache_age <= timedelta(hours=CACHE_DURATION_HOURS):
+                    if cache_age <= _CACHE_TTL:
                         print(f"Using cached login for {username}")
                         return "cached"
         except Exception:
@@ -5760,7 +6683,7 @@ def handle_pdf_upload(args, headless_mode):
         login_and_upload_pdf(USERNAME, PASSWORD, pdf_files[0], headless=headless_mode)
     else:
         print(f"Uploading {len(pdf_files)} PDF files...")
-        login_and_upload_multiple_pdfs(USERNAME, PASSWORD, pdf_files, headless=headless_mode)
+        login_and_upload_multiple_pdfs(USERNAME, PASSWORD, pdf_files, headless=headless_mode, workers=args.workers)
 
 def handle_doi_requests(args, headless_mode):
     """Handle DOI request functionality"""
@@ -5808,7 +6731,7 @@ def handle_doi_requests(args, headless_mode):
         exit(1)
     
     print(f"Requesting {len(doi_reward_pairs)} DOI{'s' if len(doi_reward_pairs) > 1 else ''}...")
-    result = login_and_request_multiple_dois_with_rewards(USERNAME, PASSWORD, doi_reward_pairs, args.wait_seconds, headless=headless_mode)
+    result = login_and_request_multiple_dois_with_rewards(USERNAME, PASSWORD, doi_reward_pairs, args.wait_seconds, headless=headless_mode, workers=args.workers)
     if result:
         print(f"\nDOI Request Result:")
         print(f"Successful requests: {result.get('successful_requests', 0)}")
@@ -5818,33 +6741,36 @@ def handle_doi_requests(args, headless_mode):
 
 def handle_fulfilled_doi_action(args, headless_mode, action_type):
     """Handle fulfilled DOI actions (accept/reject)"""
-    doi = args.accept_fulfilled_doi if action_type == 'accept' else args.reject_fulfilled_doi
+    dois = args.accept_fulfilled_doi if action_type == 'accept' else args.reject_fulfilled_doi
     
-    if not is_valid_doi(doi):
-        print(f"Error: Invalid DOI format: '{doi}'")
-        print("DOI format should be like: 10.1000/182 or https://doi.org/10.1000/182")
-        exit(1)
+    for doi in dois:
+        if not is_valid_doi(doi):
+            print(f"Error: Invalid DOI format: '{doi}'")
+            print("DOI format should be like: 10.1000/182 or https://doi.org/10.1000/182")
+            exit(1)
     
+    # All DOIs share one login; --workers > 1 spreads them over a pool of browsers
     if action_type == 'accept':
-        result = login_and_accept_fulfilled_request_by_doi(USERNAME, PASSWORD, doi, headless=headless_mode)
+        results = accept_fulfilled_requests_by_dois(USERNAME, PASSWORD, dois, headless=headless_mode, workers=args.workers)
         action_verb = "accept"
         past_tense = "accepted"
     else:
         reject_message = args.reject_message or "Paper quality does not meet requirements"
-        result = login_and_reject_fulfilled_request_by_doi(USERNAME, PASSWORD, doi, reject_message, headless=headless_mode)
+        results = reject_fulfilled_requests_by_dois(USERNAME, PASSWORD, dois, reject_message, headless=headless_mode, workers=args.workers)
         action_verb = "reject"
         past_tense = "rejected"
     
-    if result:
+    if results:
         print(f"\n{action_verb.title()} fulfilled request by DOI completed")
-        if result.get('success'):
-            print(f"✓ Successfully {past_tense} fulfilled request for DOI: {doi}")
-            if action_type == 'reject':
-                print(f"  Rejection message: '{reject_message}'")
-        else:
-            print(f"✗ Failed to {action_verb} fulfilled request for DOI: {doi}")
-            if result.get('error'):
-                print(f"  Error: {result['error']}")
+        for doi, result in zip(dois, results):
+            if result.get('success'):
+                print(f"✓ Successfully {past_tense} fulfilled request for DOI: {doi}")
+                if action_type == 'reject':
+                    print(f"  Rejection message: '{reject_message}'")
+            else:
+                print(f"✗ Failed to {action_verb} fulfilled request for DOI: {doi}")
+                if result.get('error'):
+                    print(f"  Error: {result['error']}")
     else:
         print(f"\nFailed to {action_verb} fulfilled request by DOI")
 
@@ -5937,10 +6863,7 @@ def get_uploaded_files(driver, limit=None):
                         
                         # Extract DOI from href (format: /10.xxxx/xxxxx)
                         href = link.get_attribute("href")
-                        if href and '/10.' in href:
-                            doi_start = href.find('/10.')
-                            if doi_start != -1:
-                                file_data['doi'] = href[doi_start + 1:]  # Remove leading slash
+                        file_data['doi'] = doi_from_href(href)
                         
                         # Get title
                         try:
@@ -6117,7 +7040,7 @@ def login_and_get_uploaded_files(username, password, headless=False, limit=None)
         return files
     finally:
         print("Uploaded files retrieval completed, closing browser.")
-        driver.quit()
+        quit_driver_in_background(driver)
 
 def get_user_info_logged_in(username, password, headless=False):
     """
@@ -6138,7 +7061,7 @@ def get_user_info_logged_in(username, password, headless=False):
         user_info = get_user_info(driver, username)
         return user_info
     finally:
-        driver.quit()
+        quit_driver_in_background(driver)
 
 def fetch_papers_category(driver, category, max_items=100):
     """
@@ -6170,10 +7093,7 @@ def fetch_papers_category(driver, category, max_items=100):
                     pass
                 doi = ""
                 href = link.get_attribute("href")
-                if href and '/10.' in href:
-                    doi_start = href.find('/10.')
-                    if doi_start != -1:
-                        doi = href[doi_start + 1:]
+                doi = doi_from_href(href)
                 year = ""
                 try:
                     year = article_div.find_element(By.CSS_SELECTOR, "div.year").text.strip()
@@ -6465,20 +7385,20 @@ def execute_action(args, headless_mode):
         requests = login_and_get_active_requests(USERNAME, PASSWORD, headless=headless_mode, limit=args.get_active_requests if args.get_active_requests > 0 else None)
         print(f"\nFound {len(requests)} active requests" if requests else "\nNo active requests found or failed to retrieve requests")
     elif args.get_fulfilled_requests:
-        result = login_and_check_fulfilled_requests(USERNAME, PASSWORD, headless=headless_mode)
+        result = login_and_check_fulfilled_requests(USERNAME, PASSWORD, headless=headless_mode, workers=args.workers)
         print(f"\nFulfilled requests check completed" if result else "\nFailed to check fulfilled requests")
     elif args.get_uploaded_files is not None:
         files = login_and_get_uploaded_files(USERNAME, PASSWORD, headless=headless_mode, limit=args.get_uploaded_files if args.get_uploaded_files > 0 else None)
         print(f"\nFound {len(files)} uploaded files" if files else "\nNo uploaded files found or failed to retrieve files")
     elif args.accept_fulfilled_requests:
-        result = login_and_accept_fulfilled_requests(USERNAME, PASSWORD, headless=headless_mode, no_confirm=args.noconfirm)
+        result = login_and_accept_fulfilled_requests(USERNAME, PASSWORD, headless=headless_mode, no_confirm=args.noconfirm, workers=args.workers)
         if result:
             print(f"\nAccept fulfilled requests completed")
             print(f"Accepted: {result.get('accepted_requests', 0)}, Failed: {result.get('failed_requests', 0)}")
         else:
             print("\nFailed to accept fulfilled requests")
     elif args.reject_fulfilled_requests:
-        result = login_and_reject_fulfilled_requests(USERNAME, PASSWORD, headless=headless_mode, reject_message=args.reject_message, no_confirm=args.noconfirm)
+        result = login_and_reject_fulfilled_requests(USERNAME, PASSWORD, headless=headless_mode, reject_message=args.reject_message, no_confirm=args.noconfirm, workers=args.workers)
         if result:
             print(f"\nReject fulfilled requests completed")
             print(f"Rejected: {result.get('rejected_requests', 0)}, Failed: {result.get('failed_requests', 0)}")
@@ -6582,6 +7502,9 @@ def validate_arguments(args, parser):
 
     if bool(args.solve_doi) != bool(args.solve_pdf):
         parser.error("--solve-doi and --solve-pdf must be used together")
+
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
     
     valid_options = [
         bool(args.pdf), 
@@ -6672,8 +7595,8 @@ def main():
         parser.add_argument('--request-doi', nargs='+', help='DOI(s) to request: single DOI with optional reward tokens (DOI,tokens), multiple DOIs with optional reward tokens separated by spaces, or path to text file containing DOIs and optional reward tokens (one per line, format: DOI or DOI,tokens). Default reward tokens: 1')
         parser.add_argument('--solve-pdf', help='Path to PDF file to upload as solution (must be used with --solve-doi)')
     
-    parser.add_argument('-a', '--accept-fulfilled-doi', help='DOI of a specific fulfilled request to accept')
-    parser.add_argument('-j', '--reject-fulfilled-doi', help='DOI of a specific fulfilled request to reject')
+    parser.add_argument('-a', '--accept-fulfilled-doi', nargs='+', help='DOI(s) of specific fulfilled requests to accept (multiple DOIs separated by spaces share one login)')
+    parser.add_argument('-j', '--reject-fulfilled-doi', nargs='+', help='DOI(s) of specific fulfilled requests to reject (multiple DOIs separated by spaces share one login)')
     parser.add_argument('-g', '--get-active-requests', type=int, nargs='?', const=-1, metavar='LIMIT', help='Get list of active requests which you and others made but have not been fulfilled (optional: limit number of results)')
     parser.add_argument('-F', '--get-fulfilled-requests', action='store_true', help='Get list of fulfilled requests which others solved for you')
     parser.add_argument('-U', '--get-uploaded-files', type=int, nargs='?', const=-1, metavar='LIMIT', help='Get list of uploaded files which you have uploaded (optional: limit number of results)')
@@ -6687,6 +7610,7 @@ def main():
     parser.add_argument('-S', '--solve-doi', help='DOI of a specific request to solve (must be used with --solve-pdf)')
     parser.add_argument('-m', '--reject-message', help='Custom rejection message (for reject-fulfilled-requests)')
     parser.add_argument('-t', '--wait-seconds', type=int, default=50, help='Seconds to wait for DOI search results (default: 50)')
+    parser.add_argument('--workers', type=int, default=1, help=f'Number of browsers to use concurrently when uploading multiple PDFs, requesting multiple DOIs or handling fulfilled requests (default: 1, max: {MAX_BROWSER_POOL_SIZE})')
     parser.add_argument('-C', '--clear-cache', action='store_true', help='Clear login cache before running')
     parser.add_argument('-v', '--verbose', action='store_true', help='Enable verbose debug output')
     parser.add_argument('-H', '--no-headless', action='store_true', help='Disable headless mode and show browser window')
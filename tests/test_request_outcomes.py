@@ -0,0 +1,100 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from getscipapers_hoanganhduc import request
+
+
+class OutcomeTests(unittest.TestCase):
+    def test_as_dict_of_failure_is_error_payload(self):
+        outcome = request.Outcome("10.1/a", "nexus", False, "boom")
+
+        self.assertEqual(outcome.as_dict(), {"error": "boom"})
+
+    def test_as_dict_of_success_without_detail(self):
+        outcome = request.Outcome("10.1/a", "ablesci", True)
+
+        self.assertEqual(outcome.as_dict(), {"success": True})
+
+    def test_as_dict_of_success_returns_payload(self):
+        payload = {"status": "posted"}
+        outcome = request.Outcome("10.1/a", "nexus", True, payload)
+
+        self.assertEqual(outcome.as_dict(), payload)
+
+
+class OutcomeBuilderTests(unittest.TestCase):
+    def test_outcomes_from_mapping(self):
+        response = {
+            "10.1/a": {"status": "posted"},
+            "10.1/b": {"error": "rejected"},
+        }
+
+        outcomes = request._outcomes_from_mapping(["10.1/a", "10.1/b", "10.1/c"], "wosonhj", response)
+
+        self.assertEqual(
+            outcomes,
+            [
+                request.Outcome("10.1/a", "wosonhj", True, {"status": "posted"}),
+                request.Outcome("10.1/b", "wosonhj", False, "rejected"),
+                request.Outcome("10.1/c", "wosonhj", False, request.NOT_FOUND_ERROR),
+            ],
+        )
+
+    def test_outcomes_from_items_follows_requested_order(self):
+        response_list = [
+            {"doi": "10.1/b", "success": False},
+            {"doi": "10.1/a", "success": True},
+        ]
+
+        outcomes = request._outcomes_from_items(["10.1/a", "10.1/b", "10.1/c"], "facebook", response_list)
+
+        self.assertEqual(
+            outcomes,
+            [
+                request.Outcome("10.1/a", "facebook", True),
+                request.Outcome("10.1/b", "facebook", False, "Unknown error"),
+                request.Outcome("10.1/c", "facebook", False, request.NOT_FOUND_ERROR),
+            ],
+        )
+
+
+class OutcomesToResultsTests(unittest.TestCase):
+    def setUp(self):
+        self.outcomes = [
+            request.Outcome("10.1/a", "nexus", True, {"status": "posted"}),
+            request.Outcome("10.1/a", "scinet", False, "boom"),
+        ]
+
+    def test_single_service_is_keyed_by_doi(self):
+        results = request.outcomes_to_results(self.outcomes[:1], multi_service=False)
+
+        self.assertEqual(results, {"10.1/a": {"status": "posted"}})
+
+    def test_multi_service_is_keyed_by_doi_then_service(self):
+        results = request.outcomes_to_results(self.outcomes, multi_service=True)
+
+        self.assertEqual(
+            results,
+            {"10.1/a": {"nexus": {"status": "posted"}, "scinet": {"error": "boom"}}},
+        )
+
+
+class PrintResultTests(unittest.TestCase):
+    def test_print_result_with_icons_keeps_doi_data_signature(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            request.print_result_with_icons("10.1/a", {"error": "boom"})
+
+        self.assertEqual(output.getvalue(), "❌ DOI: 10.1/a\n   Error: boom\n\n")
+
+    def test_print_outcome_with_icons_names_the_service(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            request.print_outcome_with_icons(request.Outcome("10.1/a", "nexus", True))
+
+        self.assertEqual(output.getvalue(), "✅ DOI: 10.1/a [nexus]\n   Result: {'success': True}\n\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+from getscipapers_hoanganhduc import scinet
+
+
+class ToCdpCookiesTests(unittest.TestCase):
+    def test_full_cookie_is_converted(self):
+        cookie = {
+            "name": "sid",
+            "value": "abc",
+            "domain": "sci-net.xyz",
+            "path": "/account",
+            "secure": True,
+            "httpOnly": True,
+            "sameSite": "Lax",
+            "expiry": 1700000000,
+        }
+
+        self.assertEqual(
+            scinet._to_cdp_cookies([cookie]),
+            [
+                {
+                    "name": "sid",
+                    "value": "abc",
+                    "domain": "sci-net.xyz",
+                    "path": "/account",
+                    "secure": True,
+                    "httpOnly": True,
+                    "sameSite": "Lax",
+                    "expires": 1700000000,
+                }
+            ],
+        )
+
+    def test_missing_fields_get_defaults_and_are_not_invented(self):
+        converted = scinet._to_cdp_cookies([{"name": "sid", "value": "abc"}])
+
+        self.assertEqual(
+            converted,
+            [{"name": "sid", "value": "abc", "domain": ".sci-net.xyz", "path": "/"}],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
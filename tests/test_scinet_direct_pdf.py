@@ -0,0 +1,57 @@
+import io
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from getscipapers_hoanganhduc import scinet
+
+
+def fake_response(status_code=200, body=b"", headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.raw = io.BytesIO(body)
+    return response
+
+
+class DirectPdfUrlTests(unittest.TestCase):
+    def test_doi_is_quoted_in_the_url_path(self):
+        with patch.object(scinet._SESSION, "head", return_value=fake_response()) as head:
+            url = scinet._direct_pdf_url("10.1002/(SICI)1097#4;2 <x>?", "agent", {}, "ref")
+
+        self.assertEqual(
+            url,
+            f"{scinet.PDF_BASE_URL}/10.1002/%28SICI%291097%234%3B2%20%3Cx%3E%3F.pdf",
+        )
+        self.assertEqual(head.call_args[0][0], url)
+
+    def test_error_status_gives_no_url(self):
+        with patch.object(scinet._SESSION, "head", return_value=fake_response(404)):
+            self.assertIsNone(scinet._direct_pdf_url("10.1000/a", "agent", {}, "ref"))
+
+
+class DownloadPdfFileTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.filepath = os.path.join(directory.name, "paper.pdf")
+
+    def test_pdf_body_is_saved(self):
+        body = b"%PDF-1.7\nrest of the file"
+        with patch.object(scinet._SESSION, "get", return_value=fake_response(body=body)):
+            self.assertTrue(scinet._download_pdf_file("url", self.filepath, {}, {}))
+
+        with open(self.filepath, "rb") as f:
+            self.assertEqual(f.read(), body)
+
+    def test_html_error_page_is_not_saved(self):
+        body = b"<html><body>Not found</body></html>"
+        with patch.object(scinet._SESSION, "get", return_value=fake_response(body=body)):
+            self.assertFalse(scinet._download_pdf_file("url", self.filepath, {}, {}))
+
+        self.assertFalse(os.path.exists(self.filepath))
+
+
+if __name__ == "__main__":
+    unittest.main()
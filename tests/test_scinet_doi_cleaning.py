@@ -0,0 +1,32 @@
+import unittest
+
+from getscipapers_hoanganhduc import scinet
+
+
+class CleanDoiListTests(unittest.TestCase):
+    def test_strips_and_keeps_order(self):
+        dois = ["  10.1000/b ", "10.1000/a"]
+
+        self.assertEqual(scinet.clean_doi_list(dois), ["10.1000/b", "10.1000/a"])
+
+    def test_drops_blank_and_malformed_entries(self):
+        dois = ["", "   ", "not-a-doi", "10.12/too-short-prefix", "10.1000/ok"]
+
+        self.assertEqual(scinet.clean_doi_list(dois), ["10.1000/ok"])
+
+    def test_duplicates_are_case_insensitive_and_first_wins(self):
+        dois = ["10.1000/ABC", "10.1000/abc", " 10.1000/Abc"]
+
+        self.assertEqual(scinet.clean_doi_list(dois), ["10.1000/ABC"])
+
+    def test_accepts_doi_urls(self):
+        dois = ["https://doi.org/10.1000/xyz", "http://dx.doi.org/10.1000/uvw"]
+
+        self.assertEqual(scinet.clean_doi_list(dois), dois)
+
+    def test_accepts_any_iterable(self):
+        self.assertEqual(scinet.clean_doi_list(iter(["10.1000/a"])), ["10.1000/a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
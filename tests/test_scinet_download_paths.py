@@ -0,0 +1,34 @@
+import os
+import unittest
+
+from getscipapers_hoanganhduc import scinet
+
+
+class UniqueDownloadPathTests(unittest.TestCase):
+    def test_same_title_gets_numbered_suffixes(self):
+        used_paths = set()
+        target = os.path.join("downloads", "Same Title.pdf")
+
+        paths = [scinet._unique_download_path(target, used_paths) for _ in range(3)]
+
+        self.assertEqual(
+            paths,
+            [
+                target,
+                os.path.join("downloads", "Same Title (2).pdf"),
+                os.path.join("downloads", "Same Title (3).pdf"),
+            ],
+        )
+
+    def test_different_titles_keep_their_names(self):
+        used_paths = set()
+
+        first = scinet._unique_download_path(os.path.join("downloads", "A.pdf"), used_paths)
+        second = scinet._unique_download_path(os.path.join("downloads", "B.pdf"), used_paths)
+
+        self.assertEqual(first, os.path.join("downloads", "A.pdf"))
+        self.assertEqual(second, os.path.join("downloads", "B.pdf"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+from unittest.mock import patch
+
+from getscipapers_hoanganhduc import scinet
+
+
+class RequestMultiplePapersTests(unittest.TestCase):
+    def test_headless_reaches_the_browser_pool(self):
+        with patch.object(scinet, "_run_doi_requests", return_value=[{}, {}]) as run:
+            scinet.request_multiple_papers_by_dois(
+                "driver", ["10.1000/a", "10.1000/b"], workers=2, headless=False, print_summary=False
+            )
+
+        self.assertEqual(
+            run.call_args[0],
+            ("driver", [("10.1000/a", 1), ("10.1000/b", 1)], 50, 2, False, scinet.DEFAULT_JOB_RATE),
+        )
+
+    def test_login_wrapper_forwards_headless(self):
+        with patch.object(scinet, "login_to_scinet", return_value="driver"), \
+                patch.object(scinet, "quit_driver_in_background"), \
+                patch.object(scinet, "request_multiple_papers_by_dois", return_value={}) as request:
+            scinet.login_and_request_multiple_dois("user", "secret", ["10.1000/a"], headless=False, workers=2)
+
+        self.assertEqual(request.call_args[0][5:7], (False, scinet.DEFAULT_JOB_RATE))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import os
+import tempfile
+import unittest
+
+from getscipapers_hoanganhduc import scinet
+
+
+class PathCompletionsTests(unittest.TestCase):
+    def setUp(self):
+        scinet._path_completions.cache_clear()
+        self.addCleanup(scinet._path_completions.cache_clear)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+        for name in ("paper.pdf", "paper2.pdf", ".hidden.pdf", "other.txt"):
+            open(os.path.join(self.root, name), "w").close()
+        os.mkdir(os.path.join(self.root, "papers"))
+
+    def test_prefix_matches_are_sorted_with_slash_on_directories(self):
+        completions = scinet._path_completions(self.root, "pap")
+
+        self.assertEqual(
+            completions,
+            (
+                os.path.join(self.root, "paper.pdf"),
+                os.path.join(self.root, "paper2.pdf"),
+                os.path.join(self.root, "papers") + "/",
+            ),
+        )
+
+    def test_hidden_entries_need_a_dot_prefix(self):
+        self.assertNotIn(os.path.join(self.root, ".hidden.pdf"), scinet._path_completions(self.root, ""))
+        self.assertEqual(
+            scinet._path_completions(self.root, ".h"),
+            (os.path.join(self.root, ".hidden.pdf"),),
+        )
+
+    def test_missing_directory_gives_no_completions(self):
+        self.assertEqual(scinet._path_completions(os.path.join(self.root, "missing"), ""), ())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from getscipapers_hoanganhduc import scinet
+
+
+def parse_quietly(parser, user_input, count):
+    output = io.StringIO()
+    with redirect_stdout(output):
+        indices = parser(user_input, count)
+    return indices, output.getvalue()
+
+
+class ParseSelectionTests(unittest.TestCase):
+    def test_returns_sorted_unique_zero_based_indices(self):
+        indices, output = parse_quietly(scinet._parse_selection, "3, 1,3 ,2", 5)
+
+        self.assertEqual(indices, [0, 1, 2])
+        self.assertEqual(output, "")
+
+    def test_invalid_and_out_of_range_entries_share_one_warning(self):
+        indices, output = parse_quietly(scinet._parse_selection, "0,2,x,6", 5)
+
+        self.assertEqual(indices, [1])
+        self.assertEqual(output.count("Warning"), 1)
+        self.assertIn("0, x, 6", output)
+
+    def test_ranges_are_not_accepted(self):
+        indices, output = parse_quietly(scinet._parse_selection, "1-3", 5)
+
+        self.assertEqual(indices, [])
+        self.assertIn("1-3", output)
+
+
+class ParseRangeSelectionTests(unittest.TestCase):
+    def test_numbers_and_ranges_are_merged(self):
+        indices, output = parse_quietly(scinet._parse_range_selection, "5, 1-3,2", 10)
+
+        self.assertEqual(indices, [0, 1, 2, 4])
+        self.assertEqual(output, "")
+
+    def test_ranges_are_clamped_to_the_list(self):
+        indices, _ = parse_quietly(scinet._parse_range_selection, "0-2,4-1000000000", 5)
+
+        self.assertEqual(indices, [0, 1, 3, 4])
+
+    def test_reversed_and_out_of_list_ranges_select_nothing(self):
+        indices, output = parse_quietly(scinet._parse_range_selection, "4-2,7-9", 5)
+
+        self.assertEqual(indices, [])
+        self.assertEqual(output, "")
+
+    def test_invalid_entries_are_reported(self):
+        indices, output = parse_quietly(scinet._parse_range_selection, "2,9,x,1-y", 5)
+
+        self.assertEqual(indices, [1])
+        self.assertIn("Index 9 is out of range (1-5)", output)
+        self.assertIn("'x' is not a valid number or range", output)
+        self.assertIn("'1-y' is not a valid number or range", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
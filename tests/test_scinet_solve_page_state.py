@@ -0,0 +1,31 @@
+import unittest
+
+from getscipapers_hoanganhduc import scinet
+
+
+def page_state(has_solution=False, upload_button=None):
+    return {
+        "url": "https://sci-net.xyz/10.1000/a",
+        "has_solution": has_solution,
+        "upload_button": upload_button,
+        "upload_onclick": "upload()" if upload_button else None,
+    }
+
+
+class SolvePageReadyTests(unittest.TestCase):
+    def test_not_ready_while_page_has_neither(self):
+        self.assertFalse(scinet._solve_page_ready(page_state()))
+
+    def test_ready_once_upload_button_rendered(self):
+        state = page_state(upload_button=object())
+
+        self.assertIs(scinet._solve_page_ready(state), state)
+
+    def test_ready_when_solution_already_posted(self):
+        state = page_state(has_solution=True)
+
+        self.assertIs(scinet._solve_page_ready(state), state)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import os
+import tempfile
+import unittest
+
+from getscipapers_hoanganhduc import scinet
+
+
+class ReadTextLinesTests(unittest.TestCase):
+    def write_file(self, data):
+        handle = tempfile.NamedTemporaryFile(delete=False)
+        handle.write(data)
+        handle.close()
+        self.addCleanup(os.remove, handle.name)
+        return handle.name
+
+    def test_splits_lines_without_endings(self):
+        path = self.write_file(b"10.1000/a\r\n10.1000/b,2\n\n10.1000/c")
+
+        self.assertEqual(scinet._read_text_lines(path), ["10.1000/a", "10.1000/b,2", "", "10.1000/c"])
+
+    def test_decodes_utf8(self):
+        path = self.write_file("10.1000/é\n".encode("utf-8"))
+
+        self.assertEqual(scinet._read_text_lines(path), ["10.1000/é"])
+
+    def test_keeps_form_feeds_inside_a_line(self):
+        path = self.write_file(b"10.1000/a\x0c\x1c\n10.1000/b\n")
+
+        self.assertEqual(scinet._read_text_lines(path), ["10.1000/a\x0c\x1c", "10.1000/b"])
+
+    def test_empty_file_has_no_lines(self):
+        path = self.write_file(b"")
+
+        self.assertEqual(scinet._read_text_lines(path), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
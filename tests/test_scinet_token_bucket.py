@@ -0,0 +1,71 @@
+import unittest
+from unittest.mock import patch
+
+from getscipapers_hoanganhduc import scinet
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TokenBucketTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = patch.multiple(scinet.time, monotonic=self.clock.monotonic, sleep=self.clock.sleep)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_first_job_starts_immediately(self):
+        bucket = scinet.TokenBucket(rate=0.5)
+
+        bucket.acquire()
+
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_back_to_back_jobs_wait_one_interval(self):
+        bucket = scinet.TokenBucket(rate=0.5)
+
+        bucket.acquire()
+        bucket.acquire()
+
+        self.assertEqual(self.clock.sleeps, [2.0])
+
+    def test_time_spent_in_the_job_is_not_waited_again(self):
+        bucket = scinet.TokenBucket(rate=0.5)
+
+        bucket.acquire()
+        self.clock.now += 1.5
+        bucket.acquire()
+
+        self.assertEqual(len(self.clock.sleeps), 1)
+        self.assertAlmostEqual(self.clock.sleeps[0], 0.5)
+
+    def test_slow_job_is_followed_immediately(self):
+        bucket = scinet.TokenBucket(rate=0.5)
+
+        bucket.acquire()
+        self.clock.now += 10
+        bucket.acquire()
+
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_zero_rate_never_waits(self):
+        bucket = scinet.TokenBucket(rate=0)
+
+        for _ in range(3):
+            bucket.acquire()
+
+        self.assertEqual(self.clock.sleeps, [])
+
+
+if __name__ == "__main__":
+    unittest.main()